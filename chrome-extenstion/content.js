@@ -67,6 +67,12 @@ function getVideoContext() {
     return { title, description, hashtags };
 }
 
+/** 영상 id (watch?v=..., /shorts/...), 서버의 영상 세션 키로 사용 */
+function getVideoId() {
+    const params = new URLSearchParams(location.search);
+    return params.get("v") || location.pathname.split("/shorts/")[1] || "";
+}
+
 async function batchExtract(videoCtx, comments) {
     try {
         console.log("📝 [batch_extract payload]:", {
@@ -77,7 +83,11 @@ async function batchExtract(videoCtx, comments) {
         const resp = await fetch(`${API_BASE}/batch_extract`, {
             method: "POST",
             headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({ videoContext: videoCtx, comments }),
+            body: JSON.stringify({
+                videoContext: videoCtx,
+                videoId: getVideoId(),
+                comments,
+            }),
         });
         if (!resp.ok) throw new Error(`status ${resp.status}`);
         return await resp.json();
@@ -90,21 +100,58 @@ async function batchExtract(videoCtx, comments) {
     }
 }
 
-/** 팩트체크 API */
-async function analyze(claim, keywords, summary) {
-    console.log("📝 [analyze payload]:", { claim, keywords, summary });
-    const resp = await fetch(`${API_BASE}/analyze`, {
+/** 비동기 팩트체크 작업 등록 후 주장별 결과를 받는 대로 onResult 호출 */
+async function analyzeStream(claims, summary, onResult) {
+    const resp = await fetch(`${API_BASE}/jobs`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({claim: claim, keyword: keywords, summary: summary  // 요약문만 전달
-        })
+        body: JSON.stringify({
+            claims: claims.map((c) => ({ claim: c.claim, keyword: c.keywords })),
+            summary: summary,
+            videoId: getVideoId(),
+        }),
     });
     if (!resp.ok) throw new Error(`status ${resp.status}`);
+    const job = await resp.json();
+    console.log("📝 [job submitted]:", job);
+
+    return new Promise((resolve) => {
+        const seen = new Set();
+        const source = new EventSource(`${API_BASE}${job.events_url}`);
+        source.addEventListener("result", (e) => {
+            const result = JSON.parse(e.data);
+            seen.add(result.index);
+            onResult(result);
+        });
+        source.addEventListener("done", () => {
+            source.close();
+            resolve();
+        });
+        // SSE 연결 실패 / 스트림 시간 초과(timeout) / 스트림 수 초과(503) 시 폴링으로 대체
+        const fallback = () => {
+            source.close();
+            pollJob(job.status_url, onResult, seen).then(resolve);
+        };
+        source.addEventListener("timeout", fallback);
+        source.onerror = fallback;
+    });
+}
 
-    const data = await resp.json();
-    console.log("📝 [analyze result]:", data);
-
-    return data;
+/** SSE를 쓸 수 없을 때 작업 상태 폴링 (seen: 이미 받은 결과의 index) */
+async function pollJob(statusUrl, onResult, seen = new Set()) {
+    while (true) {
+        const resp = await fetch(`${API_BASE}${statusUrl}`);
+        if (!resp.ok) return;
+        const job = await resp.json();
+        job.results
+            .filter((r) => !seen.has(r.index))
+            .forEach((r) => {
+                seen.add(r.index);
+                onResult(r);
+            });
+        if (job.status === "done") return;
+        await new Promise((r) => setTimeout(r, 1000));
+    }
 }
 
 /** 버튼 스타일 & 폰트 한번만 주입 */
@@ -272,15 +319,20 @@ function attachButton(node, videoCtx, claims) {
             console.error("캐시된 주장이 없습니다.");
             return;
         }
-        // videoCtx 대신 summary 전달
-        const analyses = await Promise.all(
-            cachedClaims.map(c =>
-                analyze(c.claim, c.keywords, { summary: cachedSummary })
-                    .then(data => ({ claim: c.claim, ...data }))
-                    .catch(() => ({ claim: c.claim, error: true }))
-            )
-        );
-        renderResults(node, analyses);
+        // videoCtx 대신 summary 전달, 끝난 주장부터 바로 표시
+        const analyses = [];
+        try {
+            await analyzeStream(cachedClaims, { summary: cachedSummary }, (res) => {
+                analyses[res.index] = res;
+                renderResults(node, analyses.filter(Boolean));
+            });
+        } catch (e) {
+            console.error("analyze 오류:", e);
+            renderResults(
+                node,
+                cachedClaims.map((c) => ({ claim: c.claim, error: true }))
+            );
+        }
         hideSpinner(header);
     });
     header.appendChild(btn);
@@ -410,6 +462,19 @@ async function flushQueue() {
     }
 }
 
+/** 다른 영상으로 이동하면 이전 영상의 근거 미리 가져오기 취소 */
+let currentVideoId = getVideoId();
+document.addEventListener("yt-navigate-finish", () => {
+    const videoId = getVideoId();
+    if (currentVideoId && videoId !== currentVideoId) {
+        fetch(`${API_BASE}/videos/${encodeURIComponent(currentVideoId)}/prefetch`, {
+            method: "DELETE",
+            keepalive: true,
+        }).catch(() => {});
+    }
+    currentVideoId = videoId;
+});
+
 /** 최초 실행 + MutationObserver */
 processNewComments();
 new MutationObserver(processNewComments).observe(document.body, {
@@ -1,19 +1,241 @@
 import os
+import time
+import threading
+from concurrent.futures import Future
 import pandas as pd
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
 
-from services.api import extract_keywords_batch_llm
+from services.api import extract_keywords_batch_llm, translation_cache
+from services.inference import (
+    embedding_cache_stats,
+    encode,
+    models_ready,
+    start_warm_up,
+    warm_up_error,
+)
+from services.models import registry
+from services.prefetch import Prefetcher
+from services.verdict_cache import VerdictCache
+from services.video_session import comment_hash, video_key, video_sessions
 from factcheck_engine import CommentFactCheck
+from services.jobs import JobManager, QueueFullError, StreamLimitError
+from tools.metrics import end_request, log, metrics, request_spans, start_request
 from dotenv import load_dotenv
 
-from threading import Thread
-
 load_dotenv()
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=["X-Request-ID"])
+
+http_requests = metrics.counter(
+    "http_requests_total", "HTTP requests", ["endpoint", "method", "status"]
+)
+http_request_seconds = metrics.histogram(
+    "http_request_seconds", "HTTP request latency", ["endpoint"]
+)
+http_in_flight = metrics.gauge("http_requests_in_flight", "HTTP requests in progress")
+
+# 같은 주장(정규화 + 키워드)의 최종 판정 캐시, 워커끼리 SQLite로 공유
+verdict_cache = VerdictCache(
+    os.getenv(
+        "VERDICT_CACHE_DB",
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "cache", "verdicts.sqlite3"
+        ),
+    ),
+    ttl=float(os.getenv("VERDICT_CACHE_TTL", str(6 * 3600))),
+    empty_ttl=float(os.getenv("VERDICT_CACHE_EMPTY_TTL", "600")),
+    max_memory_items=int(os.getenv("VERDICT_CACHE_MEMORY_ITEMS", "10000")),
+    max_disk_items=int(os.getenv("VERDICT_CACHE_DISK_ITEMS", "200000")),
+)
+metrics.gauge(
+    "verdict_cache_hit_ratio", "Final verdict cache hit ratio since start"
+).set_function(verdict_cache.hit_rate)
+
+
+@app.before_request
+def _start_request():
+    # post_fork / __main__을 거치지 않는 WSGI 서버에서도 첫 요청에서 워밍업 시작
+    start_warm_up()
+    g.request_start = time.perf_counter()
+    g.request_id = start_request(request.headers.get("X-Request-ID"))
+    http_in_flight.inc()
+
+
+@app.after_request
+def _finish_request(response):
+    # 요청마다 request id와 단계별 소요 시간을 담은 로그 한 줄
+    elapsed = time.perf_counter() - g.request_start
+    endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+    http_requests.inc(
+        endpoint=endpoint, method=request.method, status=response.status_code
+    )
+    http_request_seconds.observe(elapsed, endpoint=endpoint)
+
+    stages = {}
+    for span in request_spans():
+        stages[span.name] = stages.get(span.name, 0.0) + span.duration
+    log(
+        "app.py",
+        f"{request.method} {request.path} {response.status_code} {elapsed * 1000:.1f}ms",
+        *(f"{name}={sec * 1000:.1f}ms" for name, sec in stages.items()),
+    )
+    response.headers["X-Request-ID"] = g.request_id
+    return response
+
+
+@app.teardown_request
+def _teardown_request(exc):
+    if "request_start" in g:
+        http_in_flight.dec()
+    end_request()
+
+
+def _get_summary_text(data):
+    # content.js는 {"summary": "..."} 형태로 요약문을 전달
+    video_summary = data.get("summary", "")
+    if isinstance(video_summary, dict):
+        return video_summary.get("summary", "")
+    return video_summary
+
+
+def _get_session(data, video_ctx=None, create=True):
+    # content.js는 videoId를 함께 전달, 없으면 영상 정보 해시로 구분
+    return video_sessions.get(video_key(data.get("videoId"), video_ctx), create=create)
+
+
+def _explanation(claim, score):
+    return f"'{claim}'에 대한 팩트체크 결과입니다. 신뢰도가 {score * 100:.1f}%입니다."
+
+
+def _build_result(factchecker):
+    return _format_result(factchecker.claim.text, _verdict(factchecker))
+
+
+def _verdict(factchecker):
+    # 주장 문장과 무관한 판정 부분 (대표 주장의 판정을 같은 묶음의 주장에 그대로 사용)
+    related_articles = []
+    if factchecker.best_article:
+        related_articles.append(
+            {
+                "title": factchecker.best_article[0],
+                "link": factchecker.best_article[1],
+                "core_sentence": factchecker.best_sentence,
+            }
+        )
+    return {"fact_result": factchecker.score, "related_articles": related_articles}
+
+
+def _format_result(claim, verdict):
+    # 설명문은 요청한 주장으로
+    return {
+        "fact_result": verdict["fact_result"],
+        "explaination": _explanation(claim, verdict["fact_result"]),
+        "related_articles": verdict["related_articles"],
+    }
+
+
+def _cached_result(claim, item, bypass=False):
+    # item(같은 주장 또는 대표 주장)의 저장된 판정이 있으면 파이프라인 없이 응답
+    verdict = verdict_cache.get(item["claim"], item["keyword"], bypass)
+    if verdict is None:
+        return None
+    return _format_result(claim, verdict)
+
+
+def _remember_verdict(items, verdict):
+    # 같은 key는 한 번만 저장
+    keys = set()
+    for item in items:
+        key = verdict_cache.key(item["claim"], item["keyword"])
+        if key not in keys:
+            keys.add(key)
+            verdict_cache.put(item["claim"], item["keyword"], verdict)
+
+
+def _representatives(items, session):
+    """
+    비슷한 주장(CLAIM_DEDUP_THRESHOLD 이상)을 묶어 주장별 대표 주장을 반환합니다.
+    같은 영상의 세션이 있으면 이전 요청의 대표 주장과도 비교합니다.
+    """
+    embeddings = encode([item["claim"] for item in items])
+    return video_sessions.group_claims(session, items, embeddings)
+
+
+# 대표 주장 판정 key → 진행 중인 분석 (같은 주장을 동시에 여러 번 분석하지 않음)
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _prefetch_claim(item, proceed):
+    # 미리 가져오기 작업 (낮은 우선순위 스레드에서 실행)
+    factchecker = CommentFactCheck(
+        item["claim"], item["keyword"], item["video_ctx"], None, item["session"]
+    )
+    return CommentFactCheck.prefetch_batch([factchecker], proceed)
+
+
+# /batch_extract 직후 추출된 주장의 근거를 미리 준비 (PREFETCH=1일 때만)
+prefetcher = Prefetcher(
+    _prefetch_claim,
+    enabled=os.getenv("PREFETCH", "0") == "1",
+    max_workers=int(os.getenv("PREFETCH_WORKERS", "1")),
+    budget=int(os.getenv("PREFETCH_BUDGET", "20")),
+    max_queue=int(os.getenv("PREFETCH_MAX_QUEUE", "100")),
+    wait_timeout=float(os.getenv("PREFETCH_WAIT", "10")),
+)
+metrics.gauge(
+    "prefetch_queue_depth", "Claims waiting or running in the prefetch pool"
+).set_function(prefetcher.queue_depth)
+
+
+def _claim_prefetched(session, items):
+    # 분석할 주장의 미리 가져오기: 대기 중이면 취소(바로 분석), 실행 중이면 끝날 때까지 대기
+    if session is not None:
+        prefetcher.claim(
+            session.key,
+            [verdict_cache.key(item["claim"], item["keyword"]) for item in items],
+        )
+
+
+def _analyze_once(representative, video_ctx, video_summary, session):
+    """
+    대표 주장을 분석해 판정을 저장하고 반환합니다.
+    다른 요청이 같은 대표 주장을 분석 중이면 그 결과를 기다립니다.
+    """
+    key = verdict_cache.key(representative["claim"], representative["keyword"])
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        _claim_prefetched(session, [representative])
+        factchecker = CommentFactCheck(
+            representative["claim"],
+            representative["keyword"],
+            video_ctx,
+            video_summary,
+            session,
+        )
+        with prefetcher.foreground():
+            factchecker.analyze()
+        verdict = _verdict(factchecker)
+        _remember_verdict([representative], verdict)
+        future.set_result(verdict)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    factchecker.cache_result()
+    return verdict
 
 
 @app.route("/analyze", methods=["POST"])
@@ -26,38 +248,390 @@ def analyze():
         "description": data.get("description", ""),
         "hashtags": data.get("hashtags", []),
     }
-    video_summary = data.get("summary", "")
-    keywords = data["keyword"]
-    print(keywords)
-    factchecker = CommentFactCheck(claim, keywords, video_ctx, video_summary["summary"])
-
-    factchecker.analyze()
-    # fact_result, article_info = analyze_comment(comment)
-    explaination = f"'{claim}'에 대한 팩트체크 결과입니다. 신뢰도가 {factchecker.score * 100:.1f}%입니다."
-    related_articles = [
-        {
-            "title": factchecker.best_article[0],
-            "link": factchecker.best_article[1],
-            "core_sentence": factchecker.best_sentence,
-        },
+    video_summary = _get_summary_text(data)
+    item = {"claim": claim, "keyword": data["keyword"]}
+    # bypassCache면 저장된 판정을 쓰지 않고 다시 분석 (결과는 새로 저장)
+    bypass = bool(data.get("bypassCache"))
+    cached = _cached_result(claim, item, bypass)
+    if cached is not None:
+        return jsonify(cached)
+
+    # 같은 영상에서 이미 분석한 비슷한 주장이 있으면 그 판정을 사용
+    session = _get_session(data, video_ctx)
+    representative = _representatives([item], session)[0]
+    verdict = None
+    if representative != item and not bypass:
+        verdict = verdict_cache.get(representative["claim"], representative["keyword"])
+    if verdict is None:
+        verdict = _analyze_once(representative, video_ctx, video_summary, session)
+    if representative != item:
+        _remember_verdict([item], verdict)
+    return jsonify(_format_result(claim, verdict))
+
+
+@app.route("/analyze_batch", methods=["POST"])
+def analyze_batch():
+    """
+    한 영상의 여러 주장을 한 번에 분석합니다.
+    요청: {"claims": [{"claim": "...", "keyword": [...]}, ...], "summary": ...}
+    응답: {"results": [...], "dedup": {...}}
+        results는 claims와 같은 순서, 각 항목은 /analyze 응답과 동일
+        dedup은 이번 요청의 주장 수 / 실제 분석 수 / 같은 요청의 주장과 묶여 생략된 분석 수 /
+        저장된 판정으로 응답한 수와 영상 전체 누적값
+
+    비슷한 주장은 묶어서 대표 주장만 분석하고, 판정을 묶음의 모든 주장에 사용합니다.
+    """
+    data = request.get_json()
+
+    video_ctx = {
+        "title": data.get("title", ""),
+        "description": data.get("description", ""),
+        "hashtags": data.get("hashtags", []),
+    }
+    video_summary = _get_summary_text(data)
+    session = _get_session(data, video_ctx)
+    bypass = bool(data.get("bypassCache"))
+    items = [
+        {"claim": item["claim"], "keyword": item["keyword"]} for item in data["claims"]
     ]
+    results = [_cached_result(item["claim"], item, bypass) for item in items]
 
-    response = {
-        "fact_result": factchecker.score,
-        "explaination": explaination,
-        "related_articles": related_articles,
+    # 저장된 판정이 없는 주장만 묶어서 대표 주장별로 한 번씩 분석
+    pending = [i for i, result in enumerate(results) if result is None]
+    representatives = {}  # 판정 key → (대표 주장, 주장 위치들)
+    if pending:
+        for i, representative in zip(
+            pending, _representatives([items[i] for i in pending], session)
+        ):
+            if representative != items[i] and not bypass:
+                results[i] = _cached_result(items[i]["claim"], representative)
+                if results[i] is not None:
+                    continue
+            key = verdict_cache.key(representative["claim"], representative["keyword"])
+            representatives.setdefault(key, (representative, []))[1].append(i)
+
+    _claim_prefetched(session, [item for item, _ in representatives.values()])
+    factcheckers = [
+        CommentFactCheck(
+            representative["claim"],
+            representative["keyword"],
+            video_ctx,
+            video_summary,
+            session,
+        )
+        for representative, _ in representatives.values()
+    ]
+    if factcheckers:
+        with prefetcher.foreground():
+            CommentFactCheck.analyze_batch(factcheckers)
+    for factchecker, (representative, positions) in zip(
+        factcheckers, representatives.values()
+    ):
+        verdict = _verdict(factchecker)
+        _remember_verdict([representative, *(items[i] for i in positions)], verdict)
+        for i in positions:
+            results[i] = _format_result(items[i]["claim"], verdict)
+    for item, result in zip(items, results):
+        result["claim"] = item["claim"]
+
+    for factchecker in factcheckers:
+        factchecker.cache_result()
+    return jsonify(
+        {
+            "results": results,
+            "dedup": {
+                "claims": len(items),
+                "pipeline_runs": len(factcheckers),
+                "runs_saved": sum(
+                    len(positions) - 1 for _, positions in representatives.values()
+                ),
+                "cached": len(items)
+                - sum(len(positions) for _, positions in representatives.values()),
+                "video": video_sessions.dedup_stats(session),
+            },
+        }
+    )
+
+
+def _failed_claim(item):
+    # 분석에 실패한 주장은 근거 없음(-1)과 같은 형태에 error 표시
+    return {
+        "claim": item["claim"],
+        **_format_result(item["claim"], {"fact_result": -1, "related_articles": []}),
+        "error": True,
     }
-    Thread(target=factchecker.cache_result).start()
-    return jsonify(response)
+
+
+def _run_claim(item):
+    # 비동기 작업의 주장 하나 처리 (워커 스레드에서 실행)
+    claim = {"claim": item["claim"], "keyword": item["keyword"]}
+    bypass = item.get("bypass", False)
+    cached = _cached_result(item["claim"], claim, bypass)
+    if cached is not None:
+        return {"claim": item["claim"], **cached}
+    try:
+        representative = _representatives([claim], item.get("session"))[0]
+        verdict = None
+        if representative != claim and not bypass:
+            verdict = verdict_cache.get(
+                representative["claim"], representative["keyword"]
+            )
+        if verdict is None:
+            verdict = _analyze_once(
+                representative, item["video_ctx"], item["summary"], item.get("session")
+            )
+    except Exception as e:
+        log("app.py", f"주장 분석 실패: {item['claim']} → {e}")
+        return _failed_claim(item)
+    if representative != claim:
+        _remember_verdict([claim], verdict)
+    return {"claim": item["claim"], **_format_result(item["claim"], verdict)}
+
+
+job_manager = JobManager(
+    _run_claim,
+    failed=_failed_claim,
+    max_workers=int(os.getenv("JOB_WORKERS", "2")),
+    max_queue=int(os.getenv("JOB_MAX_QUEUE", "200")),
+    job_ttl=float(os.getenv("JOB_TTL", "600")),
+    # 스트림이 웹 워커 스레드를 모두 차지하지 않도록 기본은 스레드의 절반
+    max_streams=int(
+        os.getenv(
+            "JOB_MAX_STREAMS", str(max(1, int(os.getenv("WEB_THREADS", "4")) // 2))
+        )
+    ),
+    max_stream_seconds=float(os.getenv("JOB_STREAM_MAX_SECONDS", "300")),
+)
+metrics.gauge(
+    "job_queue_depth", "Claims waiting or running in the job queue"
+).set_function(job_manager.queue_depth)
+metrics.gauge("job_streams_open", "Open job SSE streams").set_function(
+    job_manager.open_streams
+)
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """
+    주장 여러 개를 비동기로 분석하는 작업을 등록하고 바로 job id를 반환합니다.
+    요청 형식은 /analyze_batch와 같고, 결과는 /jobs/<id>/events(SSE) 또는 /jobs/<id>로 받습니다.
+    """
+    data = request.get_json()
+
+    video_ctx = {
+        "title": data.get("title", ""),
+        "description": data.get("description", ""),
+        "hashtags": data.get("hashtags", []),
+    }
+    video_summary = _get_summary_text(data)
+    session = _get_session(data, video_ctx)
+    items = [
+        {
+            "claim": item["claim"],
+            "keyword": item["keyword"],
+            "video_ctx": video_ctx,
+            "summary": video_summary,
+            "session": session,
+            "bypass": bool(data.get("bypassCache")),
+        }
+        for item in data["claims"]
+    ]
+    try:
+        job = job_manager.submit(items)
+    except QueueFullError as e:
+        response = jsonify({"error": str(e)})
+        response.headers["Retry-After"] = "5"
+        return response, 429
+
+    return (
+        jsonify(
+            {
+                "job_id": job.id,
+                "total": job.total,
+                "status_url": f"/jobs/{job.id}",
+                "events_url": f"/jobs/{job.id}/events",
+            }
+        ),
+        202,
+    )
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    # SSE를 쓸 수 없는 경우의 폴링용
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "job not found"}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    # 주장별 결과가 나오는 대로 SSE로 전송
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "job not found"}), 404
+    try:
+        events = job_manager.open_stream(job)
+    except StreamLimitError as e:
+        # 스트림 자리가 없으면 폴링으로 받도록 안내
+        response = jsonify({"error": str(e), "status_url": f"/jobs/{job.id}"})
+        response.headers["Retry-After"] = "5"
+        return response, 503
+    response = Response(
+        stream_with_context(events),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # 정상 종료 / 클라이언트 연결 끊김 모두 응답 close 시 자리 반납
+    response.call_on_close(job_manager.close_stream)
+    return response
+
+
+@app.route("/videos/<video_id>", methods=["GET"])
+def video_stats(video_id):
+    # 영상 세션의 주장 묶음 통계 (분석 요청된 주장 수, 생략된 분석 수, 대표 주장 수)
+    session = video_sessions.get(video_key(video_id))
+    if session is None:
+        return jsonify({"error": "video session not found"}), 404
+    return jsonify(
+        {
+            "video_id": video_id,
+            "summary": bool(session.summary),
+            "dedup": video_sessions.dedup_stats(session),
+        }
+    )
+
+
+@app.route("/videos/<video_id>/prefetch", methods=["DELETE"])
+def cancel_prefetch(video_id):
+    # 다른 영상으로 이동했을 때 content.js가 호출, 그 영상의 미리 가져오기 작업 취소
+    return jsonify(
+        {"video_id": video_id, "cancelled": prefetcher.cancel(video_key(video_id))}
+    )
+
+
+@app.route("/ready", methods=["GET"])
+def ready():
+    # 모델 워밍업이 끝나야 요청을 받을 준비가 된 것으로 봄
+    if models_ready.is_set():
+        return jsonify({"ready": True})
+    error = warm_up_error()
+    if error is not None:
+        return jsonify({"ready": False, "error": error}), 503
+    return jsonify({"ready": False}), 503
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    # Prometheus 텍스트 형식 (워커 프로세스 단위)
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/stats", methods=["GET"])
+def stats():
+    # 캐시 적중률 등 서버 내부 지표
+    return jsonify(
+        {
+            "translation_cache": translation_cache.stats(),
+            "verdict_cache": verdict_cache.stats(),
+            "embedding_cache": embedding_cache_stats(),
+            "models": registry.stats(),
+            "job_queue_depth": job_manager.queue_depth(),
+            "video_sessions": video_sessions.stats(),
+            "prefetch": prefetcher.stats(),
+        }
+    )
 
 
 @app.route("/batch_extract", methods=["POST"])
 def batch_extract():
+    """
+    댓글 목록에서 영상 요약과 댓글별 주장/키워드를 추출합니다.
+    요청: {"comments": [...], "videoContext": {...}, "videoId": "..."}
+    응답: {"summary": "...", "claims": [{"index": 댓글 위치, "claims": [...]}, ...]}
+
+    같은 영상(videoId, 없으면 영상 정보)의 세션에 저장된 요약문과
+    이미 추출한 댓글의 주장은 다시 요청하지 않습니다.
+    PREFETCH=1이면 응답 후 추출된 주장의 근거를 백그라운드에서 미리 준비합니다.
+    """
     data = request.get_json()
     comments = data["comments"]
     video_ctx = data.get("videoContext", {})  # 메타데이터 함께 받음
-    results = extract_keywords_batch_llm(comments, video_ctx, n=6)
-    return jsonify(results)
+    session = _get_session(data, video_ctx)
+    if session is None:
+        return jsonify(extract_keywords_batch_llm(comments, video_ctx, n=6))
+    result = _extract_with_session(session, comments, video_ctx)
+    _prefetch_claims(session, video_ctx, result["claims"])
+    return jsonify(result)
+
+
+def _prefetch_claims(session, video_ctx, claims):
+    # 댓글 순서대로, 키워드가 있고 저장된 판정이 없는 주장만 (영상별 예산까지)
+    if not prefetcher.enabled:
+        return
+    items = []
+    for entry in claims:
+        for claim in entry["claims"]:
+            if not claim.get("claim") or not claim.get("keywords"):
+                continue
+            if verdict_cache.contains(claim["claim"], claim["keywords"]):
+                continue
+            key = verdict_cache.key(claim["claim"], claim["keywords"])
+            items.append(
+                (
+                    key,
+                    {
+                        "claim": claim["claim"],
+                        "keyword": claim["keywords"],
+                        "video_ctx": video_ctx,
+                        "session": session,
+                    },
+                )
+            )
+    prefetcher.submit(session.key, items)
+
+
+def _extract_with_session(session, comments, video_ctx):
+    hashes = [comment_hash(comment) for comment in comments]
+    claims = video_sessions.claims(session, hashes)
+    summary = video_sessions.summary(session)
+
+    # 처음 보는 댓글만 (같은 요청 안의 중복도 한 번만) 추출
+    positions = []
+    pending = set()
+    for i, h in enumerate(hashes):
+        if h not in claims and h not in pending:
+            pending.add(h)
+            positions.append(i)
+    failed = set()
+    if positions:
+        result = extract_keywords_batch_llm(
+            [comments[i] for i in positions], video_ctx, n=6, summary=summary or None
+        )
+        extracted = {item["index"]: item.get("claims", []) for item in result["claims"]}
+        failed = {hashes[positions[i]] for i in result["failed"]}
+        # 실패한 댓글은 저장하지 않아 다음 요청에서 다시 추출
+        extracted = {
+            hashes[pos]: extracted.get(i, [])
+            for i, pos in enumerate(positions)
+            if hashes[pos] not in failed
+        }
+        video_sessions.put_claims(session, extracted)
+        claims.update(extracted)
+        if not summary:
+            summary = result["summary"]
+            video_sessions.set_summary(session, summary)
+
+    return {
+        "summary": summary,
+        "claims": [
+            {"index": i, "claims": claims[h]}
+            for i, h in enumerate(hashes)
+            if claims.get(h)
+        ],
+        "failed": [i for i, h in enumerate(hashes) if h in failed],
+    }
 
 
 # get fact-check result for all comemnts
@@ -145,7 +719,7 @@ def test_keywords():
         if not results:
             results = [None] * len(comments)
     except Exception as e:
-        print(f"키워드 추출 중 오류 발생: {str(e)}")
+        log("app.py", f"키워드 추출 중 오류 발생: {str(e)}")
         results = [None] * len(comments)
     excel_data = []
     for i, comment in enumerate(comments):
@@ -187,4 +761,5 @@ def test_keywords():
 
 
 if __name__ == "__main__":
+    start_warm_up()
     app.run(host="0.0.0.0", debug=True)
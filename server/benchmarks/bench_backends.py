@@ -0,0 +1,144 @@
+"""
+추론 백엔드(torch fp32 / onnx int8 / onnx fp32) 지연시간, 처리량, 메모리 비교
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_backends
+    python -m benchmarks.bench_backends --backends torch onnx-int8 --pairs 30 --sentences 200
+
+백엔드마다 별도 프로세스에서 모델을 로드해 최대 RSS를 따로 측정합니다.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.samples import SENTENCES, make_pairs
+
+
+def load_models(backend):
+    from services.backends import (
+        EMBEDDING_MODEL_NAME,
+        NLI_MODEL_NAME,
+        ONNX_MODEL_DIR,
+        OnnxNliModel,
+        OnnxSentenceEncoder,
+        TorchNliModel,
+    )
+
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+
+        return (
+            SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu"),
+            TorchNliModel(NLI_MODEL_NAME),
+        )
+    quantize = backend == "onnx-int8"
+    return (
+        OnnxSentenceEncoder(EMBEDDING_MODEL_NAME, ONNX_MODEL_DIR, quantize),
+        OnnxNliModel(NLI_MODEL_NAME, ONNX_MODEL_DIR, quantize),
+    )
+
+
+def run_worker(backend, n_pairs, n_sentences, repeat):
+    from services.backends import predict_nli_pairs
+
+    start = time.perf_counter()
+    embedding_model, nli_model = load_models(backend)
+    load_time = time.perf_counter() - start
+
+    pairs = make_pairs(n_pairs)
+    sentences = [SENTENCES[i % len(SENTENCES)] + f" ({i})" for i in range(n_sentences)]
+
+    # 워밍업
+    predict_nli_pairs(nli_model, pairs[:2])
+    embedding_model.encode(sentences[:2])
+
+    def best_of(fn):
+        best = float("inf")
+        for _ in range(repeat):
+            t = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t)
+        return best
+
+    single_pair = best_of(lambda: predict_nli_pairs(nli_model, pairs[:1]))
+    nli_batch = best_of(lambda: predict_nli_pairs(nli_model, pairs))
+    single_sentence = best_of(lambda: embedding_model.encode(sentences[:1]))
+    encode_batch = best_of(lambda: embedding_model.encode(sentences))
+
+    print(
+        json.dumps(
+            {
+                "backend": backend,
+                "load_s": load_time,
+                "nli_single_ms": single_pair * 1000,
+                "nli_pairs_per_s": n_pairs / nli_batch,
+                "encode_single_ms": single_sentence * 1000,
+                "encode_sentences_per_s": n_sentences / encode_batch,
+                # Linux에서 ru_maxrss 단위는 KB
+                "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                / 1024,
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--backends", nargs="+", default=["torch", "onnx-int8", "onnx-fp32"]
+    )
+    parser.add_argument("--pairs", type=int, default=30)
+    parser.add_argument("--sentences", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.pairs, args.sentences, args.repeat)
+        return
+
+    rows = []
+    for backend in args.backends:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.bench_backends",
+                "--worker",
+                backend,
+                "--pairs",
+                str(args.pairs),
+                "--sentences",
+                str(args.sentences),
+                "--repeat",
+                str(args.repeat),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(
+        f"{'backend':<10} {'load(s)':>8} {'nli 1(ms)':>10} {'nli/s':>8} {'enc 1(ms)':>10} {'enc/s':>8} {'RSS(MB)':>8}"
+    )
+    for r in rows:
+        print(
+            f"{r['backend']:<10} {r['load_s']:>8.1f} {r['nli_single_ms']:>10.1f} {r['nli_pairs_per_s']:>8.1f} "
+            f"{r['encode_single_ms']:>10.1f} {r['encode_sentences_per_s']:>8.1f} {r['peak_rss_mb']:>8.0f}"
+        )
+    base = rows[0]
+    for r in rows[1:]:
+        print(
+            f"{r['backend']} vs {base['backend']}: NLI {r['nli_pairs_per_s'] / base['nli_pairs_per_s']:.2f}x, "
+            f"encode {r['encode_sentences_per_s'] / base['encode_sentences_per_s']:.2f}x, "
+            f"RSS {r['peak_rss_mb'] / base['peak_rss_mb']:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
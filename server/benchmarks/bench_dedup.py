@@ -0,0 +1,97 @@
+"""
+주장 묶기(services.claim_dedup) 벤치마크
+
+1. 기록된 Gemini 응답의 주장을 KR-SBERT로 임베딩해 threshold별 묶음 수 / 생략되는 분석 수 출력
+2. 임의 임베딩(비슷한 주장을 섞은)으로 cluster_claims와 주장 쌍마다 비교하는 Python 루프의 시간 비교
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_dedup
+    python -m benchmarks.bench_dedup --thresholds 0.85 0.9 --show 0.9
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.bench_e2e import corpus_claims
+from benchmarks.fixture_server import load_corpus
+from services.claim_dedup import cluster_claims, normalize_rows
+
+
+def cluster_loop(embeddings, threshold):
+    # 비교용: 주장마다 앞선 대표들과 하나씩 비교
+    x = normalize_rows(embeddings)
+    representatives = []
+    labels = []
+    for i, row in enumerate(x):
+        for j in representatives:
+            if float(np.dot(row, x[j])) >= threshold:
+                labels.append(j)
+                break
+        else:
+            representatives.append(i)
+            labels.append(i)
+    return np.array(labels)
+
+
+def synthetic(n, dim, duplicate_rate, seed):
+    # duplicate_rate 비율은 앞선 주장에 작은 잡음을 더한 비슷한 주장
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal((n, dim)).astype(np.float32)
+    for i in range(1, n):
+        if rng.random() < duplicate_rate:
+            x[i] = x[rng.integers(0, i)] + 0.1 * rng.standard_normal(dim)
+    return x
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--thresholds", type=float, nargs="+", default=[0.8, 0.85, 0.9, 0.95]
+    )
+    parser.add_argument("--show", type=float, help="이 threshold의 묶음을 출력")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 3000])
+    parser.add_argument("--loop-max", type=int, default=1000, help="루프 비교 최대 n")
+    parser.add_argument("--no-model", action="store_true", help="1번 생략")
+    args = parser.parse_args()
+
+    if not args.no_model:
+        from services.inference import encode
+
+        _, claims = corpus_claims(load_corpus())
+        texts = [item["claim"] for item in claims]
+        embeddings = encode(texts)
+        print(f"{len(texts)} claims from the recorded video")
+        print(f"{'threshold':>9} {'clusters':>8} {'runs saved':>10}")
+        for threshold in args.thresholds:
+            labels = cluster_claims(embeddings, threshold)
+            clusters = len(set(labels.tolist()))
+            print(f"{threshold:>9.2f} {clusters:>8} {len(texts) - clusters:>10}")
+            if args.show == threshold:
+                for label in sorted(set(labels.tolist())):
+                    members = [texts[i] for i in np.flatnonzero(labels == label)]
+                    if len(members) > 1:
+                        print("   ", " | ".join(members))
+        print()
+
+    print(f"{'n':>6} {'clusters':>8} {'vectorized(ms)':>14} {'loop(ms)':>9}")
+    for n in args.sizes:
+        x = synthetic(n, 768, 0.5, seed=n)
+        start = time.perf_counter()
+        labels = cluster_claims(x, 0.9)
+        vectorized_ms = (time.perf_counter() - start) * 1000
+        loop_ms = float("nan")
+        if n <= args.loop_max:
+            start = time.perf_counter()
+            expected = cluster_loop(x, 0.9)
+            loop_ms = (time.perf_counter() - start) * 1000
+            # 두 방식의 묶음 결과가 같은지 확인
+            assert (labels == expected).all()
+        print(
+            f"{n:>6} {len(set(labels.tolist())):>8} {vectorized_ms:>14.1f} {loop_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""
+CommentFactCheck 파이프라인 / Flask 엔드포인트 오프라인 E2E 벤치마크
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_e2e --output runs/base.json
+    python -m benchmarks.bench_e2e --compare runs/base.json            # 실행 후 기준 결과와 비교
+    python -m benchmarks.bench_e2e --compare runs/base.json runs/new.json  # 저장된 두 결과만 비교
+
+뉴스 검색, 기사, 번역, Gemini는 fixture_server의 기록된 응답으로 대체하므로 네트워크가 필요 없습니다.
+(모델은 INFERENCE_BACKEND에 따라 실제로 로드)
+
+시나리오마다 새 프로세스와 빈 캐시 디렉터리에서 실행합니다.
+- engine: 주장마다 CommentFactCheck.analyze() (단계별 소요 시간 포함)
+- batch:  --batch-size개씩 CommentFactCheck.analyze_batch()
+- flask:  /batch_extract → 주장마다 /analyze → 같은 주장 /analyze (판정 캐시) → /analyze_batch
+
+--warm이면 같은 프로세스에서 한 번 실행해 캐시를 채운 뒤 두 번째 실행을 측정합니다.
+비교 시 p50/p95 지연이나 RSS가 --threshold 비율 이상 늘거나 처리량이 그만큼 줄면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.fixture_server import FixtureGemini, FixtureServer, load_corpus
+
+SCENARIOS = ["engine", "batch", "flask"]
+STAGES = ["collect", "extract", "translate", "nli", "score", "total"]
+RESULT_PREFIX = "BENCH_RESULT "
+
+
+def summarize(samples: list[float]) -> dict:
+    # 초 단위 샘플 → ms 단위 요약
+    values = np.asarray(samples, dtype=np.float64) * 1000
+    if not len(values):
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(float(values.mean()), 2),
+        "p50_ms": round(float(np.percentile(values, 50)), 2),
+        "p95_ms": round(float(np.percentile(values, 95)), 2),
+        "max_ms": round(float(values.max()), 2),
+    }
+
+
+def corpus_claims(corpus: dict, limit: int | None = None) -> tuple[str, list]:
+    # 기록된 Gemini 응답에서 (요약문, [{claim, keyword}]) 추출
+    raw = corpus["gemini_response"].strip().strip("`").lstrip("json").strip()
+    parsed = json.loads(raw)
+    claims = [
+        {"claim": claim["claim"], "keyword": claim["keywords"]}
+        for comment in parsed["comments_data"]
+        for claim in comment["claims"]
+    ]
+    return parsed["video_summary"], claims[:limit] if limit else claims
+
+
+def run_engine(claims, summary, video_ctx, batch_size):
+    from factcheck_engine import CommentFactCheck
+    from services.collector import cache_writer
+
+    stages = {stage: [] for stage in STAGES}
+    latencies = []
+    factcheckers = []
+    for item in claims:
+        factchecker = CommentFactCheck(
+            item["claim"], item["keyword"], video_ctx, summary
+        )
+        start = time.perf_counter()
+        factchecker.analyze()
+        latencies.append(time.perf_counter() - start)
+        # /analyze와 같이 응답 후 캐시 저장 (측정 시간에서 제외)
+        # 다음 주장이 항상 같은 캐시 상태를 보도록 기록이 끝날 때까지 대기
+        factchecker.cache_result()
+        cache_writer.flush()
+        for stage in STAGES:
+            stages[stage].append(factchecker.timings[stage])
+        factcheckers.append(factchecker)
+    return factcheckers, stages, {"analyze": latencies}
+
+
+def run_batch(claims, summary, video_ctx, batch_size):
+    from factcheck_engine import CommentFactCheck
+    from services.collector import cache_writer
+
+    stages = {stage: [] for stage in STAGES}
+    latencies = []
+    factcheckers = []
+    for start_idx in range(0, len(claims), batch_size):
+        batch = [
+            CommentFactCheck(item["claim"], item["keyword"], video_ctx, summary)
+            for item in claims[start_idx : start_idx + batch_size]
+        ]
+        start = time.perf_counter()
+        CommentFactCheck.analyze_batch(batch)
+        latencies.append(time.perf_counter() - start)
+        for factchecker in batch:
+            factchecker.cache_result()
+        cache_writer.flush()
+        for stage in STAGES:
+            stages[stage].append(batch[0].timings[stage])
+        factcheckers.extend(batch)
+    return factcheckers, stages, {"analyze_batch": latencies}
+
+
+def run_flask(claims, summary, video_ctx, batch_size, comments):
+    from app import app
+
+    client = app.test_client()
+    endpoints = {
+        "batch_extract": [],
+        "analyze": [],
+        "analyze_cached": [],
+        "analyze_batch": [],
+    }
+
+    start = time.perf_counter()
+    response = client.post(
+        "/batch_extract", json={"comments": comments, "videoContext": video_ctx}
+    )
+    endpoints["batch_extract"].append(time.perf_counter() - start)
+    assert response.status_code == 200, response.status_code
+
+    results = []
+    for item in claims:
+        start = time.perf_counter()
+        response = client.post(
+            "/analyze", json={**item, **video_ctx, "summary": {"summary": summary}}
+        )
+        endpoints["analyze"].append(time.perf_counter() - start)
+        results.append(response.get_json())
+
+    # 같은 주장을 다시 요청하면 판정 캐시에서 응답
+    for item, result in zip(claims, results):
+        start = time.perf_counter()
+        response = client.post(
+            "/analyze", json={**item, **video_ctx, "summary": {"summary": summary}}
+        )
+        endpoints["analyze_cached"].append(time.perf_counter() - start)
+        assert response.get_json() == result
+
+    # 일괄 분석은 판정 캐시 없이 파이프라인을 측정
+    for start_idx in range(0, len(claims), batch_size):
+        start = time.perf_counter()
+        response = client.post(
+            "/analyze_batch",
+            json={
+                "claims": claims[start_idx : start_idx + batch_size],
+                "summary": summary,
+                "bypassCache": True,
+            },
+        )
+        endpoints["analyze_batch"].append(time.perf_counter() - start)
+    return results, {}, endpoints
+
+
+def run_worker(args):
+    corpus = load_corpus()
+    server = FixtureServer(corpus, latency=args.latency_ms / 1000).start()
+    tmp = tempfile.mkdtemp(prefix="bench_e2e_")
+
+    # 모든 외부 호출을 스텁 서버로, 모든 캐시를 빈 임시 디렉터리로 (import 전에 설정)
+    os.environ["NEWS_SEARCH_URL"] = server.url + "/search"
+    os.environ["GOOGLE_TRANSLATE_URL"] = server.url + "/translate"
+    os.environ["TRANSLATION_CACHE_DB"] = os.path.join(tmp, "translations.sqlite3")
+    os.environ["ARTICLE_CACHE_DB"] = os.path.join(tmp, "articles.sqlite3")
+    os.environ["SEARCH_CACHE_DB"] = os.path.join(tmp, "search.sqlite3")
+    os.environ["VERDICT_CACHE_DB"] = os.path.join(tmp, "verdicts.sqlite3")
+    os.environ["EMBEDDING_CACHE_DIR"] = os.path.join(tmp, "embeddings")
+    os.environ["MODEL_WARMUP"] = "0"
+
+    import services.api as api
+    from services.inference import warm_up
+    from services.models import registry
+
+    api.model_gemini = FixtureGemini(
+        corpus["gemini_response"],
+        latency=args.llm_latency_ms / 1000,
+        comments=corpus["comments"],
+    )
+
+    start = time.perf_counter()
+    warm_up()
+    model_load_s = time.perf_counter() - start
+
+    summary, claims = corpus_claims(corpus, args.limit)
+    video_ctx = corpus["video_ctx"]
+    if args.worker == "flask":
+        run = lambda: run_flask(
+            claims, summary, video_ctx, args.batch_size, corpus["comments"]
+        )
+    else:
+        scenario = run_engine if args.worker == "engine" else run_batch
+        run = lambda: scenario(claims, summary, video_ctx, args.batch_size)
+
+    if args.warm:
+        run()
+    start = time.perf_counter()
+    outputs, stages, endpoints = run()
+    wall = time.perf_counter() - start
+
+    if args.worker == "flask":
+        scores = [r["fact_result"] for r in outputs]
+        with_articles = sum(1 for r in outputs if r["related_articles"])
+    else:
+        scores = [factchecker.score for factchecker in outputs]
+        with_articles = sum(1 for factchecker in outputs if factchecker.articles)
+
+    result = {
+        "scenario": args.worker,
+        "claims": len(claims),
+        "wall_s": round(wall, 3),
+        "throughput_claims_per_s": round(len(claims) / wall, 3),
+        "model_load_s": round(model_load_s, 3),
+        # Linux에서 ru_maxrss 단위는 KB
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+        "stages": {stage: summarize(samples) for stage, samples in stages.items()},
+        "endpoints": {name: summarize(samples) for name, samples in endpoints.items()},
+        "requests": dict(server.requests),
+        "models": registry.stats(),
+        # 성능 변경이 결과를 바꾸지 않았는지 확인용
+        "quality": {
+            "with_articles": with_articles,
+            "mean_score": round(float(np.mean(scores)), 4) if scores else None,
+        },
+    }
+    server.stop()
+    print(RESULT_PREFIX + json.dumps(result, ensure_ascii=False), flush=True)
+
+
+def spawn(scenario, args):
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_e2e",
+        "--worker",
+        scenario,
+        "--latency-ms",
+        str(args.latency_ms),
+        "--llm-latency-ms",
+        str(args.llm_latency_ms),
+        "--batch-size",
+        str(args.batch_size),
+    ]
+    if args.limit:
+        command += ["--limit", str(args.limit)]
+    if args.warm:
+        command.append("--warm")
+    process = subprocess.run(command, capture_output=True, text=True)
+    for line in process.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX) :])
+    print(process.stdout[-2000:], process.stderr[-4000:], sep="\n", file=sys.stderr)
+    raise RuntimeError(f"scenario {scenario} failed (exit {process.returncode})")
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report):
+    meta = report["meta"]
+    print(
+        f"commit={meta['commit']} backend={meta['backend']} warm={meta['warm']} "
+        f"latency={meta['latency_ms']}ms llm_latency={meta['llm_latency_ms']}ms"
+    )
+    for name, r in report["scenarios"].items():
+        print(
+            f"\n[{name}] {r['claims']} claims in {r['wall_s']:.2f}s "
+            f"({r['throughput_claims_per_s']:.2f} claims/s), peak RSS {r['peak_rss_mb']:.0f} MB, "
+            f"articles found {r['quality']['with_articles']}/{r['claims']}, mean score {r['quality']['mean_score']}"
+        )
+        rows = [(f"stage {k}", v) for k, v in r["stages"].items()]
+        rows += [(f"endpoint {k}", v) for k, v in r["endpoints"].items()]
+        for label, s in rows:
+            if s["count"]:
+                print(
+                    f"  {label:<24} n={s['count']:<4} p50={s['p50_ms']:>9.1f}ms p95={s['p95_ms']:>9.1f}ms"
+                )
+
+
+def flatten_metrics(result: dict) -> dict:
+    # {지표 이름: (값, 작을수록 좋은지)}
+    metrics = {
+        "throughput_claims_per_s": (result["throughput_claims_per_s"], False),
+        "peak_rss_mb": (result["peak_rss_mb"], True),
+    }
+    for group in ("stages", "endpoints"):
+        for name, summary in result[group].items():
+            for pct in ("p50_ms", "p95_ms"):
+                if pct in summary:
+                    metrics[f"{group[:-1]} {name} {pct}"] = (summary[pct], True)
+    return metrics
+
+
+def compare(base, new, threshold, min_ms):
+    """
+    두 결과를 비교해 변화량을 출력하고 회귀 항목 수를 반환합니다.
+    """
+    regressions = 0
+    print(f"\ncompare: {base['meta']['commit']} → {new['meta']['commit']}")
+    for name, b in base["scenarios"].items():
+        if name not in new["scenarios"]:
+            continue
+        n = new["scenarios"][name]
+        b_metrics, n_metrics = flatten_metrics(b), flatten_metrics(n)
+
+        print(f"[{name}]")
+        if b["claims"] != n["claims"]:
+            print(f"  warning: claim count differs ({b['claims']} → {n['claims']})")
+        for label, (old, lower_is_better) in b_metrics.items():
+            if label not in n_metrics:
+                continue
+            cur = n_metrics[label][0]
+            change = (cur - old) / old if old else 0.0
+            worse = change > threshold if lower_is_better else change < -threshold
+            # 아주 짧은 구간은 잡음이 커서 절대 차이가 min_ms 이상일 때만 회귀로 판단
+            if label.endswith("_ms") and abs(cur - old) < min_ms:
+                worse = False
+            regressions += worse
+            print(
+                f"  {label:<34} {old:>10.2f} → {cur:>10.2f} ({change:+.1%}){'  REGRESSION' if worse else ''}"
+            )
+        if b["quality"] != n["quality"]:
+            print(f"  quality changed: {b['quality']} → {n['quality']}")
+    print(f"regressions: {regressions}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenarios", nargs="+", default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument("--limit", type=int, help="사용할 주장 수 (기본: 전체)")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument(
+        "--latency-ms", type=float, default=20, help="스텁 HTTP 응답 지연"
+    )
+    parser.add_argument(
+        "--llm-latency-ms", type=float, default=0, help="Gemini 응답 지연"
+    )
+    parser.add_argument("--warm", action="store_true", help="캐시를 채운 뒤 측정")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument(
+        "--compare", nargs="+", metavar="RUN", help="기준 결과 [비교할 결과]"
+    )
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판단 비율")
+    parser.add_argument(
+        "--min-ms", type=float, default=5, help="회귀 판단 최소 지연 차이"
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    if args.compare and len(args.compare) == 2:
+        runs = []
+        for path in args.compare:
+            with open(path, "r", encoding="utf-8") as f:
+                runs.append(json.load(f))
+        sys.exit(1 if compare(*runs, args.threshold, args.min_ms) else 0)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "backend": os.getenv("INFERENCE_BACKEND", "torch"),
+            "warm": args.warm,
+            "latency_ms": args.latency_ms,
+            "llm_latency_ms": args.llm_latency_ms,
+            "batch_size": args.batch_size,
+        },
+        "scenarios": {scenario: spawn(scenario, args) for scenario in args.scenarios},
+    }
+    print_report(report)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nsaved: {args.output}")
+
+    if args.compare:
+        with open(args.compare[0], "r", encoding="utf-8") as f:
+            base = json.load(f)
+        sys.exit(1 if compare(base, report, args.threshold, args.min_ms) else 0)
+
+
+if __name__ == "__main__":
+    main()
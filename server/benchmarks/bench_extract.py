@@ -0,0 +1,119 @@
+"""
+/batch_extract 댓글 추출 벤치마크: 한 번에 요청 vs 토큰 예산 기준 청크 동시 요청
+
+Gemini는 fixture_server.FixtureGemini로 대체합니다.
+응답 지연은 llm-latency-ms + 출력 토큰 수 * token-ms이고, max-output-tokens를 넘는 출력은
+잘려서 JSON이 깨지므로 (실제 모델과 같이) 댓글이 많으면 한 번에 요청한 결과가 비게 됩니다.
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_extract
+    python -m benchmarks.bench_extract --comments 200 --fail-rate 0.1
+    python -m benchmarks.bench_extract --gemini-concurrency 8
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from benchmarks.fixture_server import FixtureGemini, load_corpus
+
+
+def run(api, client, comments, video_ctx, requests, concurrency):
+    latencies = []
+    claimed = []
+
+    def request():
+        start = time.perf_counter()
+        result = api.extract_keywords_batch_llm(comments, video_ctx, client=client)
+        latencies.append(time.perf_counter() - start)
+        claimed.append(sum(1 for item in result["claims"] if item["claims"]))
+
+    start = time.perf_counter()
+    # 추출 로그는 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(concurrency) as pool:
+            for future in [pool.submit(request) for _ in range(requests)]:
+                future.result()
+    wall = time.perf_counter() - start
+    return {
+        "wall_s": wall,
+        "comments_per_s": len(comments) * requests / wall,
+        "p50_ms": float(np.percentile(latencies, 50)) * 1000,
+        "p95_ms": float(np.percentile(latencies, 95)) * 1000,
+        "claimed": float(np.mean(claimed)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--comments", type=int, default=70, help="요청당 댓글 수")
+    parser.add_argument("--requests", type=int, default=6)
+    parser.add_argument("--concurrency", type=int, default=3, help="동시 요청 수")
+    parser.add_argument("--llm-latency-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=4, help="출력 토큰당 지연")
+    parser.add_argument("--max-output-tokens", type=int, default=2048)
+    parser.add_argument(
+        "--gemini-concurrency", type=int, default=0, help="청크 동시 요청 수"
+    )
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # 캐시는 임시 디렉터리로 (import 전에 설정)
+    tmp = tempfile.mkdtemp(prefix="bench_extract_")
+    os.environ["TRANSLATION_CACHE_DB"] = os.path.join(tmp, "translations.sqlite3")
+    os.environ["SEARCH_CACHE_DB"] = os.path.join(tmp, "search.sqlite3")
+    import services.api as api
+
+    if args.gemini_concurrency:
+        api.gemini_pool = ThreadPoolExecutor(args.gemini_concurrency)
+        api.GEMINI_CONCURRENCY = args.gemini_concurrency
+
+    corpus = load_corpus()
+    recorded = corpus["comments"]
+    # 기록된 댓글을 반복해서 요청당 댓글 수를 맞춤
+    comments = [recorded[i % len(recorded)] for i in range(args.comments)]
+    video_ctx = corpus["video_ctx"]
+
+    modes = {
+        "single": (1 << 30, 0),
+        "chunked": (api.GEMINI_CHUNK_TOKENS, api.GEMINI_CHUNK_COMMENTS),
+    }
+    print(
+        f"{args.comments} comments x {args.requests} requests, "
+        f"concurrency {args.concurrency}, gemini concurrency {api.GEMINI_CONCURRENCY}, "
+        f"fail rate {args.fail_rate}"
+    )
+    print(
+        f"{'mode':<8} {'chunks':>6} {'calls':>6} {'fails':>6} {'claimed':>8} "
+        f"{'comments/s':>10} {'p50(ms)':>8} {'p95(ms)':>8}"
+    )
+    for mode, (max_tokens, max_comments) in modes.items():
+        api.GEMINI_CHUNK_TOKENS = max_tokens
+        api.GEMINI_CHUNK_COMMENTS = max_comments
+        client = FixtureGemini(
+            corpus["gemini_response"],
+            latency=args.llm_latency_ms / 1000,
+            comments=recorded,
+            token_latency=args.token_ms / 1000,
+            max_output_tokens=args.max_output_tokens,
+            fail_rate=args.fail_rate,
+            seed=args.seed,
+        )
+        chunks = len(api.chunk_comments(comments, max_tokens, max_comments))
+        row = run(api, client, comments, video_ctx, args.requests, args.concurrency)
+        print(
+            f"{mode:<8} {chunks:>6} {client.calls:>6} {client.failures:>6} "
+            f"{row['claimed']:>8.1f} {row['comments_per_s']:>10.1f} "
+            f"{row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+NLI 처리량 마이크로 벤치마크: 쌍마다 모델 호출 vs 배치 호출
+(INFERENCE_BACKEND 환경변수로 선택된 백엔드 사용)
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_nli
+    python -m benchmarks.bench_nli --sizes 3 30 300 --batch-size 32
+"""
+
+import argparse
+import time
+
+from benchmarks.samples import make_pairs
+from services.inference import analyze_nli_pairs
+
+
+def run_per_pair(pairs):
+    return [analyze_nli_pairs([pair])[0] for pair in pairs]
+
+
+def run_batched(pairs, batch_size):
+    return analyze_nli_pairs(pairs, batch_size=batch_size)
+
+
+def measure(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 30, 300])
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # 첫 호출 워밍업
+    run_batched(make_pairs(2), args.batch_size)
+    run_per_pair(make_pairs(2))
+
+    print(
+        f"{'pairs':>6} {'per-pair(s)':>12} {'batched(s)':>11} {'per-pair/s':>11} {'batched/s':>10} {'speedup':>8}"
+    )
+    for n in args.sizes:
+        pairs = make_pairs(n)
+
+        # 배치 결과가 쌍별 결과와 같은 라벨을 내는지 확인
+        single = [res["label"] for res in run_per_pair(pairs)]
+        batched = [res["label"] for res in run_batched(pairs, args.batch_size)]
+        mismatches = sum(a != b for a, b in zip(single, batched))
+
+        t_single = measure(lambda: run_per_pair(pairs), args.repeat)
+        t_batched = measure(lambda: run_batched(pairs, args.batch_size), args.repeat)
+        print(
+            f"{n:>6} {t_single:>12.3f} {t_batched:>11.3f} {n / t_single:>11.1f} "
+            f"{n / t_batched:>10.1f} {t_single / t_batched:>7.2f}x"
+            + (f"  (label mismatches: {mismatches})" if mismatches else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
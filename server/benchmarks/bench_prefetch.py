@@ -0,0 +1,154 @@
+"""
+근거 미리 가져오기(PREFETCH) 벤치마크: /batch_extract → (사용자가 읽는 시간) → 주장마다 /analyze
+
+PREFETCH=0 / 1을 각각 새 프로세스와 빈 캐시 디렉터리에서 실행해
+/analyze 지연과 /analyze 동안의 외부 요청(검색, 기사) 수를 비교합니다.
+외부 호출은 bench_e2e와 같이 fixture_server로 대체합니다.
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_prefetch
+    python -m benchmarks.bench_prefetch --think-ms 500 --latency-ms 100
+(--think-ms 0이면 미리 가져오기가 끝날 때까지 기다린 뒤 클릭)
+
+score(평균 판정)는 같지 않을 수 있습니다. collect_data는 앞서 분석한 주장이 저장한 기사 캐시를
+섞어 쓰는데, 미리 가져오기는 모든 주장의 기사를 클릭 전에 수집하므로 캐시가 채워지는 순서가 다릅니다.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.fixture_server import FixtureGemini, FixtureServer, load_corpus
+
+RESULT_PREFIX = "BENCH_PREFETCH_RESULT "
+
+
+def run_worker(args):
+    corpus = load_corpus()
+    server = FixtureServer(corpus, latency=args.latency_ms / 1000).start()
+    tmp = tempfile.mkdtemp(prefix="bench_prefetch_")
+
+    # 모든 외부 호출을 스텁 서버로, 모든 캐시를 빈 임시 디렉터리로 (import 전에 설정)
+    os.environ["NEWS_SEARCH_URL"] = server.url + "/search"
+    os.environ["GOOGLE_TRANSLATE_URL"] = server.url + "/translate"
+    os.environ["TRANSLATION_CACHE_DB"] = os.path.join(tmp, "translations.sqlite3")
+    os.environ["ARTICLE_CACHE_DB"] = os.path.join(tmp, "articles.sqlite3")
+    os.environ["SEARCH_CACHE_DB"] = os.path.join(tmp, "search.sqlite3")
+    os.environ["VERDICT_CACHE_DB"] = os.path.join(tmp, "verdicts.sqlite3")
+    os.environ["EMBEDDING_CACHE_DIR"] = os.path.join(tmp, "embeddings")
+    os.environ["MODEL_WARMUP"] = "0"
+    os.environ["PREFETCH"] = "1" if args.worker == "on" else "0"
+    os.environ["PREFETCH_BUDGET"] = str(args.budget)
+
+    import services.api as api
+    from services.inference import warm_up
+
+    api.model_gemini = FixtureGemini(
+        corpus["gemini_response"],
+        latency=args.llm_latency_ms / 1000,
+        comments=corpus["comments"],
+    )
+    warm_up()
+
+    from app import app, prefetcher
+
+    client = app.test_client()
+    video_ctx = corpus["video_ctx"]
+    response = client.post(
+        "/batch_extract",
+        json={
+            "comments": corpus["comments"],
+            "videoContext": video_ctx,
+            "videoId": "bench",
+        },
+    ).get_json()
+    summary = response["summary"]
+    claims = [
+        {"claim": claim["claim"], "keyword": claim["keywords"]}
+        for entry in response["claims"]
+        for claim in entry["claims"]
+        if claim.get("keywords")
+    ][: args.limit]
+
+    # 사용자가 댓글을 읽는 시간 (0이면 미리 가져오기가 끝날 때까지)
+    start = time.perf_counter()
+    if args.think_ms:
+        time.sleep(args.think_ms / 1000)
+    else:
+        while prefetcher.queue_depth():
+            time.sleep(0.01)
+    think_s = time.perf_counter() - start
+
+    before = dict(server.requests)
+    latencies = []
+    scores = []
+    for item in claims:
+        start = time.perf_counter()
+        result = client.post(
+            "/analyze", json={**item, "summary": summary, "videoId": "bench"}
+        ).get_json()
+        latencies.append(time.perf_counter() - start)
+        scores.append(result["fact_result"])
+
+    result = {
+        "mode": args.worker,
+        "claims": len(claims),
+        "think_s": think_s,
+        "p50_ms": float(np.percentile(latencies, 50)) * 1000,
+        "p95_ms": float(np.percentile(latencies, 95)) * 1000,
+        "total_s": float(np.sum(latencies)),
+        "search": server.requests["search"] - before["search"],
+        "article": server.requests["article"] - before["article"],
+        # 판정 비교용 (기사 캐시 순서에 따라 다를 수 있음)
+        "mean_score": round(float(np.mean(scores)), 4) if scores else None,
+    }
+    server.stop()
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def spawn(mode, args):
+    command = [sys.executable, "-m", "benchmarks.bench_prefetch", "--worker", mode]
+    for name in ("latency_ms", "llm_latency_ms", "think_ms", "budget", "limit"):
+        command += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+    output = subprocess.run(
+        command, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    line = next(line for line in output if line.startswith(RESULT_PREFIX))
+    return json.loads(line[len(RESULT_PREFIX) :])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--worker", choices=["off", "on"], help=argparse.SUPPRESS)
+    parser.add_argument("--latency-ms", type=float, default=50, help="검색/기사 지연")
+    parser.add_argument("--llm-latency-ms", type=float, default=0)
+    parser.add_argument("--think-ms", type=float, default=0, help="클릭까지의 시간")
+    parser.add_argument("--budget", type=int, default=20, help="PREFETCH_BUDGET")
+    parser.add_argument("--limit", type=int, default=20, help="클릭할 주장 수")
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    print(
+        f"{'prefetch':<8} {'claims':>6} {'think(s)':>8} {'p50(ms)':>8} {'p95(ms)':>8} "
+        f"{'total(s)':>8} {'search':>6} {'article':>7} {'score':>7}"
+    )
+    for mode in ("off", "on"):
+        row = spawn(mode, args)
+        print(
+            f"{row['mode']:<8} {row['claims']:>6} {row['think_s']:>8.2f} "
+            f"{row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['total_s']:>8.2f} "
+            f"{row['search']:>6} {row['article']:>7} {row['mean_score']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
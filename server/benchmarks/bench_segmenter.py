@@ -0,0 +1,115 @@
+"""
+기사 본문 문장 분리 비교: 기존 body.split(".") vs services.segmenter.split_sentences
+문장 수, 짧은 조각 수, 분리 시간, 임베딩 시간(캐시 없이 모델 직접 호출)을 비교합니다.
+
+본문은 benchmarks/fixtures/factcheck_corpus.json 기사와
+benchmarks/fixtures/news_bodies.json (기자명, 사진 설명, 숫자/약어가 섞인 기사)을 사용합니다.
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_segmenter
+    python -m benchmarks.bench_segmenter --no-encode
+"""
+
+import os
+import json
+import time
+import argparse
+
+from benchmarks.fixture_server import load_corpus
+from services.segmenter import MIN_SENTENCE_LENGTH, split_sentences
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_bodies():
+    with open(os.path.join(FIXTURE_DIR, "news_bodies.json"), encoding="utf-8") as f:
+        bodies = json.load(f)["bodies"]
+    return [article["body"] for article in load_corpus()["articles"]] + bodies
+
+
+def split_by_period(body):
+    # 기존 crawl_article의 분리 방식
+    return [s for s in body.split(".") if s.strip()]
+
+
+def split_segmenter(body):
+    return [sentence for sentence, _, _ in split_sentences(body)]
+
+
+def measure(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def summarize(name, bodies, split, encode_fn, repeat):
+    sentences = [sentence for body in bodies for sentence in split(body)]
+    short = sum(
+        len("".join(sentence.split())) < MIN_SENTENCE_LENGTH for sentence in sentences
+    )
+    split_ms = measure(lambda: [split(body) for body in bodies], repeat) * 1000
+    row = {
+        "method": name,
+        "sentences": len(sentences),
+        "per_article": len(sentences) / len(bodies),
+        "short": short,
+        "mean_chars": sum(map(len, sentences)) / max(1, len(sentences)),
+        "split_ms": split_ms,
+    }
+    if encode_fn is not None:
+        row["encode_ms"] = measure(lambda: encode_fn(sentences), repeat) * 1000
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-encode", action="store_true")
+    args = parser.parse_args()
+
+    bodies = load_bodies()
+    # offset이 원문 위치와 일치하는지 확인
+    for body in bodies:
+        for sentence, start, end in split_sentences(body):
+            assert body[start:end] == sentence, (sentence, start, end)
+
+    encode_fn = None
+    if not args.no_encode:
+        from services.models import registry
+        import services.inference  # noqa: F401 (임베딩 모델 등록)
+
+        model = registry.get("embedding")
+        model.encode(["워밍업 문장입니다."])
+        encode_fn = model.encode
+
+    rows = [
+        summarize("split('.')", bodies, split_by_period, encode_fn, args.repeat),
+        summarize("segmenter", bodies, split_segmenter, encode_fn, args.repeat),
+    ]
+
+    print(f"{len(bodies)} articles, min length {MIN_SENTENCE_LENGTH}")
+    header = f"{'method':<12} {'sentences':>9} {'per art.':>8} {'short':>6} {'mean chars':>10} {'split(ms)':>9}"
+    if encode_fn is not None:
+        header += f" {'encode(ms)':>10}"
+    print(header)
+    for row in rows:
+        line = (
+            f"{row['method']:<12} {row['sentences']:>9} {row['per_article']:>8.1f} "
+            f"{row['short']:>6} {row['mean_chars']:>10.1f} {row['split_ms']:>9.2f}"
+        )
+        if encode_fn is not None:
+            line += f" {row['encode_ms']:>10.1f}"
+        print(line)
+
+    base, new = rows
+    summary = f"sentences -{1 - new['sentences'] / base['sentences']:.0%}"
+    if encode_fn is not None:
+        summary += f", encode time -{1 - new['encode_ms'] / base['encode_ms']:.0%}"
+    print(summary)
+
+
+if __name__ == "__main__":
+    main()
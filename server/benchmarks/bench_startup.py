@@ -0,0 +1,85 @@
+"""
+서버 시작 시간/메모리 측정: 앱 import(모델 미로드) vs 모델 로드
+
+server 폴더에서 실행:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --module services.inference --repeat 5 --no-load
+
+매번 새 프로세스에서 import해 콜드 스타트 시간을 측정하고,
+--no-load가 없으면 마지막 프로세스에서 모델별 로드 시간과 RSS 증가량도 측정합니다.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+def run_worker(module, load):
+    from services.models import _rss_mb
+
+    start = time.perf_counter()
+    __import__(module)
+    import_time = time.perf_counter() - start
+    result = {
+        "import_s": import_time,
+        "import_rss_mb": _rss_mb(),
+        "torch_imported": "torch" in sys.modules,
+    }
+
+    if load:
+        from services.inference import load_models
+        from services.models import registry
+
+        start = time.perf_counter()
+        load_models()
+        result["load_s"] = time.perf_counter() - start
+        result["loaded_rss_mb"] = _rss_mb()
+        result["models"] = registry.stats()
+    print(json.dumps(result))
+
+
+def spawn(module, load):
+    command = [sys.executable, "-m", "benchmarks.bench_startup", "--worker", module]
+    if load:
+        command.append("--load")
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="app", help="import할 모듈")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-load", action="store_true", help="모델 로드 생략")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--load", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.load)
+        return
+
+    runs = [spawn(args.module, False) for _ in range(args.repeat)]
+    best = min(runs, key=lambda r: r["import_s"])
+    times = ", ".join(f"{r['import_s']:.2f}" for r in runs)
+    print(
+        f"import {args.module}: best {best['import_s']:.2f}s (runs: {times}), "
+        f"RSS {best['import_rss_mb']:.0f} MB, torch imported: {best['torch_imported']}"
+    )
+    if args.no_load:
+        return
+
+    loaded = spawn(args.module, True)
+    print(
+        f"load models: {loaded['load_s']:.1f}s, RSS {loaded['import_rss_mb']:.0f} → {loaded['loaded_rss_mb']:.0f} MB"
+    )
+    for name, info in loaded["models"].items():
+        print(
+            f"  {name:<16} {info.get('load_seconds', 0):>6.1f}s {info.get('rss_delta_mb', 0):>8.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+오프라인 벤치마크용 외부 서비스 대역 (뉴스 검색 / 기사 / 번역 / Gemini)
+
+fixtures/factcheck_corpus.json에 기록된 응답을 그대로 돌려줍니다.
+
+- GET  /search?q=...&start=N  : 검색어의 모든 단어가 들어간 기사 목록 (Google 뉴스 검색 결과 형식)
+- GET  /article/<id>          : 기사 HTML
+- POST /translate             : Google Translation API v2 형식 응답 (기록에 없는 문장은 원문 그대로)
+- FixtureGemini               : generate_content()가 기록된 Gemini 응답을 반환
+                                (프롬프트의 댓글 목록에 맞춰 잘라서 반환 가능)
+- FixtureEncoder              : KR-SBERT 대신 쓰는 결정적 문장 임베딩 (모델 다운로드 없이 테스트용)
+- FixtureNLI                  : NLI 모델 대신 쓰는 결정적 분류기 (predict_nli_pairs와 같은 형태)
+
+latency를 주면 응답마다 그만큼 지연시켜 네트워크 왕복을 흉내 냅니다.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import http.server
+from html import escape
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures", "factcheck_corpus.json"
+)
+
+
+def load_corpus(path: str = FIXTURE_PATH) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class FixtureGemini:
+    """
+    model_gemini 대체 객체
+
+    comments(기록된 응답의 댓글 목록)를 주면 프롬프트의 [댓글 목록]을 읽어
+    그 댓글들의 기록된 결과만 프롬프트 안 번호로 돌려줍니다. (청크 단위 요청 대응)
+    comments가 없으면 프롬프트와 관계없이 기록된 응답을 그대로 반환합니다.
+
+    - latency + 출력 토큰 수 * token_latency 만큼 지연
+    - max_output_tokens를 넘는 출력은 잘라서 반환 (실제 모델처럼 JSON이 깨짐)
+    - fail_rate 비율로 예외 발생 (seed로 재현 가능)
+    """
+
+    def __init__(
+        self,
+        response_text: str,
+        latency: float = 0.0,
+        comments: list[str] | None = None,
+        token_latency: float = 0.0,
+        max_output_tokens: int = 0,
+        fail_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.response_text = response_text
+        self.latency = latency
+        self.token_latency = token_latency
+        self.max_output_tokens = max_output_tokens
+        self.fail_rate = fail_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+        self.records = None
+        if comments is not None:
+            recorded = json.loads(response_text.strip().strip("`").lstrip("json"))
+            entries = {item["index"]: item for item in recorded["comments_data"]}
+            self.summary = recorded.get("video_summary", "")
+            self.records = {
+                comment.strip(): entries.get(i, {"index": i, "claims": []})
+                for i, comment in enumerate(comments)
+            }
+
+    def generate_content(self, prompt):
+        with self.lock:
+            self.calls += 1
+            fail = self.random.random() < self.fail_rate
+            if fail:
+                self.failures += 1
+        text = self.response_text
+        if self.records is not None:
+            text = self._respond(prompt)
+        # 들여쓴 JSON + 한국어 기준 대략 3글자당 1토큰
+        tokens = len(text) // 3 + 1
+        if self.max_output_tokens and tokens > self.max_output_tokens:
+            text = text[: self.max_output_tokens * 3]
+            tokens = self.max_output_tokens
+        time.sleep(self.latency + tokens * self.token_latency)
+        if fail:
+            raise RuntimeError("fixture gemini failure")
+        return SimpleNamespace(text=text)
+
+    def _respond(self, prompt):
+        block = prompt.split("[댓글 목록]\n", 1)[1].split("\n\n너는", 1)[0]
+        comments_data = []
+        for line in re.split(r"\n(?=\d+\. \")", block):
+            number, comment = line.split(". ", 1)
+            record = self.records.get(comment[1:-1], {"claims": []})
+            if record["claims"]:
+                comments_data.append({**record, "index": int(number)})
+        # 요약을 만들지 말라는 요청이면 빈 문자열
+        summary = "" if 'video_summary는 빈 문자열("")로' in prompt else self.summary
+        return json.dumps(
+            {"video_summary": summary, "comments_data": comments_data},
+            ensure_ascii=False,
+            indent=2,
+        )
+
+
+class FixtureEncoder:
+    """
+    embedding 모델 대체 객체 (SentenceTransformer.encode와 같은 형태)
+
+    글자 bigram을 해시한 dim차원 벡터를 정규화해 반환하므로, 글자가 많이 겹치는 문장일수록
+    코사인 유사도가 높습니다. 같은 문장은 항상 같은 벡터입니다.
+    """
+
+    def __init__(self, dim: int = 64):
+        self.dim = dim
+        self.calls = 0
+        self.sentences = 0
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, sentences, convert_to_tensor=False, **kwargs):
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+        self.calls += 1
+        self.sentences += len(sentences)
+        vectors = np.zeros((len(sentences), self.dim), dtype=np.float32)
+        for row, sentence in zip(vectors, sentences):
+            text = f" {sentence} "
+            for i in range(len(text) - 1):
+                digest = hashlib.blake2b(text[i : i + 2].encode(), digest_size=4)
+                row[int.from_bytes(digest.digest(), "little") % self.dim] += 1.0
+            norm = np.linalg.norm(row)
+            if norm:
+                row /= norm
+        return vectors[0] if single else vectors
+
+
+class FixtureNLI:
+    """
+    NLI 모델 대체 객체 (backends의 TorchNLIModel / OnnxNLIModel과 같은 형태)
+
+    tokenizer는 글자를 코드값으로 바꾸고, predict는 입력을 해시한 값으로 확률 분포를 만듭니다.
+    같은 입력은 배치 구성과 관계없이 항상 같은 분포입니다. (batches: predict 호출별 입력 수)
+    """
+
+    labels = ["contradiction", "neutral", "entailment"]
+
+    def __init__(self):
+        self.batches = []
+
+    def tokenizer(self, texts, truncation=True, max_length=512):
+        ids = [[ord(c) for c in text] for text in texts]
+        if truncation:
+            ids = [row[:max_length] for row in ids]
+        return {"input_ids": ids}
+
+    def predict(self, input_ids):
+        self.batches.append(len(input_ids))
+        probs = []
+        for row in input_ids:
+            digest = hashlib.blake2b(np.asarray(row, dtype=np.int64).tobytes()).digest()
+            logits = np.frombuffer(digest[:12], dtype=np.int32).astype(np.float64)
+            logits = logits / 2**30
+            exp = np.exp(logits - logits.max())
+            probs.append((exp / exp.sum()).tolist())
+        return probs
+
+
+class FixtureServer:
+    def __init__(self, corpus: dict, latency: float = 0.0):
+        self.corpus = corpus
+        self.latency = latency
+        self.requests = {"search": 0, "article": 0, "translate": 0}
+        self.lock = threading.Lock()
+        self.httpd = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._handler_class()
+        )
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def count(self, name: str):
+        with self.lock:
+            self.requests[name] += 1
+
+    def search_page(self, query: str, start: int = 0) -> str:
+        terms = query.split()
+        matched = [
+            article
+            for article in self.corpus["articles"]
+            if all(
+                term in article["title"]
+                or term in article["body"]
+                or term in article["keywords"]
+                for term in terms
+            )
+        ][start : start + 10]
+        items = "".join(
+            f'<div data-news-doc-id="{article["id"]}"><a href="{self.url}/article/{article["id"]}">'
+            f'<div role="heading" aria-level="3">{escape(article["title"])}</div></a></div>'
+            for article in matched
+        )
+        return f"<html><body>{items}</body></html>"
+
+    def article_page(self, article_id: int) -> str | None:
+        for article in self.corpus["articles"]:
+            if article["id"] == article_id:
+                # 문장마다 한 문단
+                paragraphs = "".join(
+                    f"<p>{escape(line)}</p>"
+                    for line in re.split(r"(?<=\.) ", article["body"])
+                )
+                return (
+                    f"<html><head><meta charset='utf-8'><title>{escape(article['title'])}</title></head>"
+                    f"<body><article><h1>{escape(article['title'])}</h1>{paragraphs}</article></body></html>"
+                )
+        return None
+
+    def translate(self, payload: dict) -> dict:
+        texts = payload["q"] if isinstance(payload["q"], list) else [payload["q"]]
+        translations = self.corpus["translations"]
+        return {
+            "data": {
+                "translations": [
+                    {"translatedText": translations.get(text, text)} for text in texts
+                ]
+            }
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                time.sleep(server.latency)
+                url = urlparse(self.path)
+                if url.path == "/search":
+                    server.count("search")
+                    params = parse_qs(url.query)
+                    html = server.search_page(
+                        params.get("q", [""])[0], int(params.get("start", ["0"])[0])
+                    )
+                elif url.path.startswith("/article/"):
+                    server.count("article")
+                    html = server.article_page(int(url.path.rsplit("/", 1)[1]))
+                else:
+                    html = None
+                if html is None:
+                    self.send_error(404)
+                    return
+                self._send(html.encode("utf-8"), "text/html; charset=utf-8")
+
+            def do_POST(self):
+                time.sleep(server.latency)
+                server.count("translate")
+                length = int(self.headers.get("Content-Length", "0"))
+                payload = json.loads(self.rfile.read(length))
+                body = json.dumps(server.translate(payload), ensure_ascii=False)
+                self._send(body.encode("utf-8"), "application/json; charset=utf-8")
+
+            def _send(self, body, content_type):
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
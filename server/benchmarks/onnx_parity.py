@@ -0,0 +1,82 @@
+"""
+ONNX(int8) 백엔드 정확도 비교: PyTorch fp32 결과와 같은 판단을 내리는지 확인
+
+server 폴더에서 실행:
+    python -m benchmarks.onnx_parity
+    python -m benchmarks.onnx_parity --fp32 --min-agreement 0.95
+
+NLI 라벨 일치율이 --min-agreement 미만이거나 임베딩 코사인 유사도가
+--min-cosine 미만이면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from services.backends import (
+    EMBEDDING_MODEL_NAME,
+    NLI_MODEL_NAME,
+    ONNX_MODEL_DIR,
+    OnnxNliModel,
+    OnnxSentenceEncoder,
+    TorchNliModel,
+    predict_nli_pairs,
+)
+from benchmarks.samples import NLI_PAIRS, SENTENCES
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--fp32", action="store_true", help="양자화하지 않은 ONNX 모델 비교"
+    )
+    parser.add_argument("--min-agreement", type=float, default=0.9)
+    parser.add_argument("--min-cosine", type=float, default=0.98)
+    args = parser.parse_args()
+    quantize = not args.fp32
+    failed = False
+
+    # 1. NLI 라벨 일치율
+    torch_results = predict_nli_pairs(TorchNliModel(NLI_MODEL_NAME), NLI_PAIRS)
+    onnx_results = predict_nli_pairs(
+        OnnxNliModel(NLI_MODEL_NAME, ONNX_MODEL_DIR, quantize), NLI_PAIRS
+    )
+    agree = 0
+    for (premise, hypothesis), t, o in zip(NLI_PAIRS, torch_results, onnx_results):
+        same = t["label"] == o["label"]
+        agree += same
+        if not same:
+            print(
+                f"  mismatch: {hypothesis!r} torch={t['label']}({t['confidence']}) onnx={o['label']}({o['confidence']})"
+            )
+    agreement = agree / len(NLI_PAIRS)
+    print(f"NLI label agreement: {agree}/{len(NLI_PAIRS)} ({agreement:.1%})")
+    failed |= agreement < args.min_agreement
+
+    # 2. 임베딩 코사인 유사도 및 유사도 순위 일치
+    from sentence_transformers import SentenceTransformer
+
+    torch_emb = SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu").encode(
+        SENTENCES
+    )
+    onnx_emb = OnnxSentenceEncoder(
+        EMBEDDING_MODEL_NAME, ONNX_MODEL_DIR, quantize
+    ).encode(SENTENCES)
+    cos = np.sum(torch_emb * onnx_emb, axis=1) / (
+        np.linalg.norm(torch_emb, axis=1) * np.linalg.norm(onnx_emb, axis=1)
+    )
+    rank_same = np.array_equal(
+        np.argsort(-(torch_emb[1:] @ torch_emb[0])),
+        np.argsort(-(onnx_emb[1:] @ onnx_emb[0])),
+    )
+    print(f"embedding cosine(torch, onnx): min={cos.min():.4f} mean={cos.mean():.4f}")
+    print(f"similarity ranking identical: {rank_same}")
+    failed |= cos.min() < args.min_cosine
+
+    print("FAIL" if failed else "OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+벤치마크/정확도 비교에 쓰는 고정 예시 문장
+"""
+
+PREMISES = [
+    "Baek Jong-won announced that he would stop all broadcasting activities.",
+    "The Korea Exchange approved the listing of The Born Korea on the KOSPI market.",
+    "The company said the agricultural sprayer used in the video was a new product.",
+    "Shares of The Born Korea fell more than 30 percent from the IPO price.",
+    "Franchise owners complained that sales dropped after the controversy began.",
+    "Police opened an investigation into alleged violations of the Food Sanitation Act.",
+]
+HYPOTHESES = [
+    "Baek Jong-won stopped appearing on TV.",
+    "The Born Korea is listed on the KOSPI.",
+    "Baek Jong-won said the pesticide container was new.",
+    "The Born Korea stock price went up.",
+    "Franchise sales increased after the controversy.",
+]
+
+
+def make_pairs(n):
+    pairs = []
+    for i in range(n):
+        premise = PREMISES[i % len(PREMISES)]
+        hypothesis = HYPOTHESES[(i // len(PREMISES)) % len(HYPOTHESES)]
+        # 길이가 서로 다르도록 일부 문장은 반복해서 늘림
+        pairs.append((" ".join([premise] * (1 + i % 3)), hypothesis))
+    return pairs
+
+
+# (증거 문장, 주장) 고정 세트
+NLI_PAIRS = [
+    (
+        "Baek Jong-won announced that he would stop all broadcasting activities.",
+        "Baek Jong-won stopped appearing on TV.",
+    ),
+    (
+        "Baek Jong-won announced that he would stop all broadcasting activities.",
+        "Baek Jong-won started a new TV show.",
+    ),
+    (
+        "The Born Korea was listed on the KOSPI market in November last year.",
+        "The Born Korea is listed on the KOSPI.",
+    ),
+    (
+        "The Born Korea was listed on the KOSPI market in November last year.",
+        "The Born Korea is listed on the KOSDAQ.",
+    ),
+    (
+        "Shares of The Born Korea fell more than 30 percent from the IPO price.",
+        "The Born Korea stock price went up.",
+    ),
+    (
+        "Shares of The Born Korea fell more than 30 percent from the IPO price.",
+        "The Born Korea stock price dropped.",
+    ),
+    (
+        "Baek said in the video that the agricultural sprayer was a new product.",
+        "Baek Jong-won said the pesticide container was new.",
+    ),
+    (
+        "Franchise owners complained that sales dropped after the controversy.",
+        "Franchise sales increased after the controversy.",
+    ),
+    (
+        "Police opened an investigation into alleged violations of the Food Sanitation Act.",
+        "The police are investigating The Born Korea.",
+    ),
+    (
+        "The company apologized three times for the series of controversies.",
+        "The company never apologized.",
+    ),
+    (
+        "Yeondon's annual sales are about 1.3 billion won.",
+        "Yeondon makes 1.3 billion won a year.",
+    ),
+    (
+        "Baek Jong-won is married to actress So Yoo-jin.",
+        "Baek Jong-won married So Yoo-jin.",
+    ),
+    (
+        "Baek Jong-won does not hold a chef's license.",
+        "Baek Jong-won has a cooking license.",
+    ),
+    (
+        "The broadcaster said it would air episodes that were already filmed.",
+        "The broadcaster cancelled all filmed episodes.",
+    ),
+    (
+        "The Born Korea said it would support franchise owners with 30 billion won.",
+        "The Born Korea announced support for franchisees.",
+    ),
+    (
+        "The weather in Seoul was sunny on Friday.",
+        "Baek Jong-won stopped appearing on TV.",
+    ),
+]
+
+# 임베딩 비교용 한국어 문장
+SENTENCES = [
+    "백종원 더본코리아 대표가 방송 활동을 중단한다고 밝혔다.",
+    "더본코리아 주가는 공모가 대비 30% 넘게 하락했다.",
+    "백종원은 농약통이 새 제품이라고 말했다.",
+    "가맹점주들은 논란 이후 매출이 줄었다고 호소했다.",
+    "경찰은 식품위생법 위반 혐의로 수사에 착수했다.",
+    "서울은 금요일 맑은 날씨를 보였다.",
+]
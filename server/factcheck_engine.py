@@ -1,18 +1,20 @@
 from services.data_models import CoreSentence, Claim
-from services.api import translate_text, translate_text_bulk
+from services.api import translate_text_bulk
 from services.inference import (
-    rank_keywords,
-    find_top_k_answers_regex,
-    find_top_k_answers_regex_cache,
-    analyze_claim_with_evidence,
+    encode,
+    rank_keywords_batch,
+    select_top_k_sentences,
+    encode_sentence_lists,
+    analyze_claim_with_evidence_pairs,
 )
-from services.collector import collect_data, cache_articles
+from services.collector import cache_articles
+from services.search_planner import search_planner
+from services.video_session import video_sessions
 import math
 
-from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from typing import List
 from tools.log_utils import logger
-import time
+from tools.metrics import log, span
 
 
 class CommentFactCheck:
@@ -22,109 +24,235 @@ class CommentFactCheck:
         keywords: List[str],
         video_ctx: dict | None = None,
         video_summary: str | None = None,
+        session=None,
     ):
         self.claim = Claim(comment, keywords)
         self.video_ctx = video_ctx or {}
-        self.video_summary = video_summary
+        self.session = session  # 같은 영상의 요청끼리 공유하는 VideoSession
+        # 요약문이 없으면 세션에 저장된 요약문 사용
+        self.video_summary = video_summary or video_sessions.summary(session)
+        self.ranked_keywords = None
         self.best_article = None
         self.articles = None
         self.best_sentence = None
+        self.timings = {}  # 마지막 분석의 단계별 소요 시간(초)
 
     def analyze(self):
-        print("[CommentFactCheck] Analyzing comment...\n", self.claim.text)
-        # 전체 시작 시간
-        start_total = time.time()
-
-        # 1. 키워드 추출 → 기사 수집
-        start = time.time()
-        self.articles = self._get_related_articles()
-        end = time.time()
-        print(f"[1] 기사 수집 시간: {end - start:.3f}초")
-
-        # 2. 주장 번역
-        start = time.time()
-        self.claim.text_en = translate_text(self.claim.text)
-        end = time.time()
-        print(f"[2] 주장 번역 시간: {end - start:.3f}초")
-
-        # 3. 핵심 문장 추출 및 번역
-        start = time.time()
-        self._extract_core_sentences()
-        end = time.time()
-        print(f"[3] 핵심 문장 처리 시간: {end - start:.3f}초")
-
-        # 4. NLI 수행
-        start = time.time()
-        self._nli_claim_with_core_sentences()
-        end = time.time()
-        print(f"[4] NLI 수행 시간: {end - start:.3f}초")
-
-        # 5. 점수 계산 및 대표 기사 선택
-        start = time.time()
-        self.score = self._calculate_score()
-        self.best_article = self._get_best_article()
-        end = time.time()
-        print(f"[5] 점수 계산 및 기사 선택 시간: {end - start:.3f}초")
-
-        # 로그 저장
-        articles = [article[1] for article in self.articles]
-        logger.log_claim_analysis(self.claim, articles)
-
-        # 전체 실행 시간
-        end_total = time.time()
-        print(f"[Total] 전체 분석 시간: {end_total - start_total:.3f}초")
-
-    def _get_related_articles(self):
-        articles = []
-        ranked_keywords = rank_keywords(self.claim.keywords, self.video_summary)
-        for k in range(len(ranked_keywords), 0, -1):
-            keyword_subset = ranked_keywords[:k]  # 상위 k개만 유지
-            print(f"\nkeyword_subset:{keyword_subset}\n")
-            articles = collect_data(keyword_subset)
-            if articles:
-                self.claim.keywords_used = keyword_subset
-                break
+        CommentFactCheck.analyze_batch([self])
 
-        return articles
+    @staticmethod
+    def analyze_batch(factcheckers: List["CommentFactCheck"]):
+        """
+        여러 주장을 단계별로 묶어서 분석합니다.
+        번역, 임베딩, NLI를 주장마다 따로 호출하지 않고 단계마다 한 번씩 호출합니다.
+        단일 주장 분석(analyze)도 이 경로를 그대로 사용합니다.
+        """
+        timings = {}  # 단계별 소요 시간(초)
+        with span("total", claims=len(factcheckers)) as total:
+            # 1. 키워드 추출 → 기사 수집
+            with span("collect") as stage:
+                CommentFactCheck._collect_batch(factcheckers)
+            timings["collect"] = stage.duration
+
+            # 2. 핵심 문장 추출
+            with span("extract") as stage:
+                CommentFactCheck._extract_core_sentences_batch(factcheckers)
+            timings["extract"] = stage.duration
+
+            # 3. 주장 및 핵심 문장 번역
+            with span("translate") as stage:
+                CommentFactCheck._translate_batch(factcheckers)
+            timings["translate"] = stage.duration
+
+            # 4. NLI 수행
+            with span("nli") as stage:
+                CommentFactCheck._nli_batch(factcheckers)
+            timings["nli"] = stage.duration
+
+            # 5. 점수 계산 및 대표 기사 선택
+            with span("score") as stage:
+                for factchecker in factcheckers:
+                    factchecker.score = factchecker._calculate_score()
+                    factchecker.best_article = factchecker._get_best_article()
+            timings["score"] = stage.duration
+
+            # 로그 저장, 문장 임베딩까지 채워진 기사를 영상 세션에 저장
+            for factchecker in factcheckers:
+                articles = [article[1] for article in factchecker.articles]
+                logger.log_claim_analysis(factchecker.claim, articles)
+            CommentFactCheck._remember_articles(factcheckers)
+        timings["total"] = total.duration
 
-    def _extract_core_sentences(self):
-        print("[CommentFactCheck] Extracting sentences and translating...")
+        log(
+            "factcheck_engine.py",
+            f"{len(factcheckers)}개 주장 분석 "
+            + " ".join(f"{name}={sec * 1000:.1f}ms" for name, sec in timings.items()),
+        )
+        for factchecker in factcheckers:
+            factchecker.timings = dict(timings)
+
+    @staticmethod
+    def prefetch_batch(factcheckers: List["CommentFactCheck"], proceed=None) -> bool:
+        """
+        근거 준비 단계(키워드 순위 → 기사 수집 → 기사 문장 임베딩)만 실행해 영상 세션에 저장합니다.
+        이후 같은 주장의 분석은 세션의 기사와 문장 임베딩을 그대로 쓰고
+        핵심 문장 선택, 번역, NLI만 실행합니다.
+
+        Args:
+            proceed (callable, optional): 단계 사이에 호출, False를 반환하면 중단
+
+        Returns:
+            bool: 끝까지 실행했는지 여부
+        """
+        with span("prefetch", claims=len(factcheckers)) as total:
+            CommentFactCheck._collect_batch(factcheckers)
+            if proceed is not None and not proceed():
+                return False
+            CommentFactCheck._embed_articles(factcheckers)
+            CommentFactCheck._remember_articles(factcheckers)
+        log(
+            "factcheck_engine.py",
+            f"{len(factcheckers)}개 주장 근거 준비 {total.duration * 1000:.1f}ms",
+        )
+        return True
 
-        core_sentences = []
+    @staticmethod
+    def _collect_batch(factcheckers: List["CommentFactCheck"]):
+        ranked_keywords = rank_keywords_batch(
+            [factchecker.claim.keywords for factchecker in factcheckers],
+            [factchecker.video_summary for factchecker in factcheckers],
+            CommentFactCheck._summary_embeddings(factcheckers),
+        )
+        for factchecker, ranked in zip(factcheckers, ranked_keywords):
+            factchecker.ranked_keywords = ranked
+            factchecker.articles = factchecker._get_related_articles(ranked)
 
-        # 1. 핵심 문장 추출
-        for i, article in enumerate(self.articles):
-            if article[3] is None:
-                sentences, embeddings = find_top_k_answers_regex(
-                    self.claim.text, article[2]
+    @staticmethod
+    def _remember_articles(factcheckers: List["CommentFactCheck"]):
+        for factchecker in factcheckers:
+            if factchecker.session is not None and factchecker.articles:
+                video_sessions.put_articles(
+                    factchecker.session,
+                    factchecker.ranked_keywords,
+                    factchecker.claim.keywords_used,
+                    factchecker.articles,
                 )
-                article[3] = embeddings.tolist()
+
+    @staticmethod
+    def _summary_embeddings(factcheckers: List["CommentFactCheck"]):
+        """
+        세션에 저장된 요약문 임베딩을 모으고, 없으면 한 번에 계산해 세션에 저장합니다.
+
+        Returns:
+            dict[str, np.ndarray]: 요약문 → 임베딩
+        """
+        embeddings = {}
+        missing = {}  # 요약문 → 임베딩이 없는 세션들
+        for factchecker in factcheckers:
+            session, summary = factchecker.session, factchecker.video_summary
+            if session is None or not summary or summary in embeddings:
+                continue
+            embedding = video_sessions.summary_embedding(session, summary)
+            if embedding is not None:
+                embeddings[summary] = embedding
             else:
-                sentences = find_top_k_answers_regex_cache(
-                    self.claim.text, article[2], article[3]
-                )
+                missing.setdefault(summary, []).append(session)
+        missing = {s: v for s, v in missing.items() if s not in embeddings}
+        if missing:
+            for (summary, sessions), embedding in zip(
+                missing.items(), encode(list(missing))
+            ):
+                embeddings[summary] = embedding
+                for session in sessions:
+                    video_sessions.set_summary_embedding(session, summary, embedding)
+        return embeddings
 
-            for sentence, score in sentences:
-                core_sentences.append(sentence)
-                core_sentence = CoreSentence(sentence, "", score)
-                core_sentence.article_idx = i
-                self.claim.core_sentences.append(core_sentence)
+    def _get_related_articles(self, ranked_keywords: List[str]):
+        # 같은 영상에서 같은 키워드로 이미 수집한 기사가 있으면 그대로 사용
+        found = video_sessions.articles(self.session, ranked_keywords)
+        if found is not None:
+            self.claim.keywords_used, articles = found
+            return articles
+        # 상위 k개, k-1개, ... 키워드로 동시에 검색해 결과가 있는 가장 큰 부분집합 사용
+        subsets = [ranked_keywords[:k] for k in range(len(ranked_keywords), 0, -1)]
+        keyword_subset, articles = search_planner.search(subsets)
+        if articles:
+            self.claim.keywords_used = keyword_subset
+        return articles
 
-        # 2. 문장 번역
-        sentences_en = translate_text_bulk(core_sentences)
+    @staticmethod
+    def _extract_core_sentences_batch(factcheckers: List["CommentFactCheck"]):
+        # 1. 임베딩이 없는 기사 문장을 한 번에 임베딩
+        CommentFactCheck._embed_articles(factcheckers)
 
-        # 3. 번역 결과 저장
-        for i, core_sentence in enumerate(self.claim.core_sentences):
-            core_sentence.sentence_en = sentences_en[i]
+        # 2. 주장 임베딩도 한 번에 계산
+        claim_embeddings = encode(
+            [factchecker.claim.text for factchecker in factcheckers]
+        )
 
-    def _nli_claim_with_core_sentences(self):
-        for core_sentence in self.claim.core_sentences:
-            res = analyze_claim_with_evidence(
-                self.claim.text_en, core_sentence.sentence_en
+        # 3. 주장별 핵심 문장 추출 (기사 전체를 한 번에 계산)
+        for factchecker, claim_embedding in zip(factcheckers, claim_embeddings):
+            top_k = select_top_k_sentences(
+                claim_embedding,
+                [article[2] for article in factchecker.articles],
+                [article[3] for article in factchecker.articles],
             )
+            for i, sentences in enumerate(top_k):
+                article = factchecker.articles[i]
+                offsets = article[4] if len(article) > 4 else None
+                for sentence, score, sentence_index in sentences:
+                    core_sentence = CoreSentence(sentence, "", score)
+                    core_sentence.article_idx = i
+                    core_sentence.sentence_index = sentence_index
+                    if offsets:
+                        # 본문에서의 [시작, 끝] 위치 (근거 문장 표시용)
+                        core_sentence.offset = offsets[sentence_index]
+                    factchecker.claim.core_sentences.append(core_sentence)
+
+    @staticmethod
+    def _embed_articles(factcheckers: List["CommentFactCheck"]):
+        # 세션에서 가져온 기사는 이미 임베딩이 있으므로 건너뜀
+        uncached = [
+            article
+            for factchecker in factcheckers
+            for article in factchecker.articles
+            if article[3] is None
+        ]
+        embeddings = encode_sentence_lists([article[2] for article in uncached])
+        for article, embedding in zip(uncached, embeddings):
+            article[3] = embedding
+
+    @staticmethod
+    def _translate_batch(factcheckers: List["CommentFactCheck"]):
+        # 주장과 핵심 문장을 한 번의 API 호출로 번역
+        texts = [factchecker.claim.text for factchecker in factcheckers]
+        for factchecker in factcheckers:
+            texts.extend(cs.sentence for cs in factchecker.claim.core_sentences)
+        texts_en = iter(translate_text_bulk(texts))
+
+        for factchecker in factcheckers:
+            factchecker.claim.text_en = next(texts_en)
+        for factchecker in factcheckers:
+            for core_sentence in factchecker.claim.core_sentences:
+                core_sentence.sentence_en = next(texts_en)
+
+    @staticmethod
+    def _nli_batch(factcheckers: List["CommentFactCheck"]):
+        core_sentences = [
+            core_sentence
+            for factchecker in factcheckers
+            for core_sentence in factchecker.claim.core_sentences
+        ]
+        pairs = [
+            (factchecker.claim.text_en, core_sentence.sentence_en)
+            for factchecker in factcheckers
+            for core_sentence in factchecker.claim.core_sentences
+        ]
+        results = analyze_claim_with_evidence_pairs(pairs)
+        for core_sentence, res in zip(core_sentences, results):
             core_sentence.nli_result["confidence"] = res["confidence"]
             core_sentence.nli_result["label"] = res["label"]
-        return
+            core_sentence.nli_result["probs"] = res["probs"]
 
     def _calculate_score(self):
         score = 0
@@ -133,13 +261,13 @@ class CommentFactCheck:
             if core_sentence.nli_result["label"] == "entailment":
                 score += (
                     core_sentence.nli_result["confidence"]
-                    * core_sentence.similarity_score.item()
+                    * core_sentence.similarity_score
                 )
                 has_result = True
             elif core_sentence.nli_result["label"] == "contradiction":
                 score -= (
                     core_sentence.nli_result["confidence"]
-                    * core_sentence.similarity_score.item()
+                    * core_sentence.similarity_score
                 )
                 has_result = True
         if not has_result:
@@ -165,7 +293,7 @@ class CommentFactCheck:
                 arg_max = core_sentence.article_idx
                 self.best_sentence = core_sentence.sentence
         article_index = arg_max
-        return self.articles[article_index] if self.articles else self.articles[0]
+        return self.articles[article_index] if self.articles else None
 
     def cache_result(self):
         cache_articles(self.claim.keywords, self.articles)
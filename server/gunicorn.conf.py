@@ -0,0 +1,60 @@
+"""
+운영 서버 설정 (gunicorn, Linux)
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+preload_app으로 앱을 import한 뒤 마스터 프로세스에서 모델을 한 번만 로드하고 fork하므로
+모델 가중치는 워커 프로세스끼리 copy-on-write로 공유됩니다.
+MODEL_WARMUP=0이면 미리 로드하지 않고 각 워커가 첫 요청에서 필요한 모델만 로드합니다.
+(Gemini만 쓰는 워커는 모델을 로드하지 않음)
+"""
+
+import gc
+import os
+
+cpu_count = os.cpu_count() or 1
+
+bind = os.getenv("WEB_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_WORKERS", str(max(1, cpu_count // 2))))
+# gthread: /jobs/<id>/events(SSE) 스트림 하나가 열려 있는 동안 스레드 하나를 차지함
+# (워커당 JOB_MAX_STREAMS개, 기본 threads의 절반까지만 열고 나머지는 503 → 폴링,
+#  스트림은 JOB_STREAM_MAX_SECONDS 후 timeout 이벤트로 종료)
+threads = int(os.getenv("WEB_THREADS", "4"))
+worker_class = "gthread"
+timeout = int(os.getenv("WEB_TIMEOUT", "180"))
+preload_app = True
+
+# 워커가 여럿이면 워커마다 파싱 프로세스를 두지 않고 스레드 풀에서 파싱
+# (워커 수 x 파싱 프로세스 수만큼 프로세스가 늘어나지 않도록, 앱 import 전에 설정)
+os.environ.setdefault("CRAWL_PARSE_PROCESSES", "0" if workers > 1 else "1")
+# 워커가 여럿이면 JSONL 로그를 워커별 파일에 기록 (같은 파일을 여러 워커가 교체/압축하지 않도록)
+os.environ.setdefault("LOG_PER_PROCESS", "1" if workers > 1 else "0")
+
+# 워커끼리 코어를 나눠 쓰도록 워커당 torch intra-op 스레드 수 제한
+torch_threads = int(os.getenv("TORCH_THREADS", str(max(1, cpu_count // workers))))
+
+
+def when_ready(server):
+    from services.inference import MODEL_WARMUP, load_models
+    from services.models import registry
+
+    # 모델은 import 시점에 로드되지 않으므로 fork 전에 마스터에서 명시적으로 로드
+    if MODEL_WARMUP:
+        load_models()
+        for name, info in registry.stats().items():
+            server.log.info(f"model {name}: {info}")
+    # 로드된 모델 객체를 GC 대상에서 빼서 fork 이후 불필요한 페이지 복사를 줄임
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import sys
+    from services.inference import start_warm_up
+
+    # torch를 아직 import하지 않은 워커는 환경변수로 지정 (워커 시작 시 torch import 생략)
+    os.environ["OMP_NUM_THREADS"] = str(torch_threads)
+    if "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(torch_threads)
+    # 워밍업(첫 추론)은 fork 이후 각 워커에서 실행, 끝나면 /ready가 200을 반환
+    start_warm_up()
+    server.log.info(f"worker {worker.pid}: torch threads={torch_threads}")
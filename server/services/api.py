@@ -4,10 +4,18 @@ import json
 import os
 import requests
 import textwrap
+import threading
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from google.api_core.exceptions import ResourceExhausted
-from newspaper import Article
 from urllib.parse import urlencode
 from bs4 import BeautifulSoup
+from services.downloader import ArticleDownloader
+from services.search_cache import SearchCache
+from services.segmenter import split_sentences
+from services.translation_cache import TranslationCache
+from tools.metrics import external_api_errors, log, metrics, span
 
 # gemini-2.5-pro-exp-03-25 할당량 초과 오류로 모델 변경 -> gemini-2.0-flash
 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
@@ -32,30 +40,240 @@ model_gemini = genai.GenerativeModel(
     safety_settings=safety_settings,
 )
 
+# 댓글 일괄 추출: 청크당 예상 토큰 예산 / 최대 댓글 수, 동시 요청 수, 청크별 재시도 횟수
+GEMINI_CHUNK_TOKENS = int(os.getenv("GEMINI_CHUNK_TOKENS", "1500"))
+GEMINI_CHUNK_COMMENTS = int(os.getenv("GEMINI_CHUNK_COMMENTS", "20"))
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "4"))
+GEMINI_RETRIES = int(os.getenv("GEMINI_RETRIES", "1"))
+GEMINI_RETRY_DELAY = float(os.getenv("GEMINI_RETRY_DELAY", "1"))
+# 댓글 하나당 번호/따옴표와 출력 JSON 골격의 예상 토큰 수
+COMMENT_OVERHEAD_TOKENS = 40
+gemini_pool = ThreadPoolExecutor(GEMINI_CONCURRENCY, thread_name_prefix="gemini")
+gemini_extract_chunks = metrics.counter(
+    "gemini_extract_chunks_total",
+    "Comment extraction chunks sent to Gemini (ok, retried, failed)",
+    ["result"],
+)
+gemini_extract_chunks_per_request = metrics.histogram(
+    "gemini_extract_chunks_per_request",
+    "Number of chunks per batch extraction request",
+    buckets=(1, 2, 3, 4, 6, 8, 12, 16),
+)
+
 GOOGLE_API_KEY = os.getenv("GOOGLE_TRANSLATE_API_KEY")
+# 번역 API URL (로컬 스텁 서버로 바꿔서 테스트 가능)
+TRANSLATE_URL = os.getenv(
+    "GOOGLE_TRANSLATE_URL", "https://translation.googleapis.com/language/translate/v2"
+)
+
+# 번역 캐시 (기본 7일 TTL, 재시작 후에도 유지)
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.makedirs(os.path.join(base_dir, "cache"), exist_ok=True)
+translation_cache = TranslationCache(
+    os.getenv(
+        "TRANSLATION_CACHE_DB", os.path.join(base_dir, "cache", "translations.sqlite3")
+    ),
+    ttl=float(os.getenv("TRANSLATION_CACHE_TTL", str(7 * 24 * 3600))),
+    max_memory_items=int(os.getenv("TRANSLATION_CACHE_MEMORY_ITEMS", "50000")),
+    max_disk_items=int(os.getenv("TRANSLATION_CACHE_DISK_ITEMS", "500000")),
+)
+
+# 뉴스 검색 URL (로컬 스텁 서버로 바꿔서 테스트 가능)
+SEARCH_URL = os.getenv("NEWS_SEARCH_URL", "https://www.google.com/search")
+CRAWL_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    )
+}
+# 검색 결과 목록 / 결과 없는 검색어 캐시 (기사 본문 캐시와 별도 TTL)
+search_cache = SearchCache(
+    os.getenv("SEARCH_CACHE_DB", os.path.join(base_dir, "cache", "search.sqlite3")),
+    listing_ttl=float(os.getenv("SEARCH_LISTING_TTL", "3600")),
+    empty_ttl=float(os.getenv("SEARCH_NEGATIVE_TTL", "600")),
+    max_listing_items=int(os.getenv("SEARCH_LISTING_ITEMS", "20000")),
+    max_empty_items=int(os.getenv("SEARCH_NEGATIVE_ITEMS", "10000")),
+)
+downloader = ArticleDownloader(
+    max_workers=int(os.getenv("CRAWL_MAX_WORKERS", "16")),
+    per_host=int(os.getenv("CRAWL_PER_HOST", "2")),
+    timeout=(
+        float(os.getenv("CRAWL_CONNECT_TIMEOUT", "3")),
+        float(os.getenv("CRAWL_READ_TIMEOUT", "5")),
+    ),
+    deadline=float(os.getenv("CRAWL_DEADLINE", "8")),
+    parse_workers=int(os.getenv("CRAWL_PARSE_WORKERS", "0")) or None,
+    parse_processes=os.getenv("CRAWL_PARSE_PROCESSES", "1") == "1",
+)
+
+
+def extract_keywords_batch_llm(comments, video_ctx, n=6, summary=None, client=None):
+    """
+    댓글 목록에서 영상 요약과 댓글별 주장/키워드를 추출합니다.
 
+    - 댓글을 예상 토큰 수(GEMINI_CHUNK_TOKENS) 기준 청크로 나눠 동시에 요청
+      (동시 요청 수는 GEMINI_CONCURRENCY로 제한)
+    - 영상 요약은 첫 청크에서만 생성하고, summary가 주어지면 생성하지 않고 그대로 사용
+    - 실패한 청크만 GEMINI_RETRIES번 다시 요청, 끝내 실패하면 그 청크 댓글은 빈 주장
+    - comments_data의 index는 원래 댓글 위치로 되돌려 반환
 
-def extract_keywords_batch_llm(comments, video_ctx, n=6):
+    Returns:
+        dict: {"summary": str, "claims": [{"index": 댓글 위치, "claims": [...]}, ...],
+               "failed": [추출에 실패한 댓글 위치, ...]}
+    """
+    client = client or model_gemini
+    chunks = chunk_comments(comments, GEMINI_CHUNK_TOKENS, GEMINI_CHUNK_COMMENTS)
+    gemini_extract_chunks_per_request.observe(len(chunks))
+    context = contextvars.copy_context()
+    futures = [
+        gemini_pool.submit(
+            context.copy().run,
+            _extract_chunk,
+            client,
+            chunk,
+            video_ctx,
+            n,
+            summary,
+            # 요약은 첫 청크만 생성 (나머지는 빈 문자열로 출력)
+            summary is None and i == 0,
+        )
+        for i, (_, chunk) in enumerate(chunks)
+    ]
+
+    results = {}
+    summaries = []
+    failed = []
+    for (offset, chunk), future in zip(chunks, futures):
+        parsed = future.result()
+        if parsed is None:
+            failed.extend(range(offset, offset + len(chunk)))
+            continue
+        summaries.append(parsed.get("video_summary") or "")
+        for item in parsed.get("comments_data") or []:
+            index = item.get("index") if isinstance(item, dict) else None
+            # 청크 안의 번호를 벗어난 항목은 버림
+            if not isinstance(index, int) or not 0 <= index < len(chunk):
+                continue
+            results[offset + index] = {**item, "index": offset + index}
+
+    if summary is None:
+        summary = next((s for s in summaries if s), "")
+    if comments and len(failed) == len(comments):
+        return {
+            "summary": summary,
+            "claims": [{"index": i, "claims": []} for i in range(len(comments))],
+            "failed": failed,
+        }
+    if failed:
+        log("api.py", "[extract_keywords_batch_llm] failed comments:", len(failed))
+    return {
+        "summary": summary,
+        "claims": [results[i] for i in sorted(results)],
+        "failed": failed,
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    # 한국어 기준 대략 2글자당 1토큰
+    return len(text) // 2 + 1
+
+
+def chunk_comments(comments, max_tokens: int, max_comments: int = 0):
+    """
+    댓글을 순서대로 이어 붙여 청크의 예상 토큰 수가 max_tokens를 넘지 않도록 나눕니다.
+    댓글 하나의 비용은 입력 + 비슷한 길이의 주장 출력 + JSON 골격으로 추정하고,
+    예산보다 긴 댓글은 혼자 한 청크가 됩니다.
+
+    Returns:
+        list[tuple[int, list[str]]]: (첫 댓글의 원래 위치, 댓글 목록)
+    """
+    chunks = []
+    start, tokens = 0, 0
+    for i, comment in enumerate(comments):
+        cost = 2 * estimate_tokens(comment) + COMMENT_OVERHEAD_TOKENS
+        if i > start and (
+            tokens + cost > max_tokens or (max_comments and i - start >= max_comments)
+        ):
+            chunks.append((start, comments[start:i]))
+            start, tokens = i, 0
+        tokens += cost
+    if start < len(comments) or not chunks:
+        chunks.append((start, comments[start:]))
+    return chunks
+
+
+def _extract_chunk(client, comments, video_ctx, n, summary, with_summary):
+    """청크 하나를 요청, 실패(예외/JSON 오류)하면 이 청크만 다시 요청. 끝내 실패하면 None"""
+    prompt = _extraction_prompt(comments, video_ctx, n, summary, with_summary)
+    for attempt in range(GEMINI_RETRIES + 1):
+        try:
+            with span("llm_extract", comments=len(comments), attempt=attempt):
+                raw = _strip_code_fence(client.generate_content(prompt).text)
+                parsed = json.loads(raw)
+            if not isinstance(parsed, dict):
+                raise ValueError(f"unexpected JSON: {type(parsed).__name__}")
+            log("api.py", "[extract_keywords_batch_llm]\n", raw)
+            gemini_extract_chunks.inc(result="ok" if attempt == 0 else "retried")
+            return parsed
+        except Exception as e:
+            external_api_errors.inc(api="gemini")
+            log("api.py", f"[extract_keywords_batch_llm] Error (try {attempt + 1}):", e)
+            if isinstance(e, ResourceExhausted):
+                time.sleep(GEMINI_RETRY_DELAY * (attempt + 1))
+    gemini_extract_chunks.inc(result="failed")
+    return None
+
+
+def _strip_code_fence(raw):
+    raw = raw.strip()
+    if raw.startswith("```"):
+        lines = raw.splitlines()
+        if lines and lines[0].startswith("```"):
+            lines = lines[1:]
+        if lines and lines[-1].startswith("```"):
+            lines = lines[:-1]
+        raw = "\n".join(lines)
+    return raw.lstrip("json").strip()
+
+
+def _extraction_prompt(comments, video_ctx, n, summary, with_summary):
     title = video_ctx.get("title", "")
     desc = video_ctx.get("description", "")
     hashtags = ", ".join(video_ctx.get("hashtags", []))
 
     comment_block = "\n".join(f'{i}. "{c.strip()}"' for i, c in enumerate(comments))
+    summary_block = f"[요약]\n{summary}\n\n" if summary else ""
+    if summary:
+        summary_rule = (
+            '[요약]을 영상의 주제로 사용하고 video_summary는 빈 문자열("")로 출력'
+        )
+    elif with_summary:
+        summary_rule = (
+            "영상 제목,설명,태그를 참고해서 영상의 주제를 최대 3문장으로 요약"
+        )
+    else:
+        summary_rule = (
+            "영상 제목,설명,태그를 참고해서 영상의 주제를 파악하되 "
+            'video_summary는 빈 문자열("")로 출력'
+        )
 
-    prompt = f"""
+    return f"""
 [영상]
 - 제목: "{title}"
 - 설명: "{desc}"
 - 태그: "{hashtags}"
 
-[댓글 목록]
+{summary_block}[댓글 목록]
 {comment_block}
 
 너는 유튜브 댓글 팩트체크 프로그램에서 객관적이고 검증 가능한 사실만 주장(claim)으로 추출하는 LLM이야.
 이 프로그램에서 키워드는 구글 기사 검색에 사용될 거고 주장은 검색된 기사에서 가장 유사한 3개의 문장과 비교해서 팩트체크를 할거야.
 너의 역할은 아래와 같아:
 
-1) 영상 제목,설명,태그를 참고해서 영상의 주제를 최대 3문장으로 요약
+1) {summary_rule}
 2) 각 댓글에서 주장과 키워드를 추출하고 추출된 주장은 기사의 본문처럼 객관적인 문어체 형식으로 작성
 3) 주장만으로 맥락 파악이 어렵고 어떤거에 관한 내용인지 알기 힘들때 1번에서 요약한 영상 주제를 토대로 주장과 키워드를 완성
 4) 동일한 사실을 표현한 여러 문장은 하나의 주장으로 병합 
@@ -121,40 +339,6 @@ def extract_keywords_batch_llm(comments, video_ctx, n=6):
   ]
 }}"""
 
-    try:
-        resp = model_gemini.generate_content(prompt)
-        raw = resp.text.strip()
-        if raw.startswith("```"):
-            lines = raw.splitlines()
-            if lines and lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].startswith("```"):
-                lines = lines[:-1]
-            raw = "\n".join(lines)
-        raw = raw.lstrip("json").strip()
-
-        try:
-            parsed = json.loads(raw)
-            result = {
-                "summary": parsed.get("video_summary", ""),
-                "claims": parsed.get("comments_data", []),
-            }
-            print("[extract_keywords_batch_llm]\n", raw)
-            return result
-        except json.JSONDecodeError as e:
-            print("[extract_keywords_batch_llm] JSON parse error:", e)
-            print("[extract_keywords_batch_llm] Failed JSON:", raw)
-            return {
-                "summary": "",
-                "claims": [{"index": i, "claims": []} for i in range(len(comments))],
-            }
-    except Exception as e:
-        print("[extract_keywords_batch_llm] Error:", e)
-        return {
-            "summary": "",
-            "claims": [{"index": i, "claims": []} for i in range(len(comments))],
-        }
-
 
 def extract_keywords(
     comment_text: str, num_keywords: int, video_ctx: dict | None = None  # ★ 추가
@@ -197,8 +381,8 @@ def extract_keywords(
         data = json.loads(cleaned)
         return data.get("keywords", [])
     except Exception as e:
-        print("[키워드 추출 JSON 파싱 실패] →", e)
-        print("원문:", raw_output)
+        log("api.py", "[키워드 추출 JSON 파싱 실패] →", e)
+        log("api.py", "원문:", raw_output)
         return []
 
 
@@ -206,50 +390,121 @@ def translate_text(text, target_language="en"):
     """
     Google Cloud Translation API를 호출하여 텍스트를 영어로 번역합니다.
     """
-    url = (
-        f"https://translation.googleapis.com/language/translate/v2?key={GOOGLE_API_KEY}"
-    )
+    return translation_cache.translate(
+        [text],
+        target_language,
+        "html",
+        lambda texts: [_request_translation(texts[0], target_language)],
+    )[0]
+
+
+def _request_translation(text, target_language):
+    url = f"{TRANSLATE_URL}?key={GOOGLE_API_KEY}"
     headers = {"Content-Type": "application/json"}
     payload = {"q": text, "target": target_language}
 
-    response = requests.post(url, headers=headers, json=payload)
+    response = _post_translation(url, headers, payload)
     if response.status_code == 200:
         data = response.json()
         translated_text = data["data"]["translations"][0]["translatedText"]
         return translated_text
     else:
-        print("번역 API 오류:", response.status_code)
+        external_api_errors.inc(api="translate")
+        log("api.py", "번역 API 오류:", response.status_code)
         return None
 
 
-def crawl_article(keyword: list[str], pages: int = 1):
-    base_url = "https://www.google.com/search"
+class SearchCancelled(Exception):
+    """
+    crawl_article 도중 cancel이 설정되어 중단됨
+    """
+
+
+def crawl_article(
+    keyword: list[str],
+    pages: int = 1,
+    search_url: str = SEARCH_URL,
+    cancel: threading.Event | None = None,
+    stored_documents=None,
+):
+    """
+    cancel이 설정되면 다음 요청을 보내기 전에 SearchCancelled를 발생시킵니다.
+    stored_documents(links) → {link: [title, link, sentences, embedding]}가 주어지면
+    이미 저장된 기사는 본문을 다시 받지 않고 저장된 문장/임베딩을 사용합니다.
+    """
+    with span("crawl", keyword=keyword):
+        return _crawl_article(keyword, pages, search_url, cancel, stored_documents)
+
+
+def _crawl_article(keyword, pages, search_url, cancel, stored_documents):
     keyword = " ".join(keyword)
     params = {"q": keyword, "tbm": "nws"}
     query = urlencode(params)
     var_query = "&start={}"
-    query_url = base_url + f"?{query}" + var_query
+    query_url = search_url + f"?{query}" + var_query
 
     # URL 리스트 생성
     urls = [query_url.format(start) for start in range(0, pages * 10, 10)]
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36"
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36"
-        )
-    }
+    # 1. 검색 결과 페이지에서 (제목, 링크) 수집 (캐시된 목록이 있으면 검색 생략)
+    if search_cache.is_empty(search_url, keyword):
+        return []
+    listings = search_cache.get_listings(search_url, keyword, pages)
+    if listings is None:
+        listings = _search_listings(keyword, urls, search_url, cancel)
+        if not listings:
+            return []
+        search_cache.put_listings(search_url, keyword, pages, listings)
+
+    # 2. 기사 본문 동시 다운로드 및 파싱 (deadline 초과 기사는 제외)
+    if cancel is not None and cancel.is_set():
+        raise SearchCancelled(keyword)
+    stored = (
+        stored_documents([link for _, link in listings]) if stored_documents else {}
+    )
+    bodies = downloader.fetch_articles(
+        [link for _, link in listings if link not in stored],
+        headers=CRAWL_HEADERS,
+        cancel=cancel,
+    )
+    if cancel is not None and cancel.is_set():
+        raise SearchCancelled(keyword)
 
     result = []
+    for title, link in listings:
+        if link in stored:
+            result.append(stored[link])
+            continue
+        if link not in bodies:
+            continue
+        body = bodies[link]
+        # 문장 분리 (숫자/약어 보존, 짧은 조각 병합), offset은 근거 문장 표시에 사용
+        segments = split_sentences(body)
+        sentences = [sentence for sentence, _, _ in segments] or [""]
+        offsets = [[start, end] for _, start, end in segments] or [[0, 0]]
+        result.append([title, link, sentences, None, offsets])
+    # [[제목, 링크, 문장들, 임베딩, 문장 offset], ...]
+    return result
 
+
+def _search_listings(keyword, urls, search_url, cancel):
+    listings = []
     for i, url in enumerate(urls):
-        response = requests.get(url, headers=headers)
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled(keyword)
+        try:
+            response = downloader.get(url, headers=CRAWL_HEADERS)
+        except requests.RequestException:
+            external_api_errors.inc(api="news_search")
+            raise
         soup = BeautifulSoup(response.text, "html.parser")
         article = soup.select("div[data-news-doc-id]")
         if not article:
+            # 정상 응답의 첫 페이지에 결과가 없을 때만 기억 (429 등 오류 응답은 제외)
+            if i == 0 and response.ok:
+                search_cache.put_empty(search_url, keyword)
+            elif not response.ok:
+                external_api_errors.inc(api="news_search")
             return []
         for item in article:
             a_tag = item.select_one("a[href]")
@@ -259,39 +514,28 @@ def crawl_article(keyword: list[str], pages: int = 1):
                 else None
             )
             if a_tag and title_div:
-                title = title_div.get_text(strip=True)
-                link = a_tag["href"]
-                # newspaper3k 사용하여 기사 본문 추출
-                try:
-                    article = Article(link, language="ko")
-                    article.download()
-                    article.parse()
-                    body = article.text.strip()
-                    # 문장 분리 (마침표, 물음표, 느낌표 기준으로 분리)
-                    # sentences = re.split(
-                    #     r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s", body
-                    # )
-                    sentences = [s for s in body.split(".") if s.strip()]
-                    if len(sentences) == 0:
-                        sentences = [""]
-                    result.append([title, link, sentences, None])
-                except Exception as e:
-                    print(f"본문 추출 실패: {link}\n→ {e}")
-                    continue
-    # [(제목1,링크1,본문1), (제목2,링크2,본문2)...]
-    return result
+                listings.append((title_div.get_text(strip=True), a_tag["href"]))
+    return listings
 
 
 def translate_text_bulk(texts, target_language="en"):
     """
     Google Cloud Translation API를 호출하여 여러 문장을 한 번에 번역합니다.
+    캐시에 없는 문장만 API로 보냅니다.
     """
     if not texts:
         return []
 
-    url = (
-        f"https://translation.googleapis.com/language/translate/v2?key={GOOGLE_API_KEY}"
+    return translation_cache.translate(
+        texts,
+        target_language,
+        "text",
+        lambda uncached: _request_translation_bulk(uncached, target_language),
     )
+
+
+def _request_translation_bulk(texts, target_language):
+    url = f"{TRANSLATE_URL}?key={GOOGLE_API_KEY}"
     headers = {"Content-Type": "application/json"}
     payload = {
         "q": texts,
@@ -299,10 +543,19 @@ def translate_text_bulk(texts, target_language="en"):
         "format": "text",
     }
 
-    response = requests.post(url, headers=headers, json=payload)
+    response = _post_translation(url, headers, payload)
     if response.status_code == 200:
         data = response.json()
         return [item["translatedText"] for item in data["data"]["translations"]]
     else:
-        print("번역 API 오류:", response.status_code)
+        external_api_errors.inc(api="translate")
+        log("api.py", "번역 API 오류:", response.status_code)
         return [None] * len(texts)
+
+
+def _post_translation(url, headers, payload):
+    try:
+        return requests.post(url, headers=headers, json=payload)
+    except requests.RequestException:
+        external_api_errors.inc(api="translate")
+        raise
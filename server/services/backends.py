@@ -0,0 +1,288 @@
+import os
+import json
+
+import numpy as np
+
+from tools.metrics import log
+
+EMBEDDING_MODEL_NAME = "snunlp/KR-SBERT-V40K-klueNLI-augSTS"
+NLI_MODEL_NAME = "roberta-large-mnli"
+
+# 추론 백엔드: "torch"(기본) 또는 "onnx"(ONNX Runtime, 사용 불가 시 torch로 대체)
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "torch")
+ONNX_MODEL_DIR = os.getenv("ONNX_MODEL_DIR", os.path.join(base_dir, "cache", "onnx"))
+ONNX_QUANTIZE = os.getenv("ONNX_QUANTIZE", "1") == "1"
+
+
+class TorchNliModel:
+    """
+    transformers 파이프라인(PyTorch fp32) 기반 NLI 모델
+    """
+
+    def __init__(self, model_name: str):
+        from transformers import pipeline
+
+        self.pipeline = pipeline(
+            "text-classification", model=model_name, truncation=True, max_length=512
+        )
+        self.tokenizer = self.pipeline.tokenizer
+        config = self.pipeline.model.config
+        self.labels = [config.id2label[i].lower() for i in range(config.num_labels)]
+
+    def predict(self, input_ids: list[list[int]]) -> list[list[float]]:
+        import torch
+
+        model = self.pipeline.model
+        inputs = self.tokenizer.pad({"input_ids": input_ids}, return_tensors="pt")
+        with torch.inference_mode():
+            logits = model(**inputs.to(model.device)).logits
+        return torch.softmax(logits, dim=-1).tolist()
+
+
+class OnnxNliModel:
+    """
+    ONNX Runtime(CPU) 기반 NLI 모델, 파일이 없으면 최초 1회 export (+ 동적 int8 양자화)
+    """
+
+    def __init__(self, model_name: str, model_dir: str, quantize: bool = True):
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        path = _onnx_path(model_dir, model_name, quantize)
+        if not os.path.exists(path):
+            from transformers import AutoModelForSequenceClassification
+
+            model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            _export(model, self.tokenizer, path, "logits", quantize)
+            del model
+
+        config = AutoConfig.from_pretrained(model_name)
+        self.labels = [config.id2label[i].lower() for i in range(config.num_labels)]
+        self.session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def predict(self, input_ids: list[list[int]]) -> list[list[float]]:
+        inputs = self.tokenizer.pad({"input_ids": input_ids}, return_tensors="np")
+        logits = self.session.run(None, _feed(inputs, self.input_names))[0]
+        return _softmax(logits).tolist()
+
+
+class OnnxSentenceEncoder:
+    """
+    ONNX Runtime(CPU) 기반 SentenceTransformer 대체 (encode 인터페이스 호환)
+
+    트랜스포머 부분만 ONNX로 실행하고 pooling/normalize는 numpy로 계산합니다.
+    """
+
+    def __init__(self, model_name: str, model_dir: str, quantize: bool = True):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        path = _onnx_path(model_dir, model_name, quantize)
+        config_path = path + ".json"
+        if not os.path.exists(path) or not os.path.exists(config_path):
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(model_name, device="cpu")
+            with open(config_path, "w", encoding="utf-8") as f:
+                json.dump(_sentence_config(model), f)
+            _export(
+                model[0].auto_model, self.tokenizer, path, "last_hidden_state", quantize
+            )
+            del model
+
+        with open(config_path, "r", encoding="utf-8") as f:
+            self.config = json.load(f)
+        self.session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def get_sentence_embedding_dimension(self):
+        return self.config["dim"]
+
+    def encode(
+        self, sentences, batch_size: int = 32, convert_to_tensor=False, **kwargs
+    ):
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+
+        # SentenceTransformer처럼 길이순으로 정렬해서 배치 구성
+        order = np.argsort([-len(s) for s in sentences], kind="stable")
+        embeddings = np.zeros((len(sentences), self.config["dim"]), dtype=np.float32)
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start : start + batch_size]
+            inputs = self.tokenizer(
+                [sentences[i] for i in batch_idx],
+                padding=True,
+                truncation=True,
+                max_length=self.config["max_seq_length"],
+                return_tensors="np",
+            )
+            hidden = self.session.run(None, _feed(inputs, self.input_names))[0]
+            embeddings[batch_idx] = self._pool(hidden, inputs["attention_mask"])
+
+        if single:
+            embeddings = embeddings[0]
+        if convert_to_tensor:
+            import torch
+
+            return torch.from_numpy(embeddings)
+        return embeddings
+
+    def _pool(self, hidden, attention_mask):
+        if self.config["pooling"] == "cls":
+            pooled = hidden[:, 0]
+        else:
+            mask = attention_mask[..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.config["normalize"]:
+            pooled = pooled / np.clip(
+                np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None
+            )
+        return pooled
+
+
+def predict_nli_pairs(model, pairs, batch_size: int = 16):
+    """
+    (premise, hypothesis) 쌍을 토큰 길이순으로 정렬해 batch_size 단위로 model.predict에 넣습니다.
+    입력 형식은 기존 파이프라인 호출과 같은 "{premise} [SEP] {hypothesis}"입니다.
+
+    Returns:
+        list[dict]: 각 쌍에 대한 {"label", "confidence", "probs"} 리스트 (입력 순서 유지)
+    """
+    if not pairs:
+        return []
+
+    # 패딩 없이 한 번만 토크나이즈한 뒤 길이순으로 정렬
+    texts = [f"{premise} [SEP] {hypothesis}" for premise, hypothesis in pairs]
+    encodings = model.tokenizer(texts, truncation=True, max_length=512)["input_ids"]
+    order = sorted(range(len(texts)), key=lambda i: len(encodings[i]))
+
+    results = [None] * len(texts)
+    for start in range(0, len(order), batch_size):
+        batch_idx = order[start : start + batch_size]
+        probs = model.predict([encodings[i] for i in batch_idx])
+
+        for i, prob in zip(batch_idx, probs):
+            dist = dict(zip(model.labels, prob))
+            label = max(dist, key=dist.get)
+            results[i] = {
+                "label": label,  # entailment, contradiction, neutral
+                "confidence": round(dist[label], 4),
+                "probs": {k: round(v, 4) for k, v in dist.items()},
+            }
+
+    return results
+
+
+def load_embedding_model(model_name: str, backend: str, model_dir: str, quantize=True):
+    """
+    backend가 "onnx"면 ONNX Runtime 모델을 쓰고, 실패하면 PyTorch로 대체합니다.
+    """
+    if backend == "onnx":
+        try:
+            return OnnxSentenceEncoder(model_name, model_dir, quantize)
+        except Exception as e:
+            log("backends.py", f"ONNX 임베딩 모델 사용 불가, PyTorch로 대체 → {e}")
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name, device="cpu")
+
+
+def load_nli_model(model_name: str, backend: str, model_dir: str, quantize=True):
+    """
+    backend가 "onnx"면 ONNX Runtime 모델을 쓰고, 실패하면 PyTorch로 대체합니다.
+    """
+    if backend == "onnx":
+        try:
+            return OnnxNliModel(model_name, model_dir, quantize)
+        except Exception as e:
+            log("backends.py", f"ONNX NLI 모델 사용 불가, PyTorch로 대체 → {e}")
+    return TorchNliModel(model_name)
+
+
+def _onnx_path(model_dir, model_name, quantize):
+    os.makedirs(model_dir, exist_ok=True)
+    suffix = "int8" if quantize else "fp32"
+    return os.path.join(model_dir, f"{model_name.replace('/', '__')}.{suffix}.onnx")
+
+
+def _export(model, tokenizer, path, output_name, quantize):
+    import torch
+
+    class _ExportWrapper(torch.nn.Module):
+        # 토크나이저 입력 이름 순서대로 받아 지정한 출력 하나만 반환
+        def __init__(self, model, input_names, output_name):
+            super().__init__()
+            self.model = model
+            self.input_names = input_names
+            self.output_name = output_name
+
+        def forward(self, *inputs):
+            outputs = self.model(
+                **dict(zip(self.input_names, inputs)), return_dict=True
+            )
+            return outputs[self.output_name]
+
+    model.eval()
+    sample = tokenizer(
+        ["export sample sentence", "sample"], padding=True, return_tensors="pt"
+    )
+    input_names = [name for name in tokenizer.model_input_names if name in sample]
+    fp32_path = path if not quantize else path.replace(".int8.onnx", ".fp32.onnx")
+
+    log("backends.py", f"ONNX export → {fp32_path}")
+    torch.onnx.export(
+        _ExportWrapper(model, input_names, output_name),
+        tuple(sample[name] for name in input_names),
+        fp32_path,
+        input_names=input_names,
+        output_names=[output_name],
+        dynamic_axes={
+            **{name: {0: "batch", 1: "sequence"} for name in input_names},
+            output_name: (
+                {0: "batch", 1: "sequence"}
+                if output_name == "last_hidden_state"
+                else {0: "batch"}
+            ),
+        },
+        opset_version=17,
+        dynamo=False,
+    )
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        log("backends.py", f"동적 int8 양자화 → {path}")
+        quantize_dynamic(fp32_path, path, weight_type=QuantType.QInt8)
+
+
+def _sentence_config(model):
+    pooling = model[1].get_config_dict()
+    return {
+        "dim": model.get_sentence_embedding_dimension(),
+        "max_seq_length": model.max_seq_length,
+        "pooling": "cls" if pooling.get("pooling_mode_cls_token") else "mean",
+        "normalize": any(type(m).__name__ == "Normalize" for m in model),
+    }
+
+
+def _feed(inputs, input_names):
+    # pad()는 token_type_ids를 만들지 않으므로 없는 입력은 0으로 채움
+    input_ids = np.asarray(inputs["input_ids"], dtype=np.int64)
+    return {
+        name: (
+            np.asarray(inputs[name], dtype=np.int64)
+            if name in inputs
+            else np.zeros_like(input_ids)
+        )
+        for name in input_names
+    }
+
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=-1, keepdims=True)
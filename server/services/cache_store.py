@@ -0,0 +1,349 @@
+import os
+import json
+import glob
+import time
+import hashlib
+import sqlite3
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from tools.metrics import log
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    keywords TEXT NOT NULL,
+    keyword_count INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    content_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS entry_keywords (
+    keyword TEXT NOT NULL,
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    PRIMARY KEY (keyword, entry_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS documents (
+    url TEXT PRIMARY KEY,
+    link TEXT NOT NULL,
+    title TEXT,
+    sentences TEXT NOT NULL,
+    embedding BLOB,
+    dim INTEGER,
+    offsets TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entry_documents (
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    url TEXT NOT NULL REFERENCES documents(url),
+    PRIMARY KEY (entry_id, position)
+);
+"""
+
+# 같은 기사를 가리키는 URL을 하나로 모을 때 제거하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "feature"}
+
+
+def canonical_url(url: str) -> str:
+    """
+    scheme/host 소문자, fragment·추적 파라미터·끝의 / 제거
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and not name.lower().startswith("utm_")
+    ]
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/") or "/",
+            urlencode(sorted(query)),
+            "",
+        )
+    )
+
+
+class ArticleCacheStore:
+    """
+    키워드 조합별 기사 캐시 (SQLite)
+
+    - entries: 키워드 조합 하나당 한 행
+    - entry_keywords: 키워드 → 캐시 항목 역색인
+    - documents: 정규화한 URL당 한 행, 기사 제목/링크/문장(JSON)/임베딩(float32 BLOB)/문장 offset(JSON)
+    - entry_documents: 캐시 항목 → 기사 URL 참조 (같은 기사는 한 번만 저장)
+    - entries.content_hash: 기사 내용 해시, 같은 내용이면 다시 쓰지 않음
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        # fork된 워커는 부모 프로세스의 연결을 쓰지 않고 새로 연결
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def find_best(self, keyword: list[str], min_similarity: float = 0.3):
+        """
+        역색인으로 키워드를 하나 이상 공유하는 항목만 조회해 가장 유사한 항목을 찾습니다.
+
+        Returns:
+            dict | None: {"similarity", "keywords", "articles"}
+        """
+        if not keyword:
+            return None
+        placeholders = ",".join("?" * len(set(keyword)))
+        rows = (
+            self._connect()
+            .execute(
+                f"""
+                SELECT e.id, e.keywords, e.keyword_count, COUNT(*) AS overlap
+                FROM entry_keywords k JOIN entries e ON e.id = k.entry_id
+                WHERE k.keyword IN ({placeholders})
+                GROUP BY e.id
+                ORDER BY e.updated_at DESC
+                """,
+                list(set(keyword)),
+            )
+            .fetchall()
+        )
+
+        best_id, best_keywords, best_sim = None, None, 0
+        for entry_id, keywords, keyword_count, overlap in rows:
+            sim = overlap / min(keyword_count, len(keyword))
+            if sim > best_sim and sim >= min_similarity:
+                best_id, best_keywords, best_sim = entry_id, keywords, sim
+
+        if best_id is None:
+            return None
+        return {
+            "similarity": best_sim,
+            "keywords": json.loads(best_keywords),
+            "articles": self.load_articles(best_id),
+        }
+
+    def entries_since(self, last_id: int) -> list[tuple[int, list[str]]]:
+        """
+        id가 last_id보다 큰 항목의 (id, keywords) 목록 (id 오름차순)
+        """
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT id, keywords FROM entries WHERE id > ? ORDER BY id",
+                (last_id,),
+            )
+            .fetchall()
+        )
+        return [(entry_id, json.loads(keywords)) for entry_id, keywords in rows]
+
+    def load_articles(self, entry_id: int):
+        rows = (
+            self._connect()
+            .execute(
+                """
+                SELECT d.title, d.link, d.sentences, d.embedding, d.dim, d.offsets
+                FROM entry_documents r JOIN documents d ON d.url = r.url
+                WHERE r.entry_id = ? ORDER BY r.position
+                """,
+                (entry_id,),
+            )
+            .fetchall()
+        )
+        return [self._article(*row) for row in rows]
+
+    def get_documents(self, links: list[str]) -> dict:
+        """
+        저장된 기사를 링크로 조회합니다. (정규화한 URL이 같으면 같은 기사)
+
+        Returns:
+            dict: {link: [title, link, sentences, embedding, offsets]} (저장된 기사만 포함)
+        """
+        urls = {}
+        for link in links:
+            urls.setdefault(canonical_url(link), []).append(link)
+        url_list = list(urls)
+        documents = {}
+        for start in range(0, len(url_list), 500):
+            chunk = url_list[start : start + 500]
+            rows = (
+                self._connect()
+                .execute(
+                    f"""
+                    SELECT url, title, link, sentences, embedding, dim, offsets
+                    FROM documents
+                    WHERE url IN ({",".join("?" * len(chunk))})
+                    """,
+                    chunk,
+                )
+                .fetchall()
+            )
+            for url, *row in rows:
+                for link in urls[url]:
+                    documents[link] = self._article(*row)
+        return documents
+
+    @staticmethod
+    def _article(title, link, sentences, embedding, dim, offsets):
+        if embedding is not None:
+            embedding = (
+                np.frombuffer(embedding, dtype=np.float32).reshape(-1, dim).copy()
+            )
+        offsets = json.loads(offsets) if offsets is not None else None
+        return [title, link, json.loads(sentences), embedding, offsets]
+
+    def put(self, keyword: list[str], articles: list) -> bool:
+        """
+        articles: List of [title, url, sentences, embedding(, offsets)]
+
+        한 트랜잭션으로 기록하므로 다른 연결에서는 이전 내용 또는 새 내용만 보입니다.
+        기존 항목과 기사 내용이 같으면 updated_at만 갱신하고 False를 반환합니다.
+        """
+        key = json.dumps(keyword, ensure_ascii=False)
+        rows = [self._article_row(article) for article in articles]
+        digest = hashlib.blake2b(digest_size=16)
+        for row in rows:
+            digest.update(json.dumps(row[:3], ensure_ascii=False).encode("utf-8"))
+            digest.update(row[3] or b"")
+        content_hash = digest.hexdigest()
+
+        conn = self._connect()
+        with conn:
+            existing = conn.execute(
+                "SELECT id, content_hash FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if existing is not None and existing[1] == content_hash:
+                conn.execute(
+                    "UPDATE entries SET updated_at = ? WHERE id = ?",
+                    (time.time(), existing[0]),
+                )
+                return False
+
+            conn.execute(
+                """
+                INSERT INTO entries (key, keywords, keyword_count, updated_at, content_hash)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    updated_at = excluded.updated_at,
+                    content_hash = excluded.content_hash
+                """,
+                (key, key, len(keyword), time.time(), content_hash),
+            )
+            entry_id = conn.execute(
+                "SELECT id FROM entries WHERE key = ?", (key,)
+            ).fetchone()[0]
+            conn.executemany(
+                "INSERT OR IGNORE INTO entry_keywords (keyword, entry_id) VALUES (?, ?)",
+                [(kw, entry_id) for kw in set(keyword)],
+            )
+            self._put_documents(conn, rows)
+            conn.execute("DELETE FROM entry_documents WHERE entry_id = ?", (entry_id,))
+            conn.executemany(
+                "INSERT INTO entry_documents (entry_id, position, url) VALUES (?, ?, ?)",
+                [(entry_id, i, canonical_url(row[1])) for i, row in enumerate(rows)],
+            )
+        return True
+
+    @staticmethod
+    def _put_documents(conn, rows):
+        # 새 임베딩/offset이 없으면 문장이 그대로일 때만 기존 값 유지
+        now = time.time()
+        conn.executemany(
+            """
+            INSERT INTO documents (
+                url, link, title, sentences, embedding, dim, offsets, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                link = excluded.link,
+                title = excluded.title,
+                embedding = CASE
+                    WHEN excluded.embedding IS NOT NULL THEN excluded.embedding
+                    WHEN documents.sentences = excluded.sentences THEN documents.embedding
+                END,
+                dim = CASE
+                    WHEN excluded.embedding IS NOT NULL THEN excluded.dim
+                    WHEN documents.sentences = excluded.sentences THEN documents.dim
+                END,
+                offsets = CASE
+                    WHEN excluded.offsets IS NOT NULL THEN excluded.offsets
+                    WHEN documents.sentences = excluded.sentences THEN documents.offsets
+                END,
+                sentences = excluded.sentences,
+                updated_at = excluded.updated_at
+            """,
+            [
+                (
+                    canonical_url(url),
+                    url,
+                    title,
+                    sentences,
+                    embedding,
+                    dim,
+                    offsets,
+                    now,
+                )
+                for title, url, sentences, embedding, dim, offsets in rows
+            ],
+        )
+
+    def _article_row(self, article):
+        title, url, sentences, embedding = article[:4]
+        offsets = article[4] if len(article) > 4 else None
+        dim = None
+        if embedding is not None and len(embedding):
+            embedding = np.asarray(embedding, dtype=np.float32)
+            dim = embedding.shape[-1]
+            embedding = embedding.tobytes()
+        else:
+            embedding = None
+        return (
+            title,
+            url,
+            json.dumps(sentences, ensure_ascii=False),
+            embedding,
+            dim,
+            json.dumps(offsets) if offsets is not None else None,
+        )
+
+    def migrate_json_dir(self, json_dir: str):
+        """
+        기존 cache/*.json 파일을 한 번만 가져옵니다. (파일명 = "_".join(keyword))
+        """
+        conn = self._connect()
+        if conn.execute("SELECT 1 FROM meta WHERE name = 'json_migrated'").fetchone():
+            return 0
+
+        count = 0
+        for path in sorted(glob.glob(os.path.join(json_dir, "*.json"))):
+            keyword = os.path.basename(path)[:-5].split("_")
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    articles = json.load(f)
+                self.put(keyword, articles)
+                count += 1
+            except Exception as e:
+                log("cache_store.py", f"마이그레이션 실패 {path}: {e}")
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('json_migrated', ?)",
+                (str(count),),
+            )
+        log("cache_store.py", f"JSON 캐시 {count}개 마이그레이션 완료")
+        return count
@@ -0,0 +1,67 @@
+import os
+import numpy as np
+
+from tools.metrics import metrics
+
+# 이 값 이상으로 비슷한 주장(KR-SBERT 코사인 유사도)은 같은 주장으로 보고 한 번만 분석
+CLAIM_DEDUP_THRESHOLD = float(os.getenv("CLAIM_DEDUP_THRESHOLD", "0.9"))
+
+claim_dedup_claims = metrics.counter(
+    "claim_dedup_claims_total",
+    "Claims grouped before analysis (result: representative, duplicate)",
+    ["result"],
+)
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def cluster_claims(
+    embeddings: np.ndarray,
+    threshold: float = CLAIM_DEDUP_THRESHOLD,
+    representatives: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    주장 임베딩을 유사도 기준으로 묶습니다. (leader clustering)
+
+    1. 기존 대표 주장(representatives, 정규화된 행렬)과 한 번의 행렬 곱으로 비교해
+       가장 비슷한 대표가 threshold 이상이면 그 묶음에 넣음
+    2. 남은 주장끼리의 유사도 행렬을 한 번에 계산하고, 앞에서부터 아직 묶이지 않은 주장을
+       대표로 삼아 threshold 이상인 주장을 한꺼번에 묶음 (대표마다 벡터 연산 한 번)
+
+    Returns:
+        np.ndarray: 주장별 대표 번호. len(representatives) 미만이면 기존 대표,
+            이상이면 len(representatives) + (대표가 된 새 주장의 위치)
+    """
+    n = len(embeddings)
+    offset = 0 if representatives is None else len(representatives)
+    labels = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return labels
+    x = normalize_rows(embeddings)
+
+    if offset:
+        sims = x @ representatives.T
+        best = sims.argmax(axis=1)
+        matched = sims[np.arange(n), best] >= threshold
+        labels[matched] = best[matched]
+
+    pending = np.flatnonzero(labels < 0)
+    if len(pending):
+        sims = x[pending] @ x[pending].T
+        assigned = np.zeros(len(pending), dtype=bool)
+        for i in range(len(pending)):
+            if assigned[i]:
+                continue
+            members = ~assigned & (sims[i] >= threshold)
+            members[i] = True
+            labels[pending[members]] = offset + pending[i]
+            assigned |= members
+
+    representative = labels == offset + np.arange(n)
+    claim_dedup_claims.inc(int(representative.sum()), result="representative")
+    claim_dedup_claims.inc(int(n - representative.sum()), result="duplicate")
+    return labels
@@ -1,26 +1,77 @@
 import os
-import json
-import hashlib
 from typing import List, Tuple
 from services.api import crawl_article
+from services.cache_store import ArticleCacheStore, canonical_url
+from services.inference import encode
+from services.keyword_index import KeywordIndex
+from services.write_behind import WriteBehindWriter
+from tools.metrics import log, metrics
 from random import sample
 
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CACHE_DIR = os.path.join(base_dir, "cache")
 os.makedirs(CACHE_DIR, exist_ok=True)
 
-
-def collect_data(keyword: list[str], pages: int = 1):
+# 키워드 조합별 기사 캐시 (기존 cache/*.json 파일은 최초 1회 가져옴)
+cache_store = ArticleCacheStore(
+    os.getenv("ARTICLE_CACHE_DB", os.path.join(CACHE_DIR, "articles.sqlite3"))
+)
+cache_store.migrate_json_dir(CACHE_DIR)
+
+# 분석이 끝난 기사는 백그라운드 스레드 하나가 모아서 기록
+# (같은 키워드 조합이 대기 중이면 최신 기사로 합침)
+cache_writer = WriteBehindWriter(
+    "articles",
+    lambda key, articles: cache_store.put(list(key), articles),
+    max_pending=int(os.getenv("CACHE_WRITE_QUEUE_SIZE", "1000")),
+)
+
+# 키워드 조합 임베딩 유사도로 캐시 후보 찾기 ("백종원" ≈ "백종원 대표")
+# KEYWORD_SEMANTIC_MIN 이상이면 후보, KEYWORD_SEMANTIC_HIT 이상이면 같은 조합으로 간주
+KEYWORD_SEMANTIC_CACHE = os.getenv("KEYWORD_SEMANTIC_CACHE", "1") == "1"
+KEYWORD_SEMANTIC_MIN = float(os.getenv("KEYWORD_SEMANTIC_MIN", "0.75"))
+KEYWORD_SEMANTIC_HIT = float(os.getenv("KEYWORD_SEMANTIC_HIT", "0.92"))
+keyword_index = KeywordIndex(cache_store.entries_since, encode)
+
+article_cache_lookups = metrics.counter(
+    "article_cache_lookups_total",
+    "Article cache lookups in collect_data (hit: no crawl, partial: mixed, miss: crawl only)",
+    ["result"],
+)
+semantic_cache_matches = metrics.counter(
+    "article_cache_semantic_matches_total",
+    "Cache candidates found by keyword embedding similarity instead of exact overlap",
+    ["result"],
+)
+stored_documents_reused = metrics.counter(
+    "article_documents_reused_total",
+    "Crawled links served from the URL-keyed article store instead of downloading",
+)
+metrics.gauge(
+    "article_cache_keyword_index_entries", "Keyword sets in the in-memory vector index"
+).set_function(lambda: len(keyword_index))
+
+
+def collect_data(keyword: list[str], pages: int = 1, cancel=None):
+    """
+    cancel (threading.Event): 설정되면 크롤링을 중단하고 SearchCancelled 발생
+    """
     cache_candidate = get_best_cache_candidate(keyword)
 
     if cache_candidate and cache_candidate["similarity"] >= 1.0:
-        print("[collector.py]: 캐시 100% 활용 - 크롤링 생략")
+        article_cache_lookups.inc(result="hit")
+        log("collector.py", "캐시 100% 활용 - 크롤링 생략")
         return cache_candidate["articles"]
-    new_articles = crawl_article(keyword, pages)  # [(title, url, body, embedding), ...]
+    # [(title, url, body, embedding), ...], 저장된 기사는 본문/임베딩 재사용
+    new_articles = crawl_article(
+        keyword, pages, cancel=cancel, stored_documents=stored_documents
+    )
 
     if cache_candidate is None:
         # 캐시 없으면 새로 수집한 기사 전부 반환
+        article_cache_lookups.inc(result="miss")
         return new_articles
+    article_cache_lookups.inc(result="partial")
 
     # 유사도가 가장 높은 캐시 기사만 사용
     cached_articles = cache_candidate["articles"]
@@ -38,15 +89,16 @@ def collect_data(keyword: list[str], pages: int = 1):
     # 나머지는 새로 수집한 기사로 채움
     remaining_count = max(0, total_needed - len(result_articles))
     result_articles.extend(new_articles[:remaining_count])
-    print(
-        f"[collector.py]: total:{total_needed}, cache:{use_count}, new:{remaining_count}"
+    log(
+        "collector.py",
+        f"total:{total_needed}, cache:{use_count}, new:{remaining_count}",
     )
 
-    # 중복 제거 (url 기준)
+    # 중복 제거 (정규화한 url 기준)
     seen_urls = set()
     final_articles = []
     for article in result_articles:
-        _, url, _, _ = article
+        url = canonical_url(article[1])
         if url not in seen_urls:
             seen_urls.add(url)
             final_articles.append(article)
@@ -54,37 +106,59 @@ def collect_data(keyword: list[str], pages: int = 1):
     return final_articles
 
 
-def get_best_cache_candidate(keyword: list[str]):
-    best_filename = None
-    best_sim = 0
-
-    for filename in os.listdir(CACHE_DIR):
-        if not filename.endswith(".json"):
-            continue
+def stored_documents(links: list[str]) -> dict:
+    try:
+        documents = cache_store.get_documents(links)
+    except Exception as e:
+        log("collector.py", f"[CacheError] 저장된 기사 조회 실패: {e}")
+        return {}
+    stored_documents_reused.inc(len(documents))
+    return documents
 
-        file2keyword = filename[:-5].split("_")  # '.json' 빼고 키워드 리스트 추출
-        sim = keyword_similarity(file2keyword, keyword)
 
-        if sim > best_sim and sim >= 0.3:
-            best_sim = sim
-            best_filename = filename
+def get_best_cache_candidate(keyword: list[str]):
+    try:
+        candidate = cache_store.find_best(keyword, min_similarity=0.3)
+    except Exception as e:
+        log("collector.py", f"[CacheError] {keyword}: {e}")
+        return None
 
-    if best_filename is None:
+    if KEYWORD_SEMANTIC_CACHE and (candidate is None or candidate["similarity"] < 1.0):
+        try:
+            semantic = get_semantic_cache_candidate(keyword)
+        except Exception as e:
+            log("collector.py", f"[KeywordIndexError] {keyword}: {e}")
+            semantic = None
+        if semantic and (
+            candidate is None or semantic["similarity"] > candidate["similarity"]
+        ):
+            candidate = semantic
+
+    if candidate is None:
         return None
+    return {
+        "similarity": candidate["similarity"],
+        "articles": candidate["articles"],
+    }
 
-    # 가장 유사한 파일 하나만 열기
-    try:
-        path = os.path.join(CACHE_DIR, best_filename)
-        with open(path, "r", encoding="utf-8") as f:
-            articles = json.load(f)
-        return {
-            "similarity": best_sim,
-            "articles": articles,
-        }
-    except Exception as e:
-        print(f"[CacheError] {best_filename}: {e}")
+
+def get_semantic_cache_candidate(keyword: list[str]):
+    match = keyword_index.search(keyword)
+    if match is None:
+        return None
+    entry_id, keywords, score = match
+    if score < KEYWORD_SEMANTIC_MIN:
         return None
 
+    result = "hit" if score >= KEYWORD_SEMANTIC_HIT else "partial"
+    semantic_cache_matches.inc(result=result)
+    log("collector.py", f"유사 키워드 캐시 {keywords} ({score:.3f}, {result})")
+    return {
+        "similarity": 1.0 if result == "hit" else score,
+        "keywords": keywords,
+        "articles": cache_store.load_articles(entry_id),
+    }
+
 
 def keyword_similarity(keyword1, keyword2):
     return len(set(keyword1) & set(keyword2)) / min(len(keyword1), len(keyword2))
@@ -93,7 +167,7 @@ def keyword_similarity(keyword1, keyword2):
 def cache_articles(keyword: list[str], articles: list[tuple]):
     """
     articles: List of tuples (title, url, body, embedding)
+
+    바로 반환하고 기록은 cache_writer 스레드가 처리합니다.
     """
-    filename = os.path.join(CACHE_DIR, "_".join(keyword) + ".json")
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False)
+    cache_writer.submit(tuple(keyword), list(articles))
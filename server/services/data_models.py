@@ -4,15 +4,17 @@ class CoreSentence:
         self.sentence_en = sentence_en
         self.article_idx = None
         self.sentence_index = None
+        self.offset = None  # 기사 본문에서의 [시작, 끝] 위치
         self.similarity_score = score
-        self.nli_result = {"confidence": None, "label": None}
+        self.nli_result = {"confidence": None, "label": None, "probs": None}
 
     def to_dict(self):
         return {
             "sentence": self.sentence,
-            "score": self.similarity_score.item(),
+            "score": self.similarity_score,
             "nli_result": self.nli_result,
             "article_idx": self.article_idx,
+            "offset": self.offset,
         }
 
 
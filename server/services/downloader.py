@@ -0,0 +1,222 @@
+import os
+import sys
+import time
+import types
+import threading
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from newspaper import Article
+
+from tools.metrics import external_api_errors, log
+
+
+def parse_article(link: str, html) -> str:
+    """
+    다운로드한 HTML에서 newspaper3k로 본문을 추출합니다. (parse 워커에서 실행)
+    """
+    article = Article(link, language="ko")
+    article.download(input_html=html)
+    article.parse()
+    return article.text.strip()
+
+
+_main_lock = threading.Lock()
+
+
+class _ParseProcess:
+    """
+    파싱 워커 프로세스
+
+    spawn / forkserver 워커는 시작할 때 부모의 __main__을 다시 import합니다.
+    (python app.py로 실행하면 워커마다 app.py 전체를 다시 실행)
+    워커를 시작하는 동안만 __main__을 빈 모듈로 바꿔 이 과정을 건너뜁니다.
+    워커는 파싱 함수가 있는 이 모듈만 import합니다.
+    """
+
+    def start(self):
+        with _main_lock:
+            main = sys.modules["__main__"]
+            sys.modules["__main__"] = types.ModuleType("__main__")
+            try:
+                super().start()
+            finally:
+                sys.modules["__main__"] = main
+
+
+class _SpawnParseProcess(_ParseProcess, multiprocessing.context.SpawnProcess):
+    pass
+
+
+if sys.platform != "win32":
+
+    class _ForkServerParseProcess(
+        _ParseProcess, multiprocessing.context.ForkServerProcess
+    ):
+        pass
+
+
+def _parse_context(method: str):
+    # 워커를 _ParseProcess로 시작하는 multiprocessing 컨텍스트
+    context = type(multiprocessing.get_context(method))()
+    if method == "forkserver":
+        # forkserver도 __main__ 대신 이 모듈만 미리 import
+        context.set_forkserver_preload([__name__])
+        context.Process = _ForkServerParseProcess
+    else:
+        context.Process = _SpawnParseProcess
+    return context
+
+
+class ArticleDownloader:
+    """
+    기사 본문 동시 다운로드 + 파싱
+
+    - 호스트별 동시 요청 수 제한 (per_host)
+    - requests.Session 커넥션 풀 공유
+    - 요청별 timeout, 전체 deadline (deadline 안에 끝나지 않은 기사는 버림)
+    - HTML 파싱은 별도 워커 풀에서 실행 (parse_processes면 프로세스 풀, 아니면 스레드 풀)
+      풀은 프로세스마다 처음 파싱할 때 생성하고, 프로세스 풀은 스레드가 도는 프로세스를
+      fork하지 않도록 forkserver(없으면 spawn) 방식으로 시작 (__main__은 다시 import하지 않음)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        per_host: int = 2,
+        timeout: tuple[float, float] = (3.0, 5.0),
+        deadline: float = 8.0,
+        parse_workers: int | None = None,
+        parse_processes: bool = True,
+    ):
+        self.timeout = timeout
+        self.deadline = deadline
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.fetch_pool = ThreadPoolExecutor(max_workers, thread_name_prefix="fetch")
+        self._host_limits = defaultdict(lambda: threading.Semaphore(per_host))
+        self._host_lock = threading.Lock()
+
+        self.parse_workers = parse_workers or min(os.cpu_count() or 1, 4)
+        self.parse_processes = parse_processes
+        self._parse_lock = threading.Lock()
+        self._parse_executor = None
+        self._parse_pid = None
+
+    def get(self, url: str, headers: dict | None = None) -> requests.Response:
+        host = urlparse(url).netloc
+        with self._host_lock:
+            limit = self._host_limits[host]
+        with limit:
+            return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    def fetch_articles(
+        self,
+        links: list[str],
+        headers: dict | None = None,
+        deadline=None,
+        cancel: threading.Event | None = None,
+    ) -> dict:
+        """
+        기사 링크들을 동시에 다운로드하고 본문을 파싱합니다.
+        cancel이 설정되면 남은 다운로드를 취소하고 그때까지 받은 본문만 반환합니다.
+
+        Returns:
+            dict: {link: body} (deadline 안에 성공한 기사만 포함)
+        """
+        deadline_at = time.monotonic() + (deadline or self.deadline)
+        pending = {
+            self.fetch_pool.submit(self._download, link, headers): link
+            for link in dict.fromkeys(links)
+        }
+        bodies = {}
+
+        while pending:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0 or (cancel is not None and cancel.is_set()):
+                break
+            if cancel is not None:
+                # 취소 여부를 확인하기 위해 짧게 나눠서 대기
+                remaining = min(remaining, 0.1)
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                link = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    external_api_errors.inc(api="article")
+                    log("downloader.py", f"본문 추출 실패: {link} → {e}")
+                    continue
+                if isinstance(result, str):
+                    # 파싱까지 끝난 본문
+                    bodies[link] = result
+                else:
+                    # 다운로드 완료 → 파싱 워커로 전달
+                    pending[self._submit_parse(link, result)] = link
+
+        if pending:
+            if cancel is None or not cancel.is_set():
+                log("downloader.py", f"deadline 초과로 {len(pending)}개 기사 제외")
+            for future in pending:
+                future.cancel()
+        return bodies
+
+    def _download(self, link, headers):
+        response = self.get(link, headers=headers)
+        response.raise_for_status()
+        # 인코딩을 알 수 없으면 newspaper가 bytes에서 직접 판별하도록 넘김
+        if response.encoding and response.encoding.lower() != "iso-8859-1":
+            return _Downloaded(response.text)
+        return _Downloaded(response.content)
+
+    @property
+    def parse_pool(self):
+        # import 시점이나 fork 이전에 만든 풀은 쓰지 않고 프로세스마다 처음 사용할 때 생성
+        if self._parse_pid != os.getpid():
+            with self._parse_lock:
+                if self._parse_pid != os.getpid():
+                    self._parse_executor = self._create_parse_pool()
+                    self._parse_pid = os.getpid()
+        return self._parse_executor
+
+    def _create_parse_pool(self):
+        if self.parse_processes:
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            return ProcessPoolExecutor(
+                self.parse_workers, mp_context=_parse_context(method)
+            )
+        return ThreadPoolExecutor(self.parse_workers, thread_name_prefix="parse")
+
+    def _submit_parse(self, link, downloaded):
+        try:
+            return self.parse_pool.submit(parse_article, link, downloaded.html)
+        except RuntimeError as e:
+            # 프로세스 풀이 깨졌거나 시작할 수 없으면 이후로는 스레드 풀에서 파싱
+            log("downloader.py", f"파싱 프로세스 풀 사용 불가, 스레드 풀로 전환: {e}")
+            with self._parse_lock:
+                self._parse_executor = ThreadPoolExecutor(
+                    self.parse_workers, thread_name_prefix="parse"
+                )
+                self._parse_pid = os.getpid()
+            return self._parse_executor.submit(parse_article, link, downloaded.html)
+
+
+class _Downloaded:
+    __slots__ = ("html",)
+
+    def __init__(self, html):
+        self.html = html
@@ -0,0 +1,232 @@
+import os
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from tools.metrics import log
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 사용 (gunicorn은 POSIX 전용)
+    fcntl = None
+
+
+def normalize_text(text: str) -> str:
+    # 유니코드 정규화 + 공백 정리
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """
+    문장 임베딩 2단 캐시
+
+    - 메모리: 크기 제한이 있는 LRU
+    - 디스크: 임베딩 행렬(.bin, memmap) + 행 순서대로 키를 기록한 인덱스(.idx)
+
+    키는 모델 이름과 정규화된 텍스트의 해시입니다.
+    디스크 파일은 여러 프로세스(gunicorn 워커)가 공유합니다.
+    추가는 파일 잠금(.lock) 안에서 인덱스 끝을 다시 읽은 뒤 하고, 조회에서 찾지 못하면
+    다른 프로세스가 추가한 인덱스 끝을 읽어 반영합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: str | None = None,
+        max_memory_items: int = 20000,
+        dtype: str = "float32",
+    ):
+        self.model_name = model_name
+        self.max_memory_items = max_memory_items
+        self.dtype = np.dtype(dtype)
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.cache_dir = cache_dir
+        self.disk_index = {}  # key -> 행 번호
+        self.rows = 0  # 인덱스에서 읽은 행 수
+        self.dim = None
+        self._matrix = None
+        self._index_offset = 0  # 인덱스 파일에서 읽은 위치 (바이트)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            prefix = os.path.join(
+                cache_dir, f"{model_name.replace('/', '__')}.{self.dtype.name}"
+            )
+            self.matrix_path = prefix + ".bin"
+            self.index_path = prefix + ".idx"
+            self.lock_path = prefix + ".lock"
+            self._load_disk_index()
+
+    def key(self, text: str) -> str:
+        data = f"{self.model_name}\x00{normalize_text(text)}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get_many(self, keys: list[str]) -> list[np.ndarray | None]:
+        results = []
+        with self.lock:
+            if self.cache_dir and any(
+                key not in self.memory and key not in self.disk_index for key in keys
+            ):
+                self._sync_disk_index()
+            for key in keys:
+                vector = self.memory.get(key)
+                if vector is not None:
+                    self.memory.move_to_end(key)
+                    self.memory_hits += 1
+                elif key in self.disk_index:
+                    vector = self._read_disk_row(self.disk_index[key])
+                    self._remember(key, vector)
+                    self.disk_hits += 1
+                else:
+                    self.misses += 1
+                results.append(vector)
+        return results
+
+    def put_many(self, keys: list[str], vectors: np.ndarray):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self.lock:
+            new_keys, new_rows = [], []
+            for key, vector in zip(keys, vectors):
+                self._remember(key, vector)
+                if self.cache_dir and key not in self.disk_index:
+                    new_keys.append(key)
+                    new_rows.append(vector)
+            if new_keys:
+                self._append_disk(new_keys, np.stack(new_rows))
+
+    def stats(self) -> dict:
+        with self.lock:
+            requests = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (
+                    (self.memory_hits + self.disk_hits) / requests if requests else 0.0
+                ),
+                "memory_items": len(self.memory),
+                "disk_items": len(self.disk_index),
+            }
+
+    def _remember(self, key, vector):
+        self.memory[key] = vector
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_items:
+            self.memory.popitem(last=False)
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load_disk_index(self):
+        with self._file_lock():
+            header, keys = "", []
+            if os.path.exists(self.index_path):
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    header = f.readline().strip()
+                    keys = [line.strip() for line in f if line.strip()]
+            if not header.startswith("dim="):
+                # 인덱스가 없거나 손상된 경우 행렬 파일도 버리고 새로 시작
+                for path in (self.matrix_path, self.index_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                return
+            self.dim = int(header[4:])
+
+            # 행렬 파일에 실제로 기록된 행까지만 사용 (쓰기 도중 종료 대비)
+            row_bytes = self.dim * self.dtype.itemsize
+            size = (
+                os.path.getsize(self.matrix_path)
+                if os.path.exists(self.matrix_path)
+                else 0
+            )
+            rows = min(len(keys), size // row_bytes)
+            if rows != len(keys) or rows * row_bytes != size:
+                log("embedding_cache.py", f"디스크 캐시 복구 ({rows}개 행 유지)")
+                with open(self.matrix_path, "ab") as f:
+                    f.truncate(rows * row_bytes)
+                with open(self.index_path, "w", encoding="utf-8") as f:
+                    f.write(
+                        f"dim={self.dim}\n" + "".join(key + "\n" for key in keys[:rows])
+                    )
+            self.disk_index = {}
+            for i, key in enumerate(keys[:rows]):
+                self.disk_index.setdefault(key, i)
+            self.rows = rows
+            self._index_offset = os.path.getsize(self.index_path)
+
+    def _sync_disk_index(self):
+        # 다른 프로세스가 추가한 행을 인덱스 끝에서 읽어 반영
+        # (행렬을 먼저 쓰고 인덱스를 나중에 쓰므로 완전한 줄의 행은 행렬에 있음)
+        try:
+            size = os.path.getsize(self.index_path)
+        except OSError:
+            return
+        if size <= self._index_offset:
+            return
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_offset)
+            data = f.read(size - self._index_offset)
+        end = data.rfind(b"\n") + 1
+        self._index_offset += end
+        for line in data[:end].decode("utf-8").splitlines():
+            if line.startswith("dim="):
+                self.dim = int(line[4:])
+            elif line:
+                self.disk_index.setdefault(line, self.rows)
+                self.rows += 1
+
+    def _read_disk_row(self, row):
+        if self._matrix is None or row >= self._matrix.shape[0]:
+            self._matrix = np.memmap(
+                self.matrix_path,
+                dtype=self.dtype,
+                mode="r",
+                shape=(self.rows, self.dim),
+            )
+        return np.asarray(self._matrix[row], dtype=np.float32)
+
+    def _append_disk(self, keys, vectors):
+        with self._file_lock():
+            # 잠금 안에서 다른 프로세스가 추가한 행을 먼저 반영해 행 번호가 겹치지 않게 함
+            self._sync_disk_index()
+            fresh = [i for i, key in enumerate(keys) if key not in self.disk_index]
+            if not fresh:
+                return
+            keys = [keys[i] for i in fresh]
+            vectors = vectors[fresh]
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                header = f"dim={self.dim}\n"
+                with open(self.index_path, "w", encoding="utf-8") as f:
+                    f.write(header)
+                self._index_offset = len(header.encode("utf-8"))
+
+            # 행렬을 먼저 쓰고 인덱스를 나중에 써서 인덱스가 없는 행을 가리키지 않도록 함
+            with open(self.matrix_path, "ab") as f:
+                f.write(vectors.astype(self.dtype).tobytes())
+            lines = "".join(key + "\n" for key in keys).encode("utf-8")
+            with open(self.index_path, "ab") as f:
+                f.write(lines)
+            self._index_offset += len(lines)
+
+            for key in keys:
+                self.disk_index[key] = self.rows
+                self.rows += 1
@@ -1,23 +1,188 @@
+import os
 import re
-from sentence_transformers import SentenceTransformer, util
-from transformers import pipeline
+import threading
+import numpy as np
+from services.backends import (
+    EMBEDDING_MODEL_NAME,
+    INFERENCE_BACKEND,
+    NLI_MODEL_NAME,
+    ONNX_MODEL_DIR,
+    ONNX_QUANTIZE,
+    OnnxSentenceEncoder,
+    load_embedding_model,
+    load_nli_model,
+    predict_nli_pairs,
+)
+from services.embedding_cache import EmbeddingCache, normalize_text
+from services.models import registry
+from tools.metrics import log, span
+
+# 모델은 import 시점이 아니라 처음 사용할 때 로드 (CPU 실행)
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 서버 시작 시 백그라운드에서 모델을 미리 로드할지 여부 (0이면 첫 요청에서 로드)
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "1") == "1"
+# 모델 워밍업 완료 여부 (/ready 에서 사용)
+models_ready = threading.Event()
+# 워밍업 실패 메시지 (실패하면 /ready가 계속 503과 함께 반환)
+_warm_up_error = None
+# 워밍업을 시작한 프로세스 (fork된 워커에서는 다시 시작)
+_warm_up_pid = None
+_warm_up_lock = threading.Lock()
+
+# 배치 NLI 한 번에 모델에 넣는 쌍의 수
+NLI_BATCH_SIZE = int(os.getenv("NLI_BATCH_SIZE", "16"))
+
+
+def _load_embedding_cache():
+    # 임베딩 캐시 (메모리 LRU + 디스크 memmap), 백엔드마다 임베딩 값이 달라 키를 구분
+    embedding_model = registry.get("embedding")
+    return EmbeddingCache(
+        (
+            EMBEDDING_MODEL_NAME
+            if not isinstance(embedding_model, OnnxSentenceEncoder)
+            else f"{EMBEDDING_MODEL_NAME}@onnx-{'int8' if ONNX_QUANTIZE else 'fp32'}"
+        ),
+        cache_dir=(
+            os.getenv(
+                "EMBEDDING_CACHE_DIR", os.path.join(base_dir, "cache", "embeddings")
+            )
+            if os.getenv("EMBEDDING_CACHE_DISK", "1") == "1"
+            else None
+        ),
+        max_memory_items=int(os.getenv("EMBEDDING_CACHE_MEMORY_ITEMS", "20000")),
+        dtype=os.getenv("EMBEDDING_CACHE_DTYPE", "float32"),
+    )
 
-# 모델 로드 (CPU 실행)
-embedding_model = SentenceTransformer(
-    "snunlp/KR-SBERT-V40K-klueNLI-augSTS", device="cpu"
+
+registry.register(
+    "embedding",
+    lambda: load_embedding_model(
+        EMBEDDING_MODEL_NAME, INFERENCE_BACKEND, ONNX_MODEL_DIR, ONNX_QUANTIZE
+    ),
 )
-# NLI 파이프라인 생성
-nli_pipeline = pipeline(
-    "text-classification", model="roberta-large-mnli", truncation=True, max_length=512
+registry.register("embedding_cache", _load_embedding_cache)
+registry.register(
+    "nli",
+    lambda: load_nli_model(
+        NLI_MODEL_NAME, INFERENCE_BACKEND, ONNX_MODEL_DIR, ONNX_QUANTIZE
+    ),
 )
 
 
+def load_models():
+    """
+    등록된 모델을 모두 로드합니다. (gunicorn 마스터에서 fork 전에 호출)
+    """
+    registry.load_all()
+
+
+def warm_up():
+    """
+    모델을 로드하고 짧은 입력을 한 번씩 넣어 첫 요청의 지연을 없앤 뒤 models_ready를 설정합니다.
+    실패하면 models_ready는 설정하지 않고 오류를 warm_up_error()로 남깁니다.
+    """
+    global _warm_up_error
+    try:
+        registry.get("embedding").encode(["워밍업 문장입니다."])
+        analyze_nli_pairs([("This is a warm-up sentence.", "This is a sentence.")])
+        registry.get("embedding_cache")
+    except Exception as e:
+        _warm_up_error = f"{type(e).__name__}: {e}"
+        log("inference.py", f"모델 워밍업 실패 → {_warm_up_error}")
+        return
+    _warm_up_error = None
+    models_ready.set()
+    log("inference.py", "모델 워밍업 완료")
+
+
+def warm_up_error() -> str | None:
+    return _warm_up_error
+
+
+def start_warm_up():
+    """
+    MODEL_WARMUP이 켜져 있으면 백그라운드 스레드에서 warm_up을 실행합니다.
+    꺼져 있으면 모델은 첫 요청에서 로드되고 준비 완료로 간주합니다.
+
+    프로세스당 한 번만 시작하므로 여러 번 호출해도 됩니다.
+    gunicorn post_fork / __main__ 외의 WSGI 서버에서는 app의 첫 요청에서 시작됩니다.
+    """
+    global _warm_up_pid
+    pid = os.getpid()
+    if _warm_up_pid == pid:
+        return None
+    with _warm_up_lock:
+        if _warm_up_pid == pid:
+            return None
+        _warm_up_pid = pid
+    if not MODEL_WARMUP:
+        models_ready.set()
+        return None
+    return registry.warm_up_async(warm_up)
+
+
+def embedding_cache_stats():
+    # 임베딩 캐시가 아직 만들어지지 않았으면 None (stats 조회로 모델을 로드하지 않음)
+    embedding_cache = registry.peek("embedding_cache")
+    return embedding_cache.stats() if embedding_cache is not None else None
+
+
+def encode(texts, convert_to_tensor=False):
+    """
+    embedding_model.encode를 감싼 캐시 적용 임베딩 함수
+    캐시에 없는 문장만 한 번의 encode 호출로 계산합니다.
+
+    Args:
+        texts (str | list[str]): 임베딩할 문장 (하나 또는 여러 개)
+        convert_to_tensor (bool, optional): True면 torch.Tensor로 반환
+
+    Returns:
+        np.ndarray | torch.Tensor: 문장 하나면 (dim,), 여러 개면 (n, dim)
+    """
+    single = isinstance(texts, str)
+    texts = [texts] if single else list(texts)
+    embedding_model = registry.get("embedding")
+    embedding_cache = registry.get("embedding_cache")
+
+    keys = [embedding_cache.key(text) for text in texts]
+    vectors = embedding_cache.get_many(keys)
+
+    # 캐시에 없는 문장만 중복 제거 후 임베딩
+    missing = {}
+    for key, text, vector in zip(keys, texts, vectors):
+        if vector is None and key not in missing:
+            missing[key] = normalize_text(text)
+    if missing:
+        with span("embed", sentences=len(missing)):
+            computed = embedding_model.encode(list(missing.values()))
+        embedding_cache.put_many(list(missing.keys()), computed)
+        computed = dict(zip(missing.keys(), computed))
+        vectors = [
+            computed[key] if vector is None else vector
+            for key, vector in zip(keys, vectors)
+        ]
+
+    if not texts:
+        result = np.zeros((0, embedding_model.get_sentence_embedding_dimension()))
+    else:
+        result = np.stack(vectors).astype(np.float32)
+    if single:
+        result = result[0]
+    if convert_to_tensor:
+        import torch
+
+        return torch.from_numpy(result)
+    return result
+
+
 def rank_keywords(keywords, video_summary):
-    video_emb = embedding_model.encode(video_summary, convert_to_tensor=True)
+    from sentence_transformers import util
+
+    video_emb = encode(video_summary, convert_to_tensor=True)
 
     ranked = []
     for kw in keywords:
-        kw_emb = embedding_model.encode(kw, convert_to_tensor=True)
+        kw_emb = encode(kw, convert_to_tensor=True)
         score = util.cos_sim(kw_emb, video_emb).item()
         ranked.append((kw, score))
 
@@ -25,6 +190,52 @@ def rank_keywords(keywords, video_summary):
     return [kw for kw, _ in ranked]
 
 
+def rank_keywords_batch(keywords_list, video_summaries, summary_embeddings=None):
+    """
+    여러 주장의 키워드를 한 번에 정렬합니다.
+    요약문과 키워드를 각각 한 번의 encode 호출로 임베딩합니다.
+
+    Args:
+        keywords_list (list[list[str]]): 주장별 키워드 리스트
+        video_summaries (list[str]): 주장별 영상 요약문
+        summary_embeddings (dict[str, np.ndarray], optional): 이미 계산된 요약문 임베딩
+            (영상 세션에 저장된 값, 여기 있는 요약문은 다시 임베딩하지 않음)
+
+    Returns:
+        list[list[str]]: 주장별로 중요도 순으로 정렬된 키워드
+    """
+    import torch
+    from sentence_transformers import util
+
+    summaries = list(dict.fromkeys(video_summaries))
+    keywords = list(dict.fromkeys(kw for kws in keywords_list for kw in kws))
+    if not keywords:
+        # 모든 주장에 키워드가 없으면 요약문도 임베딩하지 않음
+        return [[] for _ in keywords_list]
+
+    known = summary_embeddings or {}
+    missing = [summary for summary in summaries if summary not in known]
+    computed = dict(zip(missing, encode(missing))) if missing else {}
+    summary_embs = torch.from_numpy(
+        np.stack(
+            [known.get(summary, computed.get(summary)) for summary in summaries]
+        ).astype(np.float32)
+    )
+    summary_idx = {summary: i for i, summary in enumerate(summaries)}
+    keyword_idx = {kw: i for i, kw in enumerate(keywords)}
+    keyword_embs = encode(keywords, convert_to_tensor=True)
+    scores = util.cos_sim(keyword_embs, summary_embs)
+
+    results = []
+    for kws, summary in zip(keywords_list, video_summaries):
+        ranked = [
+            (kw, scores[keyword_idx[kw]][summary_idx[summary]].item()) for kw in kws
+        ]
+        ranked.sort(key=lambda x: x[1], reverse=True)  # 중요도 높은 순
+        results.append([kw for kw, _ in ranked])
+    return results
+
+
 def find_top_k_answers_regex(query, sentences, k=3):
     """
     Finds the top k sentences from a given text that are most similar to a query using cosine similarity of sentence embeddings.
@@ -38,38 +249,29 @@ def find_top_k_answers_regex(query, sentences, k=3):
         list[tuple]: A list of tuples, each containing a sentence and its similarity score, ordered by similarity in descending order.
     """
     # 문장 임베딩 생성
-    sentence_embeddings = embedding_model.encode(sentences)
+    sentence_embeddings = encode(sentences)
 
     # 질문 임베딩 생성
-    query_embedding = embedding_model.encode(query)
-
-    # 질문과 각 문장 간의 유사도 계산
-    similarities = util.cos_sim(query_embedding, sentence_embeddings)[0]
-
-    # 유사도와 문장 인덱스를 함께 저장
-    sentence_scores = list(zip(sentences, similarities))
-
-    # 유사도 0.5 이상 필터링
-    filtered_sentence_scores = [s for s in sentence_scores if s[1] >= 0.5]
+    query_embedding = encode(query)
 
-    # 유사도 기준으로 내림차순 정렬
-    filtered_sentence_scores = sorted(
-        filtered_sentence_scores, key=lambda x: x[1], reverse=True
+    top_k_sentences_with_scores = find_top_k_by_embedding(
+        query_embedding, sentences, sentence_embeddings, k
     )
-
-    # 상위 k개 문장 반환
-    top_k_sentences_with_scores = filtered_sentence_scores[:k]
-    top_k_scores = []
-    for sentence_score in top_k_sentences_with_scores:
-        top_k_scores.append(sentence_score[1])
-    print("[inference.py]:", top_k_sentences_with_scores)
-
     return top_k_sentences_with_scores, sentence_embeddings
 
 
 def find_top_k_answers_regex_cache(query, sentences, sentence_embeddings, k=3):
     # 질문 임베딩 생성
-    query_embedding = embedding_model.encode(query)
+    query_embedding = encode(query)
+
+    return find_top_k_by_embedding(query_embedding, sentences, sentence_embeddings, k)
+
+
+def find_top_k_by_embedding(query_embedding, sentences, sentence_embeddings, k=3):
+    """
+    이미 계산된 질문/문장 임베딩으로 유사도 상위 k개 문장을 찾습니다.
+    """
+    from sentence_transformers import util
 
     # 질문과 각 문장 간의 유사도 계산
     similarities = util.cos_sim(query_embedding, sentence_embeddings)[0]
@@ -87,46 +289,110 @@ def find_top_k_answers_regex_cache(query, sentences, sentence_embeddings, k=3):
 
     # 상위 k개 문장 반환
     top_k_sentences_with_scores = filtered_sentence_scores[:k]
-    top_k_scores = []
-    for sentence_score in top_k_sentences_with_scores:
-        top_k_scores.append(sentence_score[1])
-    print("[inference.py]:", top_k_sentences_with_scores)
+    log("inference.py", top_k_sentences_with_scores)
 
     return top_k_sentences_with_scores
 
 
-def analyze_claim_with_evidences(claim, evidences):
+def select_top_k_sentences(
+    query_embedding, sentence_lists, embedding_lists, k=3, threshold=0.5
+):
     """
-    각 evidence가 claim에 대해 어떤 판단(entailment, contradiction, neutral)을 하는지 분석합니다.
+    모든 기사의 문장 임베딩을 한 행렬로 쌓아 한 번의 행렬-벡터 곱으로 유사도를 계산하고
+    기사별 상위 k개 문장을 뽑습니다. (threshold 미만은 마스크 처리)
 
     Args:
-        claim (str): 확인하고자 하는 주장
-        evidences (list[str]): 해당 주장과 비교할 증거 문장들
+        query_embedding: 주장 임베딩 (dim,)
+        sentence_lists (list[list[str]]): 기사별 문장 리스트
+        embedding_lists (list): 기사별 문장 임베딩 (n_i, dim)
+        k (int, optional): 기사별로 뽑을 문장 수
+        threshold (float, optional): 최소 코사인 유사도
 
     Returns:
-        list[dict]: 각 evidence에 대한 판단 결과 리스트
+        list[list[tuple[str, float, int]]]: 기사별 (문장, 유사도, 문장 번호) 리스트, 유사도 내림차순
+            (같은 문장이 기사에 여러 번 나와도 문장 번호로 위치를 구분)
     """
-    results = []
+    import torch
+
+    lengths = [len(sentences) for sentences in sentence_lists]
+    if not lengths or max(lengths) == 0:
+        return [[] for _ in sentence_lists]
+
+    matrix = torch.as_tensor(
+        np.concatenate(
+            [
+                np.asarray(e, dtype=np.float32).reshape(n, -1)
+                for e, n in zip(embedding_lists, lengths)
+            ]
+        )
+    )
+    query = torch.as_tensor(np.asarray(query_embedding, dtype=np.float32))
+    matrix = torch.nn.functional.normalize(matrix, dim=1)
+    query = torch.nn.functional.normalize(query, dim=0)
+    scores = matrix @ query
+
+    # (기사 수, 최대 문장 수) 행렬에 점수를 배치하고 threshold 미만은 -inf로 마스크
+    article_idx = torch.repeat_interleave(
+        torch.arange(len(lengths)), torch.tensor(lengths)
+    )
+    starts = torch.tensor(np.cumsum([0] + lengths[:-1]))
+    position_idx = torch.arange(len(scores)) - starts[article_idx]
+    padded = torch.full((len(lengths), max(lengths)), float("-inf"))
+    padded[article_idx, position_idx] = torch.where(
+        scores >= threshold, scores, torch.tensor(float("-inf"))
+    )
 
-    for evidence in evidences:
-        # NLI 모델 입력: premise = evidence, hypothesis = claim
-        output = nli_pipeline(f"{evidence} [SEP] {claim}")
+    top_scores, top_idx = torch.topk(padded, min(k, padded.shape[1]), dim=1)
+    top_scores, top_idx = top_scores.tolist(), top_idx.tolist()
 
-        # 결과는 label과 score가 포함된 리스트 (보통 첫 번째가 가장 높은 점수)
-        label = output[0]["label"]
-        score = output[0]["score"]
+    results = []
+    for sentences, row_scores, row_idx in zip(sentence_lists, top_scores, top_idx):
         results.append(
-            {
-                "evidence": evidence,
-                "label": label.lower(),  # entailment, contradiction, neutral
-                "confidence": round(score, 4),
-            }
+            [
+                (sentences[i], score, i)
+                for score, i in zip(row_scores, row_idx)
+                if score != float("-inf")
+            ]
         )
+    return results
+
 
+def encode_sentence_lists(sentence_lists):
+    """
+    여러 기사의 문장 리스트를 한 번의 encode 호출로 임베딩하고
+    기사별 임베딩 배열로 다시 나눠 반환합니다.
+    """
+    flat = [sentence for sentences in sentence_lists for sentence in sentences]
+    if not flat:
+        return [[] for _ in sentence_lists]
+    flat_embeddings = encode(flat)
+
+    results = []
+    offset = 0
+    for sentences in sentence_lists:
+        results.append(flat_embeddings[offset : offset + len(sentences)])
+        offset += len(sentences)
     return results
 
 
-def analyze_claim_with_evidence(claim, evidence):
+def analyze_nli_pairs(pairs, batch_size=NLI_BATCH_SIZE):
+    """
+    (premise, hypothesis) 쌍 여러 개를 배치로 NLI 분석합니다.
+    토큰 길이순으로 정렬해 패딩을 줄이고 batch_size 단위로 모델(torch 또는 onnx)에 넣습니다.
+    입력 형식은 기존 파이프라인 호출과 같은 "{premise} [SEP] {hypothesis}"입니다.
+
+    Args:
+        pairs (list[tuple[str, str]]): (증거 문장, 주장) 쌍 리스트
+        batch_size (int, optional): 한 번에 모델에 넣는 쌍의 수
+
+    Returns:
+        list[dict]: 각 쌍에 대한 {"label", "confidence", "probs"} 리스트 (입력 순서 유지)
+            probs는 {"entailment", "neutral", "contradiction"} 확률 분포
+    """
+    return predict_nli_pairs(registry.get("nli"), pairs, batch_size)
+
+
+def analyze_claim_with_evidences(claim, evidences):
     """
     각 evidence가 claim에 대해 어떤 판단(entailment, contradiction, neutral)을 하는지 분석합니다.
 
@@ -137,12 +403,37 @@ def analyze_claim_with_evidence(claim, evidence):
     Returns:
         list[dict]: 각 evidence에 대한 판단 결과 리스트
     """
-
     # NLI 모델 입력: premise = evidence, hypothesis = claim
-    output = nli_pipeline(f"{evidence} [SEP] {claim}")
+    outputs = analyze_nli_pairs([(evidence, claim) for evidence in evidences])
+
+    return [
+        {"evidence": evidence, **output} for evidence, output in zip(evidences, outputs)
+    ]
+
+
+def analyze_claim_with_evidence(claim, evidence):
+    """
+    evidence가 claim에 대해 어떤 판단(entailment, contradiction, neutral)을 하는지 분석합니다.
 
-    # 결과는 label과 score가 포함된 리스트 (보통 첫 번째가 가장 높은 점수)
-    label = output[0]["label"]
-    score = output[0]["score"]
+    Args:
+        claim (str): 확인하고자 하는 주장
+        evidence (str): 해당 주장과 비교할 증거 문장
 
-    return {"label": label.lower(), "confidence": round(score, 4)}
+    Returns:
+        dict: evidence에 대한 판단 결과
+    """
+    return analyze_nli_pairs([(evidence, claim)])[0]
+
+
+def analyze_claim_with_evidence_pairs(pairs):
+    """
+    (claim, evidence) 쌍 여러 개를 배치로 분석합니다.
+
+    Args:
+        pairs (list[tuple[str, str]]): (주장, 증거 문장) 쌍 리스트
+
+    Returns:
+        list[dict]: 각 쌍에 대한 {"label", "confidence", "probs"} 리스트 (입력 순서 유지)
+    """
+    # NLI 모델 입력: premise = evidence, hypothesis = claim
+    return analyze_nli_pairs([(evidence, claim) for claim, evidence in pairs])
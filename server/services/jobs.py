@@ -0,0 +1,181 @@
+import json
+import time
+import uuid
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from tools.metrics import log
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class StreamLimitError(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, items: list):
+        self.id = uuid.uuid4().hex
+        self.items = items
+        self.total = len(items)
+        self.results = []  # 완료된 순서대로 저장
+        self.created_at = time.time()
+        self.finished_at = None if items else self.created_at
+        self.condition = threading.Condition()
+
+    @property
+    def status(self):
+        if self.finished_at is not None:
+            return "done"
+        return "running" if self.results else "queued"
+
+    def add_result(self, result: dict):
+        with self.condition:
+            self.results.append(result)
+            if len(self.results) == self.total:
+                self.finished_at = time.time()
+            self.condition.notify_all()
+
+    def to_dict(self):
+        with self.condition:
+            return {
+                "job_id": self.id,
+                "status": self.status,
+                "total": self.total,
+                "completed": len(self.results),
+                "results": sorted(self.results, key=lambda r: r["index"]),
+            }
+
+    def events(self, keepalive: float = 15.0, max_seconds: float | None = None):
+        """
+        완료된 결과를 SSE 형식으로 하나씩 내보내고, 모두 끝나면 done 이벤트로 종료합니다.
+        max_seconds가 지나도 끝나지 않으면 timeout 이벤트로 종료합니다.
+        (스트림 하나가 gthread 스레드 하나를 차지하므로, 나머지는 /jobs/<id> 폴링으로 받음)
+        """
+        deadline = None if max_seconds is None else time.monotonic() + max_seconds
+        sent = 0
+        while True:
+            wait = keepalive
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            with self.condition:
+                if sent == len(self.results) and self.finished_at is None:
+                    self.condition.wait(timeout=wait)
+                new_results = self.results[sent:]
+                finished = self.finished_at is not None
+            if not new_results and not finished:
+                if deadline is not None and time.monotonic() >= deadline:
+                    yield f"event: timeout\ndata: {json.dumps({'job_id': self.id, 'completed': sent})}\n\n"
+                    return
+                yield ": keepalive\n\n"
+                continue
+            for result in new_results:
+                yield f"event: result\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
+            sent += len(new_results)
+            if finished and sent == self.total:
+                yield f"event: done\ndata: {json.dumps({'job_id': self.id, 'total': self.total})}\n\n"
+                return
+
+
+class JobManager:
+    """
+    주장 단위 비동기 팩트체크 작업 관리
+
+    - 작업(job) 하나는 주장 여러 개, 주장 하나가 워커 풀의 작업 단위
+    - 대기 중인 주장이 max_queue를 넘으면 새 작업을 거절 (backpressure)
+    - 끝난 작업은 job_ttl초 후 정리
+    - 열려 있는 SSE 스트림은 max_streams개까지 (스트림마다 웹 워커 스레드 하나를 차지)
+    """
+
+    def __init__(
+        self,
+        run,
+        max_workers: int = 2,
+        max_queue: int = 200,
+        job_ttl=600,
+        max_streams: int = 2,
+        max_stream_seconds: float = 300,
+        failed=None,
+    ):
+        self.run = run  # run(item) -> dict
+        # failed(item) -> dict: run이 예외를 던졌을 때 대신 보낼 결과
+        self.failed = failed or (lambda item: {"error": True})
+        self.max_queue = max_queue
+        self.job_ttl = job_ttl
+        self.max_streams = max_streams
+        self.max_stream_seconds = max_stream_seconds
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="job")
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.queued = 0  # 아직 끝나지 않은 주장 수
+        self.streams = 0  # 열려 있는 SSE 스트림 수
+
+    def submit(self, items: list) -> Job:
+        job = Job(items)
+        with self.lock:
+            self._cleanup()
+            if self.queued + job.total > self.max_queue:
+                raise QueueFullError(
+                    f"queue full ({self.queued}/{self.max_queue} claims pending)"
+                )
+            self.queued += job.total
+            self.jobs[job.id] = job
+
+        for index, item in enumerate(items):
+            # 요청의 request id가 워커 스레드 로그에도 남도록 컨텍스트 복사
+            context = contextvars.copy_context()
+            self.executor.submit(context.run, self._run_item, job, index, item)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def queue_depth(self) -> int:
+        with self.lock:
+            return self.queued
+
+    def open_streams(self) -> int:
+        with self.lock:
+            return self.streams
+
+    def open_stream(self, job: Job):
+        """
+        스트림 자리를 하나 잡고 job의 SSE 이벤트 생성기를 반환합니다.
+        응답이 끝나면 close_stream()으로 자리를 반납해야 합니다.
+        """
+        with self.lock:
+            if self.streams >= self.max_streams:
+                raise StreamLimitError(
+                    f"too many open streams ({self.streams}/{self.max_streams})"
+                )
+            self.streams += 1
+        return job.events(max_seconds=self.max_stream_seconds)
+
+    def close_stream(self):
+        with self.lock:
+            self.streams -= 1
+
+    def _run_item(self, job, index, item):
+        try:
+            result = self.run(item)
+        except Exception as e:
+            log("jobs.py", f"job {job.id} item {index} 실패: {e}")
+            result = self.failed(item)
+        finally:
+            with self.lock:
+                self.queued -= 1
+        job.add_result({"index": index, **result})
+
+    def _cleanup(self):
+        now = time.time()
+        expired = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.job_ttl
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
@@ -0,0 +1,94 @@
+import threading
+
+import numpy as np
+
+
+def keyword_text(keywords: list[str]) -> str:
+    # 키워드 순서와 중복에 상관없이 같은 문장이 되도록 정렬
+    return " ".join(sorted(set(keywords)))
+
+
+class KeywordIndex:
+    """
+    캐시 항목의 키워드 조합 임베딩을 메모리에 모아 둔 벡터 색인
+
+    - load(after_id): id가 after_id보다 큰 항목 [(id, keywords), ...] 반환 (id 오름차순)
+    - encode(texts): 문장 목록 → (n, dim) 임베딩
+    - search() 때마다 새로 추가된 항목만 임베딩해 색인에 덧붙임
+      (다른 워커 프로세스가 추가한 항목도 반영)
+    - 임베딩은 색인 lock 밖에서 계산하고 덧붙일 때만 lock을 잡음
+      (다른 스레드가 임베딩하는 동안 search는 기다리지 않고 현재 색인으로 검색)
+    """
+
+    def __init__(self, load, encode, initial_capacity: int = 256):
+        self.load = load
+        self.encode = encode
+        self.initial_capacity = initial_capacity
+        self.lock = threading.Lock()  # ids / keywords / matrix
+        self.sync_lock = threading.Lock()  # 같은 항목을 두 스레드가 임베딩하지 않도록
+        self.ids = []
+        self.keywords = []
+        self.matrix = None  # (capacity, dim), 앞의 len(ids)행만 사용
+        self.last_id = 0
+
+    def __len__(self):
+        return len(self.ids)
+
+    def sync(self, wait: bool = True):
+        """
+        새 항목을 임베딩해 색인에 덧붙입니다.
+        wait=False이면 다른 스레드가 sync 중일 때 기다리지 않고 돌아갑니다.
+        """
+        if not self.sync_lock.acquire(blocking=wait):
+            return
+        try:
+            entries = self.load(self.last_id)
+            if not entries:
+                return
+            vectors = self._normalize(
+                self.encode([keyword_text(keywords) for _, keywords in entries])
+            )
+            with self.lock:
+                self._append(entries, vectors)
+            self.last_id = entries[-1][0]
+        finally:
+            self.sync_lock.release()
+
+    def _append(self, entries, vectors):
+        size = len(self.ids)
+        if self.matrix is None or size + len(entries) > len(self.matrix):
+            # 용량을 두 배씩 늘려 추가할 때마다 전체를 복사하지 않음
+            capacity = max(self.initial_capacity, size + len(entries))
+            if self.matrix is not None:
+                capacity = max(capacity, len(self.matrix) * 2)
+            matrix = np.zeros((capacity, vectors.shape[1]), dtype=np.float32)
+            if size:
+                matrix[:size] = self.matrix[:size]
+            self.matrix = matrix
+        self.matrix[size : size + len(entries)] = vectors
+        self.ids.extend(entry_id for entry_id, _ in entries)
+        self.keywords.extend(keywords for _, keywords in entries)
+
+    def search(self, keywords: list[str]):
+        """
+        키워드 조합과 코사인 유사도가 가장 높은 항목을 찾습니다.
+
+        Returns:
+            tuple | None: (entry_id, keywords, similarity)
+        """
+        # 색인이 비어 있을 때만 다른 스레드의 sync를 기다림
+        self.sync(wait=not self.ids)
+        if not self.ids:
+            return None
+        query = self._normalize(self.encode([keyword_text(keywords)]))[0]
+        with self.lock:
+            size = len(self.ids)
+            scores = self.matrix[:size] @ query
+            best = int(np.argmax(scores))
+            return self.ids[best], self.keywords[best], float(scores[best])
+
+    @staticmethod
+    def _normalize(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
@@ -0,0 +1,86 @@
+import time
+import resource
+import threading
+
+from tools.metrics import log
+
+
+def _rss_mb():
+    # 현재 RSS (Linux는 /proc, 그 외에는 최대 RSS로 대체)
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / 1024 / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class ModelRegistry:
+    """
+    이름 → 로더 함수로 등록해 두고 처음 사용할 때 로드하는 모델 저장소
+
+    - 같은 모델을 여러 스레드가 동시에 요청해도 한 번만 로드
+    - 모델별 로드 시간과 로드 전후 RSS 증가량 기록
+    - warm_up_async()로 백그라운드 스레드에서 미리 로드 가능
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loaders = {}
+        self.models = {}
+        self.load_locks = {}
+        self.metrics = {}
+
+    def register(self, name: str, loader):
+        with self.lock:
+            self.loaders[name] = loader
+            self.load_locks[name] = threading.Lock()
+
+    def get(self, name: str):
+        model = self.models.get(name)
+        if model is not None:
+            return model
+
+        with self.load_locks[name]:
+            # 다른 스레드가 먼저 로드했으면 그대로 사용
+            if name in self.models:
+                return self.models[name]
+            rss_before = _rss_mb()
+            start = time.perf_counter()
+            model = self.loaders[name]()
+            seconds = time.perf_counter() - start
+            self.metrics[name] = {
+                "load_seconds": round(seconds, 3),
+                "rss_delta_mb": round(_rss_mb() - rss_before, 1),
+                "loaded_at": time.time(),
+            }
+            self.models[name] = model
+        log("models.py", f"{name} 로드 완료 ({seconds:.1f}s)")
+        return model
+
+    def peek(self, name: str):
+        # 로드하지 않고 이미 로드된 모델만 반환
+        return self.models.get(name)
+
+    def load_all(self, names=None):
+        for name in names or list(self.loaders):
+            self.get(name)
+
+    def warm_up_async(self, fn=None) -> threading.Thread:
+        """
+        백그라운드 스레드에서 fn(기본: 등록된 모델 전체 로드)을 실행합니다.
+        """
+        thread = threading.Thread(
+            target=fn or self.load_all, name="model-warmup", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def stats(self) -> dict:
+        return {
+            name: {"loaded": name in self.models, **self.metrics.get(name, {})}
+            for name in self.loaders
+        }
+
+
+registry = ModelRegistry()
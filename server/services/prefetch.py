@@ -0,0 +1,237 @@
+import os
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from tools.metrics import log, metrics
+
+prefetch_claims = metrics.counter(
+    "prefetch_claims_total",
+    "Speculative evidence prefetch per claim "
+    "(result: scheduled, over_budget, queue_full, done, failed, cancelled)",
+    ["result"],
+)
+prefetch_lookups = metrics.counter(
+    "prefetch_lookups_total",
+    "Prefetch state when a claim is analyzed (result: warm, waited, cancelled, miss)",
+    ["result"],
+)
+
+# 미리 가져오기 스레드의 nice 값 (Linux에서 스레드 단위로 적용)
+PREFETCH_NICE = int(os.getenv("PREFETCH_NICE", "10"))
+
+
+def _lower_priority():
+    # 다른 플랫폼이나 권한 문제로 실패하면 그대로 실행
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), PREFETCH_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+class _Task:
+    __slots__ = ("future", "cancel", "wanted")
+
+    def __init__(self):
+        self.future = None
+        self.cancel = threading.Event()
+        self.wanted = False  # 분석 요청이 이 작업을 기다리는 중 (양보하지 않음)
+
+
+class _Video:
+    __slots__ = ("used", "tasks")
+
+    def __init__(self):
+        self.used = 0  # 예산에서 사용한 주장 수
+        self.tasks = {}  # 주장 key → _Task
+
+
+class Prefetcher:
+    """
+    /batch_extract로 추출한 주장의 근거(키워드 순위, 기사 수집, 기사 문장 임베딩)를
+    사용자가 팩트체크를 누르기 전에 낮은 우선순위로 미리 준비합니다.
+
+    - 영상마다 budget개 주장까지만 (세션 키 기준), 전체 대기 작업은 max_queue개까지
+    - 작업 스레드는 nice 값을 높여 실행하고, 분석 요청(foreground)이 진행 중이면
+      단계 사이에서 최대 yield_timeout초 양보
+    - 분석 요청이 오면 claim()으로 그 주장의 대기 작업은 취소하고 (바로 분석),
+      실행 중인 작업은 최대 wait_timeout초 기다려 준비된 근거를 사용
+    - cancel(video)은 그 영상의 대기 작업을 취소하고 실행 중인 작업은 다음 단계에서 멈춤
+    """
+
+    def __init__(
+        self,
+        run,
+        enabled: bool = True,
+        max_workers: int = 1,
+        budget: int = 20,
+        max_queue: int = 100,
+        max_videos: int = 500,
+        wait_timeout: float = 10.0,
+        yield_timeout: float = 5.0,
+    ):
+        self.run = run  # run(item, proceed) -> 완료 여부, proceed()가 False면 중단
+        self.enabled = enabled and budget > 0
+        self.budget = budget
+        self.max_queue = max_queue
+        self.max_videos = max_videos
+        self.wait_timeout = wait_timeout
+        self.yield_timeout = yield_timeout
+        self.executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="prefetch", initializer=_lower_priority
+        )
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.videos = OrderedDict()  # 세션 키 → _Video
+        self.queued = 0  # 대기 또는 실행 중인 작업 수
+        self.active = 0  # 진행 중인 분석 요청 수
+
+    def submit(self, video: str, items: list) -> int:
+        """
+        Args:
+            video (str): 영상 세션 키
+            items (list[tuple[str, dict]]): (주장 key, 작업 item)
+
+        Returns:
+            int: 새로 등록한 작업 수
+        """
+        if not self.enabled or video is None:
+            return 0
+        scheduled = 0
+        with self.lock:
+            state = self._video(video)
+            for key, item in items:
+                if key in state.tasks:
+                    continue
+                if state.used >= self.budget:
+                    prefetch_claims.inc(result="over_budget")
+                    continue
+                if self.queued >= self.max_queue:
+                    prefetch_claims.inc(result="queue_full")
+                    continue
+                task = state.tasks[key] = _Task()
+                state.used += 1
+                self.queued += 1
+                # 요청의 request id가 작업 로그에도 남도록 컨텍스트 복사
+                context = contextvars.copy_context()
+                task.future = self.executor.submit(context.run, self._run, item, task)
+                scheduled += 1
+        prefetch_claims.inc(scheduled, result="scheduled")
+        return scheduled
+
+    def claim(self, video: str | None, keys: list[str]):
+        """
+        분석하려는 주장의 미리 가져오기 작업을 정리합니다.
+        대기 중이면 취소하고, 실행 중이면 끝날 때까지 (최대 wait_timeout초) 기다립니다.
+        """
+        if not self.enabled or video is None:
+            return
+        running = []
+        with self.changed:
+            state = self.videos.get(video)
+            for key in keys:
+                task = state.tasks.get(key) if state is not None else None
+                if task is None:
+                    prefetch_lookups.inc(result="miss")
+                elif task.future.done():
+                    prefetch_lookups.inc(result="warm")
+                elif task.future.cancel():
+                    self.queued -= 1
+                    del state.tasks[key]
+                    prefetch_lookups.inc(result="cancelled")
+                else:
+                    task.wanted = True
+                    running.append(task.future)
+                    prefetch_lookups.inc(result="waited")
+            if running:
+                self.changed.notify_all()
+        if running:
+            wait(running, timeout=self.wait_timeout)
+
+    def cancel(self, video: str | None) -> int:
+        """
+        Returns:
+            int: 취소한 작업 수 (실행 중이던 작업 포함)
+        """
+        if video is None:
+            return 0
+        cancelled = 0
+        with self.changed:
+            state = self.videos.get(video)
+            if state is None:
+                return 0
+            for key, task in list(state.tasks.items()):
+                if task.future.done():
+                    continue
+                task.cancel.set()
+                if task.future.cancel():
+                    self.queued -= 1
+                    del state.tasks[key]
+                    prefetch_claims.inc(result="cancelled")
+                cancelled += 1
+            self.changed.notify_all()
+        return cancelled
+
+    @contextmanager
+    def foreground(self):
+        # 분석 요청 구간, 이 동안 미리 가져오기 작업은 단계 사이에서 양보
+        with self.lock:
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self.changed:
+                self.active -= 1
+                self.changed.notify_all()
+
+    def queue_depth(self) -> int:
+        with self.lock:
+            return self.queued
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "enabled": self.enabled,
+                "queued": self.queued,
+                "videos": len(self.videos),
+                "budget": self.budget,
+            }
+
+    def _video(self, video):
+        state = self.videos.get(video)
+        if state is None:
+            state = self.videos[video] = _Video()
+            # 오래된 영상의 상태부터 정리 (대기 작업은 취소)
+            while len(self.videos) > self.max_videos:
+                _, old = self.videos.popitem(last=False)
+                for task in old.tasks.values():
+                    task.cancel.set()
+                    if task.future.cancel():
+                        self.queued -= 1
+                        prefetch_claims.inc(result="cancelled")
+        self.videos.move_to_end(video)
+        return state
+
+    def _proceed(self, task):
+        # 분석 요청이 진행 중이면 잠시 양보, 취소됐으면 False
+        with self.changed:
+            self.changed.wait_for(
+                lambda: task.cancel.is_set() or task.wanted or self.active == 0,
+                timeout=self.yield_timeout,
+            )
+        return not task.cancel.is_set()
+
+    def _run(self, item, task):
+        result = "cancelled"
+        try:
+            if self._proceed(task) and self.run(item, lambda: self._proceed(task)):
+                result = "done"
+        except Exception as e:
+            log("prefetch.py", f"미리 가져오기 실패: {item.get('claim')} → {e}")
+            result = "failed"
+        finally:
+            with self.lock:
+                self.queued -= 1
+        prefetch_claims.inc(result=result)
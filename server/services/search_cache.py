@@ -0,0 +1,159 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from tools.metrics import metrics
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    key TEXT PRIMARY KEY,
+    listings TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS listings_created_at ON listings (created_at);
+CREATE TABLE IF NOT EXISTS empty_queries (
+    key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS empty_queries_created_at ON empty_queries (created_at);
+"""
+
+search_cache_lookups = metrics.counter(
+    "search_cache_lookups_total",
+    "News search cache lookups (kind: listing, empty)",
+    ["kind", "result"],
+)
+
+
+class SearchCache:
+    """
+    뉴스 검색 결과 캐시 (SQLite, 기사 본문 캐시와 별도)
+
+    - listings: (검색어, 페이지 수) → [(제목, 링크), ...], listing_ttl초 동안 사용
+    - empty_queries: 검색 결과가 없었던 검색어, empty_ttl초 동안 다시 검색하지 않음
+    - 종류별로 만료된 항목과 max_*_items를 넘는 오래된 항목을 가끔씩 정리
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        listing_ttl: float = 3600.0,
+        empty_ttl: float = 600.0,
+        max_listing_items: int = 20000,
+        max_empty_items: int = 10000,
+    ):
+        self.db_path = db_path
+        self.ttl = {"listings": listing_ttl, "empty_queries": empty_ttl}
+        self.max_items = {
+            "listings": max_listing_items,
+            "empty_queries": max_empty_items,
+        }
+        self._local = threading.local()
+        self._writes = {"listings": 0, "empty_queries": 0}
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        # fork된 워커는 부모 프로세스의 연결을 쓰지 않고 새로 연결
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def key(search_url: str, query: str, pages: int | None = None) -> str:
+        # 검색 URL이 다르면 (로컬 스텁 서버 등) 따로 저장
+        return "\x00".join([search_url, query, *([str(pages)] if pages else [])])
+
+    def get_listings(self, search_url: str, query: str, pages: int):
+        """
+        Returns:
+            list[tuple[str, str]] | None: 캐시된 (제목, 링크) 목록, 없거나 만료되면 None
+        """
+        if self.ttl["listings"] <= 0:
+            return None
+        row = (
+            self._connect()
+            .execute(
+                "SELECT listings FROM listings WHERE key = ? AND created_at > ?",
+                (
+                    self.key(search_url, query, pages),
+                    time.time() - self.ttl["listings"],
+                ),
+            )
+            .fetchone()
+        )
+        search_cache_lookups.inc(
+            kind="listing", result="hit" if row is not None else "miss"
+        )
+        if row is None:
+            return None
+        return [tuple(item) for item in json.loads(row[0])]
+
+    def put_listings(self, search_url: str, query: str, pages: int, listings):
+        if self.ttl["listings"] <= 0:
+            return
+        self._put(
+            "listings",
+            "INSERT OR REPLACE INTO listings (key, listings, created_at) VALUES (?, ?, ?)",
+            (
+                self.key(search_url, query, pages),
+                json.dumps(listings, ensure_ascii=False),
+                time.time(),
+            ),
+        )
+
+    def is_empty(self, search_url: str, query: str) -> bool:
+        if self.ttl["empty_queries"] <= 0:
+            return False
+        row = (
+            self._connect()
+            .execute(
+                "SELECT 1 FROM empty_queries WHERE key = ? AND created_at > ?",
+                (
+                    self.key(search_url, query),
+                    time.time() - self.ttl["empty_queries"],
+                ),
+            )
+            .fetchone()
+        )
+        search_cache_lookups.inc(
+            kind="empty", result="hit" if row is not None else "miss"
+        )
+        return row is not None
+
+    def put_empty(self, search_url: str, query: str):
+        if self.ttl["empty_queries"] <= 0:
+            return
+        self._put(
+            "empty_queries",
+            "INSERT OR REPLACE INTO empty_queries (key, created_at) VALUES (?, ?)",
+            (self.key(search_url, query), time.time()),
+        )
+
+    def _put(self, table: str, sql: str, params: tuple):
+        conn = self._connect()
+        with conn:
+            conn.execute(sql, params)
+            self._writes[table] += 1
+            # 가끔씩만 만료/초과분 정리
+            if self._writes[table] >= 100:
+                self._writes[table] = 0
+                conn.execute(
+                    f"DELETE FROM {table} WHERE created_at <= ?",
+                    (time.time() - self.ttl[table],),
+                )
+                conn.execute(
+                    f"""
+                    DELETE FROM {table} WHERE key IN (
+                        SELECT key FROM {table} ORDER BY created_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_items[table],),
+                )
@@ -0,0 +1,119 @@
+import os
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from services.collector import collect_data
+from tools.metrics import log, metrics
+
+search_plan_queries = metrics.counter(
+    "search_plan_queries_total",
+    "Keyword subsets handled by the search planner",
+    ["result"],  # found, empty, cancelled, error
+)
+
+
+class SearchPlanner:
+    """
+    키워드 부분집합(상위 k개, k-1개, ...) 검색을 동시에 실행하는 검색 계획기
+
+    - 우선순위가 높은(키워드가 많은) 부분집합부터 검색 시작
+    - 앞선 검색이 hedge_delay초 안에 끝나지 않으면 다음 부분집합을 추가로 시작 (최대 width개 동시)
+    - 빈 결과가 나오면 다음 부분집합을 바로 시작
+    - 앞선 부분집합이 모두 빈 결과로 끝난 상태에서 결과가 있는 가장 앞의 부분집합을 채택
+      (순차 재시도와 같은 결과, 최악의 경우 지연은 크롤링 여러 번이 아니라 한 번 + hedge_delay 수준)
+    - 채택 후 나머지 검색은 취소 (cancel 이벤트, 시작 전 작업은 future.cancel)
+    - 결과가 없었던 검색어는 search_cache가 기억하므로 다시 검색해도 외부 요청 없이 바로 끝남
+    """
+
+    def __init__(
+        self,
+        collect,
+        max_workers: int = 8,
+        width: int = 3,
+        hedge_delay: float = 0.5,
+    ):
+        self.collect = collect
+        self.width = max(1, width)
+        self.hedge_delay = hedge_delay
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="search")
+
+    def search(self, subsets: list[list[str]]):
+        """
+        Returns:
+            tuple: (채택된 부분집합, 기사 목록), 모두 빈 결과면 (None, [])
+        """
+        cancel = threading.Event()
+        results = {}  # 부분집합 index -> 기사 목록 (실패는 [])
+        running = {}  # future -> index
+        next_index = 0
+        best = 0  # 아직 빈 결과로 끝나지 않은 가장 앞의 index
+        launched_at = 0.0  # 마지막 검색 시작 시각
+
+        try:
+            while True:
+                # 실행 중인 검색이 없거나 hedge_delay가 지났으면 다음 부분집합 시작
+                # (동시에 width개까지)
+                while (
+                    len(running) < self.width
+                    and next_index < len(subsets)
+                    and (
+                        not running
+                        or time.monotonic() - launched_at >= self.hedge_delay
+                    )
+                ):
+                    subset = subsets[next_index]
+                    log("search_planner.py", f"keyword_subset: {subset}")
+                    context = contextvars.copy_context()
+                    future = self.executor.submit(
+                        context.run, self.collect, subset, cancel=cancel
+                    )
+                    running[future] = next_index
+                    launched_at = time.monotonic()
+                    next_index += 1
+
+                while best in results and not results[best]:
+                    best += 1
+                if best >= len(subsets):
+                    return None, []
+                if best in results:
+                    return subsets[best], results[best]
+
+                timeout = None
+                if len(running) < self.width and next_index < len(subsets):
+                    timeout = max(
+                        0.0, launched_at + self.hedge_delay - time.monotonic()
+                    )
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    results[index] = self._result(subsets[index], future)
+        finally:
+            # 채택된 결과가 나오면 남은 검색은 결과를 기다리지 않고 취소
+            cancel.set()
+            for future in running:
+                future.cancel()
+            if running:
+                search_plan_queries.inc(len(running), result="cancelled")
+
+    def _result(self, subset, future):
+        try:
+            articles = future.result()
+        except Exception as e:
+            search_plan_queries.inc(result="error")
+            log("search_planner.py", f"검색 실패 {subset}: {e}")
+            return []
+        if articles:
+            search_plan_queries.inc(result="found")
+        else:
+            search_plan_queries.inc(result="empty")
+        return articles
+
+
+search_planner = SearchPlanner(
+    collect_data,
+    max_workers=int(os.getenv("SEARCH_MAX_WORKERS", "8")),
+    width=int(os.getenv("SEARCH_PARALLEL", "3")),
+    hedge_delay=float(os.getenv("SEARCH_HEDGE_DELAY", "0.5")),
+)
@@ -0,0 +1,81 @@
+import os
+import re
+
+# 이보다 짧은 조각(공백 제외 글자 수)은 다음 조각과 합치고, 문단 끝에 남으면 앞 문장에 붙이거나 버림
+MIN_SENTENCE_LENGTH = int(os.getenv("SENTENCE_MIN_LENGTH", "12"))
+
+# 문장 끝 후보: 종결 부호(+닫는 따옴표/괄호) 뒤에 공백이나 문단 끝이 오는 위치
+_BOUNDARY = re.compile(r"[.?!…]+[\"'”’)\]」』]*(?=\s|$)")
+# 마침표로 끝나도 문장 끝이 아닌 토큰 (U.S., No., Dr. 등)
+_ABBREVIATION = re.compile(
+    r"(?:\b(?:[A-Za-z]\.)+|\b(?:Mr|Mrs|Ms|Dr|Prof|No|Vol|vs|etc|Inc|Co|Corp|Ltd|Jr|Sr|St)\.)$"
+)
+# 인용문 뒤에 이어지는 조사 ("..." 라고 말했다)는 같은 문장
+_QUOTE_CONTINUATION = re.compile(r"\s+(?:라?고|라며|라면서|며|면서|라는|는)(?=\s|$)")
+_PARAGRAPH = re.compile(r"[^\n]+")
+
+
+def split_sentences(text: str, min_length: int = MIN_SENTENCE_LENGTH):
+    """
+    기사 본문을 문장 단위로 나눕니다.
+
+    - 줄바꿈은 항상 문단 경계, 문단 안에서는 종결 부호 뒤 공백을 문장 경계로 사용
+      (7.5%, 3.1절 같은 숫자와 U.S. 같은 약어에서는 나누지 않음)
+    - min_length보다 짧은 조각은 이어지는 조각과 합치고,
+      문단 끝에 짧게 남은 조각은 앞 문장에 붙이거나 (앞 문장이 없으면) 버림
+    - 남는 문장이 하나도 없으면 본문 전체를 한 문장으로 사용
+
+    Returns:
+        list[tuple[str, int, int]]: (문장, 시작 offset, 끝 offset), text[start:end] == 문장
+    """
+    sentences = []
+    for paragraph in _PARAGRAPH.finditer(text):
+        spans = _split_paragraph(text, paragraph.start(), paragraph.end())
+        sentences.extend(_merge_short(text, spans, min_length))
+    if not sentences and text.strip():
+        sentences = [_strip(text, 0, len(text))]
+    return [(text[start:end], start, end) for start, end in sentences]
+
+
+def _split_paragraph(text, start, end):
+    spans = []
+    for match in _BOUNDARY.finditer(text, start, end):
+        if match.group().startswith(".") and _ABBREVIATION.search(
+            text, start, match.start() + 1
+        ):
+            continue
+        if match.group()[-1] in "\"'”’」』" and _QUOTE_CONTINUATION.match(
+            text, match.end(), end
+        ):
+            continue
+        spans.append(_strip(text, start, match.end()))
+        start = match.end()
+    spans.append(_strip(text, start, end))
+    return [(s, e) for s, e in spans if s < e]
+
+
+def _merge_short(text, spans, min_length):
+    merged = []
+    pending = None  # 아직 min_length에 못 미친 (start, end)
+    for start, end in spans:
+        pending = (pending[0], end) if pending else (start, end)
+        if _length(text, *pending) >= min_length:
+            merged.append(pending)
+            pending = None
+    if pending:
+        if merged:
+            merged[-1] = (merged[-1][0], pending[1])
+        # 문단 전체가 짧으면 (기자명, 사진 설명 등) 버림
+    return merged
+
+
+def _strip(text, start, end):
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _length(text, start, end):
+    return sum(not ch.isspace() for ch in text[start:end])
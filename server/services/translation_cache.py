@@ -0,0 +1,208 @@
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from tools.metrics import log
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    translated TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS translations_created_at ON translations (created_at);
+"""
+
+
+class TranslationCache:
+    """
+    (원문, 대상 언어) → 번역문 캐시
+
+    - 메모리 LRU(max_memory_items) + SQLite 영구 저장(max_disk_items)
+    - ttl초가 지난 번역은 사용하지 않음
+    - 같은 원문을 동시에 번역 요청하면 한 번만 API를 호출 (in-flight coalescing)
+    """
+
+    def __init__(
+        self,
+        db_path: str | None,
+        ttl: float = 7 * 24 * 3600,
+        max_memory_items: int = 50000,
+        max_disk_items: int = 500000,
+    ):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()  # key -> (translated, created_at)
+        self.inflight = {}  # key -> Future
+        self._local = threading.local()
+        self._writes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.bytes_saved = 0
+
+        if db_path:
+            with self._connect() as conn:
+                conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        # fork된 워커는 부모 프로세스의 연결을 쓰지 않고 새로 연결
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def key(text: str, target_language: str, fmt: str) -> str:
+        data = f"{target_language}\x00{fmt}\x00{text}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def translate(self, texts: list[str], target_language, fmt, translate_fn):
+        """
+        캐시에 없는 문장만 translate_fn(texts)으로 번역합니다.
+        다른 요청이 이미 번역 중인 문장은 그 결과를 기다립니다.
+
+        Returns:
+            list[str | None]: texts와 같은 순서의 번역 결과 (실패 시 None)
+        """
+        keys = [self.key(text, target_language, fmt) for text in texts]
+        results = self._get_many(keys)
+
+        owned = {}  # 이번 호출이 번역할 key -> text
+        waiting = {}  # 다른 요청의 결과를 기다릴 key -> Future
+        with self.lock:
+            for key, text, result in zip(keys, texts, results):
+                if result is not None:
+                    self.hits += 1
+                    self.bytes_saved += len(text.encode("utf-8"))
+                elif key in owned or key in waiting:
+                    continue
+                elif key in self.inflight:
+                    waiting[key] = self.inflight[key]
+                    self.coalesced += 1
+                    self.bytes_saved += len(text.encode("utf-8"))
+                else:
+                    self.inflight[key] = Future()
+                    owned[key] = text
+                    self.misses += 1
+
+        translated = {}
+        if owned:
+            try:
+                outputs = translate_fn(list(owned.values()))
+                translated = dict(zip(owned.keys(), outputs))
+                self._put_many({k: v for k, v in translated.items() if v is not None})
+            except Exception as e:
+                log("translation_cache.py", "번역 실패:", e)
+            finally:
+                # 기다리는 요청이 멈추지 않도록 항상 결과를 전달
+                with self.lock:
+                    for key in owned:
+                        self.inflight.pop(key).set_result(translated.get(key))
+
+        for key, future in waiting.items():
+            translated[key] = future.result()
+
+        return [
+            result if result is not None else translated.get(key)
+            for key, result in zip(keys, results)
+        ]
+
+    def stats(self) -> dict:
+        with self.lock:
+            requests = self.hits + self.misses + self.coalesced
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_rate": (
+                    (self.hits + self.coalesced) / requests if requests else 0.0
+                ),
+                "bytes_saved": self.bytes_saved,
+                "memory_items": len(self.memory),
+            }
+
+    def _get_many(self, keys):
+        now = time.time()
+        results = {}
+        missing = []
+        with self.lock:
+            for key in keys:
+                entry = self.memory.get(key)
+                if entry is not None and now - entry[1] < self.ttl:
+                    self.memory.move_to_end(key)
+                    results[key] = entry[0]
+                else:
+                    missing.append(key)
+
+        if missing and self.db_path:
+            rows = []
+            for start in range(0, len(missing), 500):
+                chunk = missing[start : start + 500]
+                rows.extend(
+                    self._connect()
+                    .execute(
+                        f"""
+                        SELECT key, translated, created_at FROM translations
+                        WHERE key IN ({",".join("?" * len(chunk))}) AND created_at > ?
+                        """,
+                        [*chunk, now - self.ttl],
+                    )
+                    .fetchall()
+                )
+            with self.lock:
+                for key, translated, created_at in rows:
+                    results[key] = translated
+                    self._remember(key, translated, created_at)
+
+        return [results.get(key) for key in keys]
+
+    def _put_many(self, items: dict):
+        if not items:
+            return
+        now = time.time()
+        with self.lock:
+            for key, translated in items.items():
+                self._remember(key, translated, now)
+        if not self.db_path:
+            return
+
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translated, created_at) VALUES (?, ?, ?)",
+                [(key, translated, now) for key, translated in items.items()],
+            )
+            self._writes += len(items)
+            # 가끔씩만 만료/초과분 정리
+            if self._writes >= 1000:
+                self._writes = 0
+                conn.execute(
+                    "DELETE FROM translations WHERE created_at <= ?", (now - self.ttl,)
+                )
+                conn.execute(
+                    """
+                    DELETE FROM translations WHERE key IN (
+                        SELECT key FROM translations ORDER BY created_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_disk_items,),
+                )
+
+    def _remember(self, key, translated, created_at):
+        self.memory[key] = (translated, created_at)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_items:
+            self.memory.popitem(last=False)
@@ -0,0 +1,223 @@
+import os
+import re
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+
+from tools.metrics import metrics
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    key TEXT PRIMARY KEY,
+    verdict TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verdicts_expires_at ON verdicts (expires_at);
+"""
+
+verdict_cache_lookups = metrics.counter(
+    "verdict_cache_lookups_total",
+    "Final verdict cache lookups (hit, miss, bypass)",
+    ["result"],
+)
+
+# 단어 끝에서 떼어 내는 조사 (긴 것부터 검사)
+JOSA = sorted(
+    [
+        "은", "는", "이", "가", "을", "를", "의", "에", "에서", "에게", "께서",
+        "로", "으로", "와", "과", "도", "만", "까지", "부터", "처럼", "보다",
+        "이라고", "라고", "이라는", "라는", "한테", "랑", "이랑", "하고",
+    ],
+    key=len,
+    reverse=True,
+)  # fmt: skip
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_claim(text: str) -> str:
+    """
+    거의 같은 주장이 같은 키가 되도록 정규화합니다.
+    유니코드(NFKC)/소문자, 문장 부호 제거, 공백 정리, 단어 끝 조사 제거
+    (조사를 떼고 남는 부분이 두 글자 이상일 때만, 예: 백종원은 → 백종원, 국가 → 국가)
+    """
+    text = _PUNCTUATION.sub(" ", unicodedata.normalize("NFKC", text).lower())
+    return " ".join(_strip_josa(word) for word in text.split())
+
+
+def _strip_josa(word):
+    for josa in JOSA:
+        if word.endswith(josa) and len(word) - len(josa) >= 2:
+            return word[: -len(josa)]
+    return word
+
+
+class VerdictCache:
+    """
+    (정규화된 주장, 키워드) → 최종 판정(fact_result, related_articles) 캐시
+
+    - 메모리 LRU(max_memory_items) + SQLite 영구 저장(max_disk_items, 워커끼리 공유)
+    - 근거 기사를 찾은 판정은 ttl초, 찾지 못한 판정(fact_result -1)은 empty_ttl초 동안 사용
+    """
+
+    def __init__(
+        self,
+        db_path: str | None,
+        ttl: float = 6 * 3600,
+        empty_ttl: float = 600.0,
+        max_memory_items: int = 10000,
+        max_disk_items: int = 200000,
+    ):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.empty_ttl = empty_ttl
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()  # key -> (verdict, expires_at)
+        self._local = threading.local()
+        self._writes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        if db_path and ttl > 0:
+            with self._connect() as conn:
+                conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        # fork된 워커는 부모 프로세스의 연결을 쓰지 않고 새로 연결
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def key(claim: str, keywords: list[str]) -> str:
+        keywords = sorted({normalize_claim(keyword) for keyword in keywords})
+        data = "\x00".join([normalize_claim(claim), *keywords]).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, claim: str, keywords: list[str], bypass: bool = False):
+        """
+        Returns:
+            dict | None: 저장된 판정 {"fact_result", "related_articles"}, 없거나 bypass면 None
+        """
+        if self.ttl <= 0:
+            return None
+        if bypass:
+            verdict_cache_lookups.inc(result="bypass")
+            return None
+        key = self.key(claim, keywords)
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None and entry[1] > now:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                verdict_cache_lookups.inc(result="hit")
+                return entry[0]
+
+        row = None
+        if self.db_path:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT verdict, expires_at FROM verdicts WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                )
+                .fetchone()
+            )
+        with self.lock:
+            if row is None:
+                self.misses += 1
+                verdict_cache_lookups.inc(result="miss")
+                return None
+            verdict = json.loads(row[0])
+            self._remember(key, verdict, row[1])
+            self.hits += 1
+        verdict_cache_lookups.inc(result="hit")
+        return verdict
+
+    def contains(self, claim: str, keywords: list[str]) -> bool:
+        # 저장된 판정이 있는지만 확인 (적중률 통계에 넣지 않음)
+        if self.ttl <= 0:
+            return False
+        key = self.key(claim, keywords)
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None and entry[1] > now:
+                return True
+        if not self.db_path:
+            return False
+        row = (
+            self._connect()
+            .execute(
+                "SELECT 1 FROM verdicts WHERE key = ? AND expires_at > ?", (key, now)
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def put(self, claim: str, keywords: list[str], verdict: dict):
+        if self.ttl <= 0:
+            return
+        key = self.key(claim, keywords)
+        ttl = self.ttl if verdict["fact_result"] != -1 else self.empty_ttl
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        with self.lock:
+            self._remember(key, verdict, expires_at)
+        if not self.db_path:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, verdict, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(verdict, ensure_ascii=False), expires_at),
+            )
+            self._writes += 1
+            # 가끔씩만 만료/초과분 정리
+            if self._writes >= 100:
+                self._writes = 0
+                conn.execute(
+                    "DELETE FROM verdicts WHERE expires_at <= ?", (time.time(),)
+                )
+                conn.execute(
+                    """
+                    DELETE FROM verdicts WHERE key IN (
+                        SELECT key FROM verdicts ORDER BY expires_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_disk_items,),
+                )
+
+    def hit_rate(self) -> float:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_items": len(self.memory),
+            }
+
+    def _remember(self, key, verdict, expires_at):
+        self.memory[key] = (verdict, expires_at)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_items:
+            self.memory.popitem(last=False)
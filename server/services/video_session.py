@@ -0,0 +1,350 @@
+import os
+import time
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from services.claim_dedup import CLAIM_DEDUP_THRESHOLD, cluster_claims, normalize_rows
+from tools.metrics import metrics
+
+video_session_lookups = metrics.counter(
+    "video_session_lookups_total",
+    "Per-video session reuse (kind: summary, summary_embedding, claims, articles)",
+    ["kind", "result"],
+)
+video_session_evictions = metrics.counter(
+    "video_session_evictions_total",
+    "Video sessions or article sets evicted (reason: expired, memory, sessions)",
+    ["reason"],
+)
+
+
+def video_key(video_id: str | None, video_ctx: dict | None = None) -> str | None:
+    """
+    세션 키: 영상 id가 있으면 그대로, 없으면 제목/설명/태그 해시. 둘 다 없으면 None
+    """
+    if video_id:
+        return f"id:{video_id}"
+    video_ctx = video_ctx or {}
+    parts = [
+        video_ctx.get("title", ""),
+        video_ctx.get("description", ""),
+        *(video_ctx.get("hashtags") or []),
+    ]
+    if not any(parts):
+        return None
+    data = "\x00".join(parts).encode("utf-8")
+    return "ctx:" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def comment_hash(comment: str) -> str:
+    # 공백 차이는 같은 댓글로 취급
+    data = " ".join(comment.split()).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class VideoSession:
+    """
+    영상 하나에 대해 요청 사이에 재사용하는 결과
+
+    - summary / summary_embedding: Gemini 영상 요약문과 그 임베딩
+    - claims: 댓글 해시 → 추출된 주장 목록 (주장이 없는 댓글은 빈 목록)
+    - articles: 정렬된 키워드 → (실제 검색에 쓴 키워드, 수집된 기사)
+    - representatives: 분석 대상이 된 대표 주장 {"claim", "keyword"}과 정규화된 임베딩 행렬
+    - claims_seen: 분석 요청된 주장 수
+    - runs_saved: 같은 요청의 다른 주장과 묶여 생략된 분석 수
+    - matched: 이전 요청의 대표 주장에 묶인 주장 수
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.summary = ""
+        self.summary_embedding = None
+        self.claims = {}
+        self.articles = OrderedDict()
+        self.representatives = []
+        self.representative_embeddings = None
+        self.claims_seen = 0
+        self.runs_saved = 0
+        self.matched = 0
+        self.nbytes = 0
+        self.touched_at = time.time()
+
+
+class VideoSessionStore:
+    """
+    영상별 세션 저장소 (프로세스 메모리)
+
+    - 마지막 사용 후 ttl초가 지난 세션은 버림
+    - 세션 수가 max_sessions, 대략적인 메모리 사용량이 max_bytes를 넘으면
+      가장 오래 쓰지 않은 세션부터 버림 (세션 하나가 넘으면 그 세션의 오래된 기사부터)
+    - 세션의 대표 주장은 최근 max_representatives개까지만 유지
+    - 세션 객체는 저장소의 메서드로만 수정 (lock 안에서)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1800.0,
+        max_sessions: int = 500,
+        max_bytes: int = 256 << 20,
+        max_representatives: int = 1000,
+    ):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.max_representatives = max_representatives
+        self.lock = threading.Lock()
+        self.sessions = OrderedDict()  # key -> VideoSession
+        self.nbytes = 0
+
+    def get(self, key: str | None, create: bool = False) -> VideoSession | None:
+        if key is None or self.ttl <= 0:
+            return None
+        now = time.time()
+        with self.lock:
+            self._expire(now)
+            session = self.sessions.get(key)
+            if session is None and create:
+                session = self.sessions[key] = VideoSession(key)
+                self._evict(session)
+            if session is not None:
+                session.touched_at = now
+                self.sessions.move_to_end(key)
+            return session
+
+    def summary(self, session: VideoSession | None) -> str:
+        if session is None:
+            return ""
+        video_session_lookups.inc(
+            kind="summary", result="hit" if session.summary else "miss"
+        )
+        return session.summary
+
+    def set_summary(self, session: VideoSession, summary: str):
+        with self.lock:
+            if summary and summary != session.summary:
+                freed = _str_bytes(session.summary)
+                if session.summary_embedding is not None:
+                    freed += session.summary_embedding.nbytes
+                self._resize(session, _str_bytes(summary) - freed)
+                session.summary = summary
+                session.summary_embedding = None
+
+    def summary_embedding(self, session: VideoSession, summary: str):
+        # 요약문이 바뀌었으면 None
+        with self.lock:
+            embedding = (
+                session.summary_embedding if summary == session.summary else None
+            )
+        video_session_lookups.inc(
+            kind="summary_embedding", result="hit" if embedding is not None else "miss"
+        )
+        return embedding
+
+    def set_summary_embedding(self, session: VideoSession, summary: str, embedding):
+        with self.lock:
+            if summary == session.summary and session.summary_embedding is None:
+                session.summary_embedding = embedding
+                self._resize(session, embedding.nbytes)
+
+    def claims(self, session: VideoSession, hashes: list[str]) -> dict:
+        """
+        Returns:
+            dict: 이미 추출한 댓글 해시 → 주장 목록
+        """
+        with self.lock:
+            found = {h: session.claims[h] for h in hashes if h in session.claims}
+        video_session_lookups.inc(len(found), kind="claims", result="hit")
+        video_session_lookups.inc(
+            len(hashes) - len(found), kind="claims", result="miss"
+        )
+        return found
+
+    def put_claims(self, session: VideoSession, claims: dict):
+        with self.lock:
+            for h, items in claims.items():
+                if h not in session.claims:
+                    self._resize(session, len(h) + _json_bytes(items))
+                session.claims[h] = items
+            self._evict(session)
+
+    def articles(self, session: VideoSession | None, keywords: list[str]):
+        """
+        Returns:
+            tuple[list[str], list] | None: (검색에 쓴 키워드, 기사 목록), 없으면 None
+        """
+        if session is None:
+            return None
+        with self.lock:
+            found = session.articles.get(tuple(keywords))
+            if found is not None:
+                session.articles.move_to_end(tuple(keywords))
+        video_session_lookups.inc(
+            kind="articles", result="hit" if found is not None else "miss"
+        )
+        return found
+
+    def put_articles(self, session: VideoSession, keywords, keywords_used, articles):
+        key = tuple(keywords)
+        with self.lock:
+            if key in session.articles:
+                return
+            session.articles[key] = (keywords_used, articles)
+            self._resize(session, sum(_article_bytes(article) for article in articles))
+            self._evict(session)
+
+    def group_claims(
+        self,
+        session: VideoSession | None,
+        items: list[dict],
+        embeddings,
+        threshold: float = CLAIM_DEDUP_THRESHOLD,
+    ) -> list[dict]:
+        """
+        주장들을 세션의 대표 주장, 그리고 서로와 비교해 묶습니다.
+        새로 대표가 된 주장은 세션에 추가합니다. (세션이 없으면 items 안에서만 묶음)
+
+        Args:
+            items (list[dict]): {"claim", "keyword"} 목록
+            embeddings (np.ndarray): items의 주장 임베딩
+
+        Returns:
+            list[dict]: items와 같은 순서의 대표 주장 {"claim", "keyword"}
+        """
+        if session is None:
+            labels = cluster_claims(embeddings, threshold)
+            return [items[label] for label in labels]
+        with self.lock:
+            labels = cluster_claims(
+                embeddings, threshold, session.representative_embeddings
+            )
+            offset = len(session.representatives)
+            new = sorted({int(label) - offset for label in labels if label >= offset})
+            # 새 대표의 번호(offset + items 위치)를 세션 목록에 추가되는 순서로 바꿈
+            rank = {offset + position: offset + i for i, position in enumerate(new)}
+            labels = [rank.get(int(label), int(label)) for label in labels]
+            if new:
+                session.representatives.extend(
+                    {"claim": items[i]["claim"], "keyword": items[i]["keyword"]}
+                    for i in new
+                )
+                added = normalize_rows(embeddings[new])
+                session.representative_embeddings = (
+                    added
+                    if session.representative_embeddings is None
+                    else np.vstack([session.representative_embeddings, added])
+                )
+                self._resize(
+                    session,
+                    added.nbytes + sum(_json_bytes(items[i]) for i in new),
+                )
+            matched = sum(1 for label in labels if label < offset)
+            session.claims_seen += len(items)
+            # 이번 요청 안에서 새 대표에 묶인 주장만 생략된 분석으로 셈
+            # (이전 요청의 대표에 묶인 주장은 판정 캐시나 진행 중인 분석으로 응답)
+            session.runs_saved += len(items) - matched - len(new)
+            session.matched += matched
+            representatives = [session.representatives[label] for label in labels]
+            self._trim_representatives(session)
+            self._evict(session)
+        return representatives
+
+    def dedup_stats(self, session: VideoSession | None) -> dict | None:
+        if session is None:
+            return None
+        with self.lock:
+            return {
+                "claims": session.claims_seen,
+                "runs_saved": session.runs_saved,
+                "matched": session.matched,
+                "representatives": len(session.representatives),
+            }
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "sessions": len(self.sessions),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _trim_representatives(self, session):
+        # 오래된 대표 주장부터 버림 (임베딩 행렬도 최근 행만 남김)
+        drop = len(session.representatives) - self.max_representatives
+        if drop <= 0:
+            return
+        dropped = session.representatives[:drop]
+        freed = session.representative_embeddings[:drop].nbytes
+        freed += sum(_json_bytes(item) for item in dropped)
+        session.representatives = session.representatives[drop:]
+        session.representative_embeddings = session.representative_embeddings[
+            drop:
+        ].copy()
+        self._resize(session, -freed)
+
+    def _resize(self, session, delta):
+        session.nbytes += delta
+        if session.key in self.sessions:
+            self.nbytes += delta
+
+    def _expire(self, now):
+        while self.sessions:
+            key, session = next(iter(self.sessions.items()))
+            if now - session.touched_at <= self.ttl:
+                break
+            self._drop(key, "expired")
+
+    def _evict(self, current):
+        # 오래 쓰지 않은 다른 세션부터 버림
+        while len(self.sessions) > self.max_sessions or self.nbytes > self.max_bytes:
+            key = next((key for key in self.sessions if key != current.key), None)
+            if key is None:
+                break
+            self._drop(key, "sessions" if self.nbytes <= self.max_bytes else "memory")
+        # 그래도 넘으면 현재 세션의 오래된 기사부터 버림
+        while self.nbytes > self.max_bytes and current.articles:
+            _, (_, articles) = current.articles.popitem(last=False)
+            self._resize(current, -sum(_article_bytes(article) for article in articles))
+            video_session_evictions.inc(reason="memory")
+
+    def _drop(self, key, reason):
+        session = self.sessions.pop(key)
+        self.nbytes -= session.nbytes
+        video_session_evictions.inc(reason=reason)
+
+
+# 영상별 세션 (gunicorn 워커마다 따로 유지)
+video_sessions = VideoSessionStore(
+    ttl=float(os.getenv("VIDEO_SESSION_TTL", "1800")),
+    max_sessions=int(os.getenv("VIDEO_SESSION_MAX", "500")),
+    max_bytes=int(os.getenv("VIDEO_SESSION_MAX_MB", "256")) << 20,
+    max_representatives=int(os.getenv("VIDEO_SESSION_MAX_REPRESENTATIVES", "1000")),
+)
+metrics.gauge("video_sessions", "Video sessions in memory").set_function(
+    lambda: video_sessions.stats()["sessions"]
+)
+metrics.gauge(
+    "video_session_bytes", "Approximate memory held by video sessions"
+).set_function(lambda: video_sessions.stats()["bytes"])
+
+
+def _str_bytes(text):
+    return len(text.encode()) if text else 0
+
+
+def _json_bytes(value):
+    return len(json.dumps(value, ensure_ascii=False).encode())
+
+
+def _article_bytes(article):
+    # [제목, 링크, 문장 목록, 임베딩 행렬, offset 목록]
+    size = _str_bytes(article[0]) + _str_bytes(article[1])
+    size += sum(_str_bytes(sentence) for sentence in article[2])
+    if article[3] is not None:
+        size += article[3].nbytes
+    if len(article) > 4 and article[4]:
+        size += 16 * len(article[4])
+    return size
@@ -0,0 +1,108 @@
+import os
+import atexit
+import threading
+from collections import OrderedDict
+
+from tools.metrics import log, metrics
+
+cache_writes = metrics.counter(
+    "cache_write_behind_total",
+    "Write-behind cache writes (written, unchanged, coalesced, dropped, failed)",
+    ["name", "result"],
+)
+cache_write_pending = metrics.gauge(
+    "cache_write_behind_pending", "Pending write-behind cache writes", ["name"]
+)
+
+
+class WriteBehindWriter:
+    """
+    단일 백그라운드 스레드가 대기열의 쓰기 작업을 순서대로 처리
+
+    - 같은 key의 쓰기가 대기 중이면 최신 값으로 합침 (coalescing)
+    - 대기열이 max_pending개로 가득 차면 새 key는 버림 (요청을 막지 않음)
+    - write(key, value)는 실제로 기록했으면 True, 바뀐 내용이 없어 건너뛰었으면 False 반환
+    - 종료 시(atexit) 대기 중인 작업을 모두 기록
+    """
+
+    def __init__(self, name: str, write, max_pending: int = 1000):
+        self.name = name
+        self.write = write
+        self.max_pending = max_pending
+        self.condition = threading.Condition()
+        self.pending = OrderedDict()  # key -> value
+        self.thread = None
+        self.pid = None
+        self.busy = False
+        self.closing = False
+        atexit.register(self.close)
+
+    def submit(self, key, value) -> bool:
+        with self.condition:
+            self._ensure_thread()
+            if key in self.pending:
+                self.pending[key] = value
+                cache_writes.inc(name=self.name, result="coalesced")
+                return True
+            if len(self.pending) >= self.max_pending or self.closing:
+                cache_writes.inc(name=self.name, result="dropped")
+                return False
+            self.pending[key] = value
+            cache_write_pending.set(len(self.pending), name=self.name)
+            self.condition.notify()
+            return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        대기 중인 작업이 모두 기록될 때까지 기다립니다.
+        """
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: not self.pending and not self.busy, timeout
+            )
+
+    def close(self, timeout: float = 30.0):
+        """
+        대기 중인 작업을 모두 기록하고 쓰기 스레드를 종료합니다.
+        """
+        if self.pid != os.getpid() or self.thread is None:
+            return
+        with self.condition:
+            self.closing = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+        self.pid = None
+
+    def _ensure_thread(self):
+        # fork된 워커에는 부모의 스레드가 없으므로 프로세스마다 새로 시작
+        if self.pid != os.getpid():
+            self.pending.clear()
+            self.busy = False
+            self.closing = False
+            self.thread = threading.Thread(
+                target=self._run, name=f"write-behind-{self.name}", daemon=True
+            )
+            self.thread.start()
+            self.pid = os.getpid()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending or self.closing)
+                if not self.pending:
+                    return
+                key, value = self.pending.popitem(last=False)
+                cache_write_pending.set(len(self.pending), name=self.name)
+                self.busy = True
+
+            try:
+                written = self.write(key, value)
+                result = "written" if written else "unchanged"
+            except Exception as e:
+                log("write_behind.py", f"{self.name} 쓰기 실패 {key}: {e}")
+                result = "failed"
+            cache_writes.inc(name=self.name, result=result)
+
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
@@ -0,0 +1,74 @@
+"""
+테스트 공통 설정
+
+- 캐시 DB / 디렉터리는 테스트 세션의 임시 디렉터리로 (서비스 모듈 import 전에 설정)
+- 모델은 benchmarks.fixture_server의 대역으로 대체 (모델 다운로드 없이 실행)
+"""
+
+import os
+import tempfile
+
+import pytest
+
+_tmp = tempfile.mkdtemp(prefix="factcheck_tests_")
+os.environ.update(
+    {
+        "TRANSLATION_CACHE_DB": os.path.join(_tmp, "translations.sqlite3"),
+        "ARTICLE_CACHE_DB": os.path.join(_tmp, "articles.sqlite3"),
+        "SEARCH_CACHE_DB": os.path.join(_tmp, "search.sqlite3"),
+        "VERDICT_CACHE_DB": os.path.join(_tmp, "verdicts.sqlite3"),
+        "EMBEDDING_CACHE_DIR": os.path.join(_tmp, "embeddings"),
+        "EMBEDDING_CACHE_DISK": "0",
+        "MODEL_WARMUP": "0",
+    }
+)
+
+from benchmarks.fixture_server import (  # noqa: E402
+    FixtureEncoder,
+    FixtureNLI,
+    FixtureServer,
+    load_corpus,
+)
+from services.embedding_cache import EmbeddingCache  # noqa: E402
+from services.models import registry  # noqa: E402
+
+
+@pytest.fixture
+def encoder():
+    """
+    registry의 embedding 모델을 FixtureEncoder로, 임베딩 캐시를 빈 메모리 캐시로 바꿉니다.
+    """
+    saved = dict(registry.models)
+    fake = FixtureEncoder()
+    registry.models["embedding"] = fake
+    registry.models["embedding_cache"] = EmbeddingCache("fixture-encoder")
+    yield fake
+    registry.models.clear()
+    registry.models.update(saved)
+
+
+@pytest.fixture
+def nli():
+    """
+    registry의 NLI 모델을 FixtureNLI로 바꿉니다.
+    """
+    saved = registry.models.get("nli")
+    fake = registry.models["nli"] = FixtureNLI()
+    yield fake
+    if saved is None:
+        registry.models.pop("nli", None)
+    else:
+        registry.models["nli"] = saved
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    return load_corpus()
+
+
+@pytest.fixture(scope="session")
+def fixture_server(corpus):
+    # 기록된 검색 / 기사 / 번역 응답을 돌려주는 로컬 서버
+    server = FixtureServer(corpus).start()
+    yield server
+    server.stop()
@@ -0,0 +1,53 @@
+import sys
+import types
+
+import pytest
+
+from benchmarks.fixture_server import FixtureNLI
+from services import backends
+from services.backends import predict_nli_pairs
+
+
+def test_predict_nli_pairs_keeps_input_order():
+    # 길이가 제각각인 쌍을 길이순으로 배치해도 결과는 입력 순서대로
+    pairs = [(f"주장 {'가' * n}", "근거") for n in (9, 1, 5, 0, 7)]
+    model = FixtureNLI()
+    results = predict_nli_pairs(model, pairs, batch_size=2)
+    assert model.batches == [2, 2, 1]
+
+    for pair, result in zip(pairs, results):
+        [expected] = predict_nli_pairs(FixtureNLI(), [pair])
+        assert result == expected
+        assert set(result["probs"]) == set(model.labels)
+        assert sum(result["probs"].values()) == pytest.approx(1, abs=1e-3)
+        assert result["label"] == max(result["probs"], key=result["probs"].get)
+        assert result["confidence"] == result["probs"][result["label"]]
+
+
+def test_predict_nli_pairs_without_pairs():
+    model = FixtureNLI()
+    assert predict_nli_pairs(model, []) == []
+    assert model.batches == []
+
+
+@pytest.fixture
+def no_onnxruntime(monkeypatch):
+    # onnxruntime이 설치되지 않은 환경처럼 import가 실패하도록
+    monkeypatch.setitem(sys.modules, "onnxruntime", None)
+
+
+def test_onnx_nli_falls_back_to_torch(no_onnxruntime, monkeypatch, tmp_path):
+    loaded = []
+    monkeypatch.setattr(backends, "TorchNliModel", lambda name: loaded.append(name))
+    backends.load_nli_model("nli-model", "onnx", str(tmp_path))
+    assert loaded == ["nli-model"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_onnx_embedding_falls_back_to_torch(no_onnxruntime, monkeypatch, tmp_path):
+    fake = types.ModuleType("sentence_transformers")
+    fake.SentenceTransformer = lambda name, device: (name, device)
+    monkeypatch.setitem(sys.modules, "sentence_transformers", fake)
+    model = backends.load_embedding_model("embedding-model", "onnx", str(tmp_path))
+    assert model == ("embedding-model", "cpu")
+    assert list(tmp_path.iterdir()) == []
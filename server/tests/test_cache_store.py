@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+
+from services.cache_store import ArticleCacheStore, canonical_url
+
+
+def _article(url, sentences=("문장 하나.", "문장 둘."), embedding=True):
+    matrix = np.ones((len(sentences), 4), dtype=np.float32) if embedding else None
+    return ["제목", url, list(sentences), matrix, [[0, 5], [6, 10]]]
+
+
+def test_find_best_by_keyword_overlap(tmp_path):
+    store = ArticleCacheStore(str(tmp_path / "a.sqlite3"))
+    store.put(["백종원", "구속"], [_article("https://a.example/1")])
+    store.put(["더본코리아", "상장"], [_article("https://a.example/2")])
+
+    best = store.find_best(["백종원", "구속", "수사"])
+    assert best["keywords"] == ["백종원", "구속"]
+    assert best["similarity"] == 1.0
+    (article,) = best["articles"]
+    assert article[1] == "https://a.example/1"
+    assert article[3].shape == (2, 4)
+    assert article[4] == [[0, 5], [6, 10]]
+    assert store.find_best(["빽다방"]) is None
+    assert store.find_best([]) is None
+
+
+def test_entries_since_and_unchanged_put(tmp_path):
+    store = ArticleCacheStore(str(tmp_path / "a.sqlite3"))
+    assert store.put(["a"], [_article("https://a.example/1")])
+    assert store.put(["b"], [_article("https://a.example/2")])
+    assert not store.put(["a"], [_article("https://a.example/1")])
+    assert store.entries_since(0) == [(1, ["a"]), (2, ["b"])]
+    assert store.entries_since(1) == [(2, ["b"])]
+
+
+def test_migrate_json_dir_once(tmp_path):
+    json_dir = tmp_path / "cache"
+    json_dir.mkdir()
+    article = ["제목", "https://a.example/1", ["문장."], None]
+    (json_dir / "백종원_구속.json").write_text(json.dumps([article]), encoding="utf-8")
+    store = ArticleCacheStore(str(tmp_path / "a.sqlite3"))
+    assert store.migrate_json_dir(str(json_dir)) == 1
+    assert store.migrate_json_dir(str(json_dir)) == 0
+    assert store.find_best(["백종원", "구속"])["articles"][0][2] == ["문장."]
+
+
+def test_canonical_url():
+    assert (
+        canonical_url("HTTPS://News.Example/a/?utm_source=x&b=2&a=1&fbclid=z#top")
+        == "https://news.example/a?a=1&b=2"
+    )
+    assert canonical_url("https://news.example") == "https://news.example/"
+
+
+def test_same_article_is_stored_once(tmp_path):
+    store = ArticleCacheStore(str(tmp_path / "a.sqlite3"))
+    store.put(["a"], [_article("https://a.example/1?utm_source=x")])
+    store.put(["b"], [_article("https://a.example/1/", embedding=False)])
+
+    (count,) = store._connect().execute("SELECT COUNT(*) FROM documents").fetchone()
+    assert count == 1
+    # 임베딩 없이 다시 저장해도 문장이 같으면 기존 임베딩 유지
+    documents = store.get_documents(["https://a.example/1", "https://b.example/1"])
+    assert list(documents) == ["https://a.example/1"]
+    assert documents["https://a.example/1"][3].shape == (2, 4)
+
+
+def test_changed_sentences_drop_old_embedding(tmp_path):
+    store = ArticleCacheStore(str(tmp_path / "a.sqlite3"))
+    store.put(["a"], [_article("https://a.example/1")])
+    store.put(["a"], [_article("https://a.example/1", ("새 문장.",), embedding=False)])
+    article = store.get_documents(["https://a.example/1"])["https://a.example/1"]
+    assert article[2] == ["새 문장."]
+    assert article[3] is None
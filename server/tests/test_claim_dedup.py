@@ -0,0 +1,51 @@
+import numpy as np
+
+from services.claim_dedup import cluster_claims, normalize_rows
+
+
+def _vectors(*directions, dim=4):
+    # directions: 단위 벡터 축 번호 (같은 축 = 같은 주장)
+    vectors = np.zeros((len(directions), dim), dtype=np.float32)
+    for row, axis in zip(vectors, directions):
+        row[axis] = 1.0
+    return vectors
+
+
+def _cluster_loop(embeddings, threshold):
+    # 비교 기준: 앞선 대표와 하나씩 비교하는 leader clustering
+    x = normalize_rows(embeddings)
+    leaders, labels = [], []
+    for i, row in enumerate(x):
+        for j in leaders:
+            if float(np.dot(row, x[j])) >= threshold:
+                labels.append(j)
+                break
+        else:
+            leaders.append(i)
+            labels.append(i)
+    return np.array(labels)
+
+
+def test_labels_point_at_first_member_of_each_cluster():
+    labels = cluster_claims(_vectors(0, 1, 0, 2, 1), 0.9)
+    assert labels.tolist() == [0, 1, 0, 3, 1]
+
+
+def test_existing_representatives_match_before_new_clusters():
+    representatives = normalize_rows(_vectors(1, 2))
+    labels = cluster_claims(_vectors(0, 2, 0, 3), 0.9, representatives)
+    # 기존 대표(0, 1) 번호, 새 대표는 2 + items 위치
+    assert labels.tolist() == [2, 1, 2, 5]
+
+
+def test_empty_input():
+    assert cluster_claims(np.zeros((0, 4), dtype=np.float32), 0.9).tolist() == []
+
+
+def test_matches_pairwise_loop_on_random_embeddings():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((200, 16)).astype(np.float32)
+    for i in range(1, len(x)):
+        if rng.random() < 0.5:
+            x[i] = x[rng.integers(0, i)] + 0.05 * rng.standard_normal(16)
+    assert (cluster_claims(x, 0.9) == _cluster_loop(x, 0.9)).all()
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from services.inference import select_top_k_sentences
+
+
+def _vectors(*directions, dim=4):
+    vectors = np.zeros((len(directions), dim), dtype=np.float32)
+    for row, axis in zip(vectors, directions):
+        row[axis] = 1.0
+    return vectors
+
+
+def test_select_top_k_returns_sentence_index():
+    query = _vectors(0)[0]
+    sentences = [["a", "b", "c"], ["x", "a"]]
+    embeddings = [_vectors(1, 0, 2), _vectors(3, 0)]
+    top_k = select_top_k_sentences(query, sentences, embeddings, k=2)
+    assert [[(s, i) for s, _, i in row] for row in top_k] == [[("b", 1)], [("a", 1)]]
+
+
+def test_repeated_sentence_keeps_each_position():
+    # 같은 문장이 두 번 나오면 각 위치가 따로 선택되어야 함
+    query = _vectors(0)[0]
+    embeddings = [_vectors(1, 0, 2, 0)]
+    sentences = [["머리말", "반복 문장", "중간", "반복 문장"]]
+    (row,) = select_top_k_sentences(query, sentences, embeddings, k=3)
+    assert sorted(i for _, _, i in row) == [1, 3]
+
+
+def test_empty_articles():
+    query = _vectors(0)[0]
+    assert select_top_k_sentences(query, [[], []], [None, None]) == [[], []]
+
+
+def test_core_sentence_offsets_for_repeated_sentences(encoder):
+    pytest.importorskip("google.generativeai")
+    from factcheck_engine import CommentFactCheck
+
+    body = "백종원 대표가 구속되었다. 다른 이야기. 백종원 대표가 구속되었다."
+    sentences = [
+        "백종원 대표가 구속되었다.",
+        "다른 이야기.",
+        "백종원 대표가 구속되었다.",
+    ]
+    offsets = [[0, 14], [15, 22], [23, 37]]
+    factchecker = CommentFactCheck("백종원 대표가 구속되었다.", ["백종원"])
+    factchecker.articles = [["제목", "링크", sentences, None, offsets]]
+
+    CommentFactCheck._extract_core_sentences_batch([factchecker])
+
+    found = [(cs.sentence_index, cs.offset) for cs in factchecker.claim.core_sentences]
+    assert sorted(found) == [(0, [0, 14]), (2, [23, 37])]
+    for cs in factchecker.claim.core_sentences:
+        assert body[cs.offset[0] : cs.offset[1]] == cs.sentence
@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks.fixture_server import FixtureServer
+from services.downloader import ArticleDownloader
+
+
+def _links(server, corpus, n=3):
+    return [f"{server.url}/article/{a['id']}" for a in corpus["articles"][:n]]
+
+
+def test_parse_pool_is_created_lazily_per_process():
+    downloader = ArticleDownloader(parse_processes=False)
+    assert downloader._parse_executor is None
+    pool = downloader.parse_pool
+    assert isinstance(pool, ThreadPoolExecutor)
+    assert downloader.parse_pool is pool
+    # fork된 프로세스에서는 부모의 풀을 쓰지 않음
+    downloader._parse_pid = os.getpid() + 1
+    assert downloader.parse_pool is not pool
+
+
+def test_fetch_articles_with_thread_parse_pool(fixture_server, corpus):
+    downloader = ArticleDownloader(parse_processes=False, parse_workers=2)
+    links = _links(fixture_server, corpus)
+    bodies = downloader.fetch_articles(links + [f"{fixture_server.url}/article/-1"])
+    assert set(bodies) == set(links)
+    first = corpus["articles"][0]["body"].split(". ")[0]
+    assert first in bodies[links[0]]
+
+
+def test_fetch_articles_with_process_parse_pool(fixture_server, corpus):
+    downloader = ArticleDownloader(parse_processes=True, parse_workers=1)
+    links = _links(fixture_server, corpus, 2)
+    bodies = downloader.fetch_articles(links, deadline=60)
+    assert isinstance(downloader.parse_pool, ProcessPoolExecutor)
+    assert downloader.parse_pool._mp_context.get_start_method() != "fork"
+    assert set(bodies) == set(links)
+    downloader.parse_pool.shutdown()
+
+
+def test_parse_workers_do_not_import_main(tmp_path):
+    # python app.py처럼 실행해도 파싱 워커가 __main__을 다시 실행하지 않음
+    script = tmp_path / "main.py"
+    script.write_text(textwrap.dedent("""
+            print("main imported", flush=True)
+            from services.downloader import ArticleDownloader, parse_article
+
+            if __name__ == "__main__":
+                downloader = ArticleDownloader(parse_processes=True, parse_workers=2)
+                html = "<html><body><p>본문입니다.</p></body></html>"
+                futures = [
+                    downloader.parse_pool.submit(parse_article, "http://a/", html)
+                    for _ in range(4)
+                ]
+                print([future.result() is not None for future in futures])
+                downloader.parse_pool.shutdown()
+            """))
+    env = {**os.environ, "PYTHONPATH": os.getcwd()}
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=env,
+        cwd=tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.count("main imported") == 1
+    assert "[True, True, True, True]" in result.stdout
+
+
+def test_deadline_cancels_downloads_not_started(corpus):
+    server = FixtureServer(corpus, latency=0.3).start()
+    try:
+        downloader = ArticleDownloader(max_workers=1, parse_processes=False)
+        started = []
+        download = downloader._download
+        downloader._download = lambda link, headers: (
+            started.append(link) or download(link, headers)
+        )
+        start = time.monotonic()
+        assert downloader.fetch_articles(_links(server, corpus), deadline=0.1) == {}
+        assert time.monotonic() - start < 0.3
+        # 실행 중이던 다운로드가 끝난 뒤에도 대기하던 다운로드는 시작되지 않음
+        downloader.fetch_pool.shutdown(wait=True)
+        assert len(started) == 1
+    finally:
+        server.stop()
+
+
+def test_broken_process_pool_falls_back_to_threads(fixture_server, corpus):
+    downloader = ArticleDownloader(parse_processes=True, parse_workers=1)
+    downloader.parse_pool.shutdown()  # 이후 submit은 RuntimeError
+    links = _links(fixture_server, corpus, 1)
+    assert set(downloader.fetch_articles(links)) == set(links)
+    assert isinstance(downloader.parse_pool, ThreadPoolExecutor)
+
+
+def test_cancel_stops_waiting(fixture_server, corpus):
+    downloader = ArticleDownloader(parse_processes=False)
+    cancel = threading.Event()
+    cancel.set()
+    assert (
+        downloader.fetch_articles(_links(fixture_server, corpus), cancel=cancel) == {}
+    )
+
+
+def test_per_host_limit():
+    downloader = ArticleDownloader(per_host=1)
+    limit = downloader._host_limits["example.com"]
+    assert limit.acquire(blocking=False)
+    assert not limit.acquire(blocking=False)
+    limit.release()
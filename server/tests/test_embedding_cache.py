@@ -0,0 +1,125 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from services.embedding_cache import EmbeddingCache
+
+
+def _vectors(n, dim=8, seed=0):
+    return np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+
+
+def test_memory_lru(tmp_path):
+    cache = EmbeddingCache("m", max_memory_items=2)
+    keys = [cache.key(text) for text in ["a", "b", "c"]]
+    cache.put_many(keys, _vectors(3))
+    assert cache.get_many(keys)[0] is None
+    assert cache.stats()["memory_items"] == 2
+
+
+def test_key_normalizes_whitespace():
+    cache = EmbeddingCache("m")
+    assert cache.key("백종원  대표\n") == cache.key("백종원 대표")
+    assert cache.key("a") != EmbeddingCache("other").key("a")
+
+
+def test_disk_round_trip(tmp_path):
+    vectors = _vectors(5)
+    cache = EmbeddingCache("m", cache_dir=str(tmp_path))
+    keys = [cache.key(str(i)) for i in range(5)]
+    cache.put_many(keys[:3], vectors[:3])
+    cache.put_many(keys[2:], vectors[2:])
+
+    reopened = EmbeddingCache("m", cache_dir=str(tmp_path), max_memory_items=0)
+    assert reopened.stats()["disk_items"] == 5
+    for key, vector, found in zip(keys, vectors, reopened.get_many(keys)):
+        np.testing.assert_array_equal(found, vector)
+    assert reopened.stats()["disk_hits"] == 5
+
+
+def test_float16_disk_tier(tmp_path):
+    vectors = _vectors(2)
+    cache = EmbeddingCache("m", cache_dir=str(tmp_path), dtype="float16")
+    keys = [cache.key("a"), cache.key("b")]
+    cache.put_many(keys, vectors)
+    reopened = EmbeddingCache("m", cache_dir=str(tmp_path), dtype="float16")
+    np.testing.assert_allclose(
+        np.stack(reopened.get_many(keys)), vectors, rtol=1e-2, atol=1e-2
+    )
+
+
+def test_truncated_matrix_is_recovered(tmp_path):
+    cache = EmbeddingCache("m", cache_dir=str(tmp_path))
+    keys = [cache.key(str(i)) for i in range(3)]
+    cache.put_many(keys, _vectors(3))
+    # 마지막 행을 쓰다가 종료된 상황
+    with open(cache.matrix_path, "ab") as f:
+        f.truncate(os.path.getsize(cache.matrix_path) - 4)
+
+    reopened = EmbeddingCache("m", cache_dir=str(tmp_path))
+    assert reopened.stats()["disk_items"] == 2
+    assert reopened.get_many(keys)[2] is None
+
+
+def test_instances_sharing_files_do_not_reuse_rows(tmp_path):
+    # 같은 파일을 쓰는 두 워커: 각자 추가해도 행 번호가 겹치지 않고 서로의 행을 읽음
+    first = EmbeddingCache("m", cache_dir=str(tmp_path), max_memory_items=0)
+    second = EmbeddingCache("m", cache_dir=str(tmp_path), max_memory_items=0)
+    a, b = _vectors(2, seed=1), _vectors(2, seed=2)
+    first.put_many([first.key("a0"), first.key("a1")], a)
+    second.put_many([second.key("b0"), second.key("b1")], b)
+    first.put_many([first.key("b0")], b[:1])  # 이미 있는 키는 다시 쓰지 않음
+
+    for cache in (first, second):
+        found = cache.get_many([cache.key(k) for k in ["a0", "a1", "b0", "b1"]])
+        np.testing.assert_array_equal(np.stack(found), np.concatenate([a, b]))
+    reopened = EmbeddingCache("m", cache_dir=str(tmp_path))
+    assert reopened.stats()["disk_items"] == 4
+
+
+def _append_worker(cache_dir, worker, rounds):
+    cache = EmbeddingCache("m", cache_dir=cache_dir, max_memory_items=0)
+    for i in range(rounds):
+        text = f"{worker}-{i}"
+        cache.put_many([cache.key(text)], _vector_for(text)[None])
+
+
+def _vector_for(text):
+    seed = int.from_bytes(text.encode(), "little") % (2**32)
+    return np.random.default_rng(seed).standard_normal(8).astype(np.float32)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_concurrent_processes_append_consistently(tmp_path):
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_append_worker, args=(str(tmp_path), worker, 50))
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+        assert process.exitcode == 0
+
+    cache = EmbeddingCache("m", cache_dir=str(tmp_path), max_memory_items=0)
+    texts = [f"{worker}-{i}" for worker in range(4) for i in range(50)]
+    assert cache.stats()["disk_items"] == len(texts)
+    for text, found in zip(texts, cache.get_many([cache.key(t) for t in texts])):
+        np.testing.assert_array_equal(found, _vector_for(text))
+
+
+def test_encode_uses_cache(encoder):
+    from services.inference import encode
+
+    first = encode(["백종원 대표", "더본코리아"])
+    assert first.shape == (2, encoder.dim)
+    calls = encoder.calls
+    second = encode(["더본코리아", "백종원 대표", "더본코리아"])
+    assert encoder.calls == calls
+    np.testing.assert_array_equal(second[1], first[0])
+    assert encode("더본코리아").shape == (encoder.dim,)
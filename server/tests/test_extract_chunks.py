@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from benchmarks.fixture_server import FixtureGemini  # noqa: E402
+from services import api  # noqa: E402
+from services.api import (  # noqa: E402
+    chunk_comments,
+    estimate_tokens,
+    extract_keywords_batch_llm,
+)
+
+COMMENTS = [f"댓글 {i}번 백종원 대표가 {i}억 원을 기부했다" for i in range(7)]
+
+
+def _recorded(comments):
+    return json.dumps(
+        {
+            "video_summary": "백종원 기부 영상",
+            "comments_data": [
+                {"index": i, "claims": [{"claim": c, "keywords": ["백종원"]}]}
+                for i, c in enumerate(comments)
+            ],
+        },
+        ensure_ascii=False,
+    )
+
+
+def test_chunks_respect_token_budget_and_order():
+    cost = 2 * estimate_tokens(COMMENTS[0]) + api.COMMENT_OVERHEAD_TOKENS
+    chunks = chunk_comments(COMMENTS, max_tokens=3 * cost)
+    assert [offset for offset, _ in chunks] == [0, 3, 6]
+    assert [c for _, chunk in chunks for c in chunk] == COMMENTS
+    assert chunk_comments(COMMENTS, 10**6, max_comments=4)[1] == (4, COMMENTS[4:])
+
+
+def test_long_comment_gets_its_own_chunk():
+    chunks = chunk_comments(["짧은 댓글", "긴" * 5000, "짧은 댓글"], max_tokens=200)
+    assert [len(chunk) for _, chunk in chunks] == [1, 1, 1]
+    assert chunk_comments([], 100) == [(0, [])]
+
+
+def test_extraction_restores_original_indices(monkeypatch):
+    monkeypatch.setattr(api, "GEMINI_CHUNK_TOKENS", 10**6)
+    monkeypatch.setattr(api, "GEMINI_CHUNK_COMMENTS", 3)
+    client = FixtureGemini(_recorded(COMMENTS), comments=COMMENTS)
+
+    result = extract_keywords_batch_llm(COMMENTS, {"title": "t"}, client=client)
+
+    assert client.calls == 3
+    assert result["summary"] == "백종원 기부 영상"
+    assert [item["index"] for item in result["claims"]] == list(range(7))
+    assert result["claims"][5]["claims"][0]["claim"] == COMMENTS[5]
+    assert result["failed"] == []
+
+
+def test_failed_chunk_reports_its_comments(monkeypatch):
+    monkeypatch.setattr(api, "GEMINI_CHUNK_TOKENS", 10**6)
+    monkeypatch.setattr(api, "GEMINI_CHUNK_COMMENTS", 4)
+    monkeypatch.setattr(api, "GEMINI_RETRIES", 0)
+
+    class BrokenSecondChunk(FixtureGemini):
+        def generate_content(self, prompt):
+            if COMMENTS[4] in prompt:
+                raise RuntimeError("boom")
+            return super().generate_content(prompt)
+
+    client = BrokenSecondChunk(_recorded(COMMENTS), comments=COMMENTS)
+    result = extract_keywords_batch_llm(COMMENTS, {}, client=client)
+    assert result["failed"] == [4, 5, 6]
+    assert [item["index"] for item in result["claims"]] == [0, 1, 2, 3]
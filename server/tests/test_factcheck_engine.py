@@ -0,0 +1,84 @@
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+import factcheck_engine  # noqa: E402
+from benchmarks.bench_e2e import corpus_claims  # noqa: E402
+from factcheck_engine import CommentFactCheck  # noqa: E402
+from services.segmenter import split_sentences  # noqa: E402
+
+
+class _Search:
+    """키워드가 하나라도 겹치는 기록된 기사를 돌려주는 검색 (매번 새 목록)"""
+
+    def __init__(self, corpus):
+        self.articles = corpus["articles"]
+
+    def search(self, subsets):
+        for subset in subsets:
+            found = [a for a in self.articles if set(subset) & set(a["keywords"])]
+            if found:
+                return subset, [self._article(a) for a in found[:3]]
+        return None, []
+
+    @staticmethod
+    def _article(article):
+        segments = split_sentences(article["body"])
+        return [
+            article["title"],
+            f"https://news.example/{article['id']}",
+            [sentence for sentence, _, _ in segments],
+            None,
+            [[start, end] for _, start, end in segments],
+        ]
+
+
+def _translate(texts, target_language="en"):
+    return [f"[{target_language}] {text}" for text in texts]
+
+
+def _outcome(factchecker):
+    return {
+        "score": factchecker.score,
+        "keywords_used": factchecker.claim.keywords_used,
+        "core_sentences": [
+            (
+                cs.sentence,
+                cs.sentence_en,
+                cs.article_idx,
+                cs.sentence_index,
+                cs.offset,
+                round(cs.similarity_score, 5),
+                cs.nli_result["probs"],
+            )
+            for cs in factchecker.claim.core_sentences
+        ],
+        "best_article": (factchecker.best_article or [None, None])[:2],
+        "best_sentence": factchecker.best_sentence,
+    }
+
+
+def test_batch_results_match_single_claim_path(encoder, nli, corpus, monkeypatch):
+    monkeypatch.setattr(factcheck_engine, "search_planner", _Search(corpus))
+    monkeypatch.setattr(factcheck_engine, "translate_text_bulk", _translate)
+    summary, claims = corpus_claims(corpus, 6)
+
+    def factcheckers():
+        return [
+            CommentFactCheck(
+                item["claim"], item["keyword"], corpus["video_ctx"], summary
+            )
+            for item in claims
+        ]
+
+    batch = factcheckers()
+    CommentFactCheck.analyze_batch(batch)
+    singles = factcheckers()
+    for factchecker in singles:
+        factchecker.analyze()
+
+    assert any(factchecker.claim.core_sentences for factchecker in batch)
+    for batched, single in zip(batch, singles):
+        assert _outcome(batched) == _outcome(single)
+    # 배치 경로는 NLI를 한 번에 (주장별 호출이 아니라) 실행
+    assert 0 < len(nli.batches) < 2 * len(claims)
@@ -0,0 +1,14 @@
+from services.inference import rank_keywords_batch
+
+
+def test_rank_keywords_without_any_keywords(encoder):
+    assert rank_keywords_batch([[], []], ["요약", "요약"]) == [[], []]
+    assert encoder.calls == 0
+
+
+def test_rank_keywords_orders_by_summary_similarity(encoder):
+    summary = "백종원 대표 더본코리아 상장"
+    ranked = rank_keywords_batch(
+        [["빽다방 가격", "백종원 대표"], []], [summary, summary]
+    )
+    assert ranked == [["백종원 대표", "빽다방 가격"], []]
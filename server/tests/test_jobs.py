@@ -0,0 +1,109 @@
+import json
+import threading
+
+import pytest
+
+from services.jobs import Job, JobManager, QueueFullError, StreamLimitError
+
+
+def _events(chunks):
+    return [chunk.split("\n")[0] for chunk in chunks]
+
+
+def test_events_stream_results_then_done():
+    job = Job(["a", "b"])
+    job.add_result({"index": 1})
+    events = job.events(keepalive=0.01)
+    assert next(events) == 'event: result\ndata: {"index": 1}\n\n'
+    job.add_result({"index": 0})
+    assert _events(events) == ["event: result", "event: done"]
+
+
+def test_events_send_keepalive_then_timeout():
+    job = Job(["a"])
+    chunks = list(job.events(keepalive=0.01, max_seconds=0.05))
+    assert chunks[0] == ": keepalive\n\n"
+    event, data = chunks[-1].strip().split("\n")
+    assert event == "event: timeout"
+    assert json.loads(data[len("data: ") :]) == {"job_id": job.id, "completed": 0}
+
+
+def test_manager_runs_items_and_limits_queue():
+    release = threading.Event()
+
+    def run(item):
+        release.wait(5)
+        return {"item": item}
+
+    manager = JobManager(run, max_workers=1, max_queue=2)
+    job = manager.submit(["a", "b"])
+    with pytest.raises(QueueFullError):
+        manager.submit(["c"])
+    release.set()
+    assert _events(job.events()) == ["event: result", "event: result", "event: done"]
+    assert sorted(r["item"] for r in job.to_dict()["results"]) == ["a", "b"]
+    assert manager.queue_depth() == 0
+
+
+def test_failed_item_uses_failed_result():
+    def run(item):
+        raise RuntimeError("boom")
+
+    manager = JobManager(
+        run, failed=lambda item: {"claim": item, "fact_result": -1, "error": True}
+    )
+    job = manager.submit(["a"])
+    assert _events(job.events()) == ["event: result", "event: done"]
+    assert job.to_dict()["results"] == [
+        {"index": 0, "claim": "a", "fact_result": -1, "error": True}
+    ]
+    assert manager.queue_depth() == 0
+
+
+def test_failed_claim_keeps_no_evidence_shape(monkeypatch):
+    pytest.importorskip("google.generativeai")
+    import app as app_module
+
+    def fail(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(app_module, "_cached_result", fail)
+    manager = JobManager(app_module._run_claim, failed=app_module._failed_claim)
+    job = manager.submit([{"claim": "주장", "keyword": ["키워드"]}])
+    list(job.events())
+    [result] = job.to_dict()["results"]
+    assert result["index"] == 0
+    assert result["claim"] == "주장"
+    assert result["fact_result"] == -1
+    assert result["related_articles"] == []
+    assert result["error"] is True
+    assert "explaination" in result
+
+
+def test_stream_limit_per_worker():
+    manager = JobManager(lambda item: {}, max_streams=1, max_stream_seconds=0.01)
+    job = manager.submit(["a"])
+    manager.open_stream(job)
+    with pytest.raises(StreamLimitError):
+        manager.open_stream(job)
+    manager.close_stream()
+    assert manager.open_streams() == 0
+    manager.open_stream(job)
+    assert manager.open_streams() == 1
+
+
+def test_events_endpoint_returns_503_when_streams_are_full(monkeypatch):
+    pytest.importorskip("google.generativeai")
+    import app as app_module
+
+    manager = JobManager(lambda item: {}, max_streams=1)
+    monkeypatch.setattr(app_module, "job_manager", manager)
+    job = manager.submit([])
+    client = app_module.app.test_client()
+
+    response = client.get(f"/jobs/{job.id}/events")
+    assert manager.open_streams() == 1
+    assert client.get(f"/jobs/{job.id}/events").status_code == 503
+    assert b"event: done" in response.get_data()
+    response.close()
+    assert manager.open_streams() == 0
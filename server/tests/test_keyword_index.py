@@ -0,0 +1,72 @@
+import threading
+
+from benchmarks.fixture_server import FixtureEncoder
+from services.keyword_index import KeywordIndex, keyword_text
+
+
+class _Entries:
+    def __init__(self):
+        self.rows = []
+
+    def add(self, keywords):
+        self.rows.append((len(self.rows) + 1, keywords))
+
+    def __call__(self, last_id):
+        return [row for row in self.rows if row[0] > last_id]
+
+
+def test_keyword_text_ignores_order_and_duplicates():
+    assert keyword_text(["b", "a", "b"]) == keyword_text(["a", "b"]) == "a b"
+
+
+def test_search_picks_up_new_entries_incrementally():
+    entries, encoder = _Entries(), FixtureEncoder()
+    index = KeywordIndex(entries, encoder.encode, initial_capacity=1)
+    assert index.search(["백종원"]) is None
+
+    entries.add(["백종원", "구속"])
+    entries.add(["더본코리아", "상장"])
+    entry_id, keywords, score = index.search(["구속", "백종원"])
+    assert (entry_id, keywords) == (1, ["백종원", "구속"])
+    assert score > 0.99
+
+    entries.add(["빽다방", "가격"])
+    sentences = encoder.sentences
+    assert index.search(["빽다방", "가격"])[0] == 3
+    # 새 항목 하나와 검색어만 임베딩
+    assert encoder.sentences - sentences == 2
+    assert len(index) == 3
+
+
+def test_search_does_not_wait_for_encoding_in_another_thread():
+    entries, encoder = _Entries(), FixtureEncoder()
+    entries.add(["백종원", "구속"])
+    started, release = threading.Event(), threading.Event()
+
+    def slow_encode(texts):
+        if len(index) and keyword_text(["빽다방", "가격"]) in texts:
+            started.set()
+            release.wait(10)
+        return encoder.encode(texts)
+
+    index = KeywordIndex(entries, slow_encode)
+    index.sync()
+    entries.add(["빽다방", "가격"])
+    syncing = threading.Thread(target=index.sync)
+    syncing.start()
+    assert started.wait(5)
+
+    # 다른 스레드가 새 항목을 임베딩하는 동안 현재 색인으로 바로 검색
+    found = []
+    searching = threading.Thread(
+        target=lambda: found.append(index.search(["백종원", "구속"]))
+    )
+    searching.start()
+    searching.join(1)
+    blocked = searching.is_alive()
+    release.set()
+    searching.join(5)
+    assert not blocked
+    assert found[0][0] == 1
+    syncing.join(5)
+    assert index.search(["빽다방", "가격"])[0] == 2
@@ -0,0 +1,105 @@
+import glob
+import gzip
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+from tools.log_utils import NewsLogger
+
+
+def _records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_written_on_close(tmp_path):
+    logger = NewsLogger(log_dir=str(tmp_path), flush_interval=0.05)
+    for i in range(3):
+        logger.log_crawled_news(f"t{i}", f"u{i}", "본문")
+    logger.close()
+    assert [r["title"] for r in _records(logger.crawl_log_path)] == ["t0", "t1", "t2"]
+
+
+def test_rotation_compresses_and_keeps_backups(tmp_path):
+    logger = NewsLogger(
+        log_dir=str(tmp_path), flush_interval=0.01, max_bytes=1, backup_count=2
+    )
+    for i in range(5):
+        logger._write_batch([(logger.crawl_log_path, {"i": i})])
+    backups = sorted(glob.glob(str(tmp_path / "news_crawled.*-*.jsonl.gz")))
+    assert len(backups) == 2
+    with gzip.open(backups[-1], "rt", encoding="utf-8") as f:
+        assert json.loads(f.read()) == {"i": 3}
+
+
+def test_per_process_files(tmp_path):
+    logger = NewsLogger(
+        log_dir=str(tmp_path), flush_interval=0.01, max_bytes=1, per_process=True
+    )
+    path = logger._process_path(logger.crawl_log_path)
+    assert path.endswith(f"news_crawled.{os.getpid()}.jsonl")
+    logger._write_batch([(path, {"i": 0})])
+    logger._write_batch([(path, {"i": 1})])
+    # 교체 파일명에 pid, 공유 파일은 만들지 않음
+    (rotated,) = glob.glob(str(tmp_path / "news_crawled.*-*.jsonl.gz"))
+    assert rotated.endswith(f".{os.getpid()}.jsonl.gz")
+    assert not os.path.exists(logger.crawl_log_path)
+    assert _records(path) == [{"i": 1}]
+
+
+def test_exited_process_file_is_rotated(tmp_path):
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()
+    orphan = tmp_path / f"news_crawled.{child.pid}.jsonl"
+    orphan.write_text('{"i": 0}\n', encoding="utf-8")
+    alive = tmp_path / f"news_crawled.{os.getppid()}.jsonl"
+    alive.write_text('{"i": 1}\n', encoding="utf-8")
+
+    NewsLogger(log_dir=str(tmp_path), per_process=True)._rotate_orphans()
+
+    assert not orphan.exists()
+    assert alive.exists()
+    (rotated,) = glob.glob(str(tmp_path / "news_crawled.*-*.jsonl.gz"))
+    assert rotated.endswith(f".{child.pid}.jsonl.gz")
+
+
+def test_close_writes_records_left_in_queue(tmp_path):
+    logger = NewsLogger(log_dir=str(tmp_path), max_queue=3)
+    # 쓰기 스레드가 이미 멈춘 상태에서 큐가 가득 참
+    stopped = threading.Thread(target=lambda: None)
+    stopped.start()
+    stopped.join()
+    logger.pid, logger.thread = os.getpid(), stopped
+    logger.queue, logger.stopping = queue.Queue(3), threading.Event()
+    for i in range(3):
+        logger.queue.put_nowait((logger.crawl_log_path, {"i": i}))
+
+    started = time.monotonic()
+    logger.close(timeout=0.2)
+    assert time.monotonic() - started < 2
+    assert _records(logger.crawl_log_path) == [{"i": i} for i in range(3)]
+
+
+def test_writer_survives_failed_batch(tmp_path, monkeypatch):
+    logger = NewsLogger(log_dir=str(tmp_path), flush_interval=0.01)
+    write_batch = logger._write_batch
+    failures = []
+
+    def flaky(batch):
+        if not failures:
+            failures.append(batch)
+            raise RuntimeError("gzip failed")
+        write_batch(batch)
+
+    monkeypatch.setattr(logger, "_write_batch", flaky)
+    logger.log_crawled_news("lost", "u", "b")
+    while not failures:
+        time.sleep(0.001)
+    logger.log_crawled_news("kept", "u", "b")
+    logger.close()
+    assert logger.thread is not None and not logger.thread.is_alive()
+    assert [r["title"] for r in _records(logger.crawl_log_path)] == ["kept"]
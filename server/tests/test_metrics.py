@@ -0,0 +1,94 @@
+import contextvars
+import threading
+
+import pytest
+
+from tools.metrics import (
+    MetricsRegistry,
+    current_request_id,
+    log,
+    request_spans,
+    span,
+    start_request,
+)
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "stage_seconds", "Stage time", ["stage"], buckets=(1, 0.1)
+    )
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, stage="nli")
+    assert histogram.render()[2:] == [
+        'stage_seconds_bucket{stage="nli",le="0.1"} 1',
+        'stage_seconds_bucket{stage="nli",le="1"} 2',
+        'stage_seconds_bucket{stage="nli",le="+Inf"} 3',
+        'stage_seconds_sum{stage="nli"} 5.55',
+        'stage_seconds_count{stage="nli"} 3',
+    ]
+
+
+def test_render_text_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("errors_total", "Errors", ["api"])
+    counter.inc(api='say "hi"')
+    counter.inc(2, api='say "hi"')
+    assert registry.counter("errors_total", "ignored") is counter
+    registry.gauge("queue_depth", "Queue depth").set_function(lambda: 4)
+    assert registry.render() == (
+        "# HELP errors_total Errors\n"
+        "# TYPE errors_total counter\n"
+        'errors_total{api="say \\"hi\\""} 3\n'
+        "# HELP queue_depth Queue depth\n"
+        "# TYPE queue_depth gauge\n"
+        "queue_depth 4\n"
+    )
+
+
+def _request_in_worker(copy_context):
+    # 요청 컨텍스트에서 워커 스레드를 띄우고, 워커의 request id와 span을 확인
+    request_id = start_request("req-1")
+    seen = []
+
+    def work():
+        seen.append(current_request_id())
+        log("test_metrics.py", "워커")
+        with span("worker"):
+            pass
+
+    if copy_context:
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(work,))
+    else:
+        thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+    return request_id, seen, [s.name for s in request_spans()]
+
+
+def test_request_id_propagates_to_worker_threads(capsys):
+    request_id, seen, spans = contextvars.Context().run(_request_in_worker, True)
+    assert seen == [request_id]
+    assert spans == ["worker"]
+    assert f"[test_metrics.py][{request_id}]: 워커" in capsys.readouterr().out
+
+
+def test_request_id_needs_copied_context(capsys):
+    _, seen, spans = contextvars.Context().run(_request_in_worker, False)
+    assert seen == [None]
+    assert spans == []
+    assert "[test_metrics.py]: 워커" in capsys.readouterr().out
+
+
+def test_metrics_endpoint():
+    pytest.importorskip("google.generativeai")
+    import app as app_module
+
+    client = app_module.app.test_client()
+    response = client.get("/metrics", headers={"X-Request-ID": "req-2"})
+    assert response.headers["X-Request-ID"] == "req-2"
+    response = client.get("/metrics")
+    assert response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    assert "# TYPE http_requests_total counter" in text
+    assert "http_request_seconds_bucket" in text
@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+
+from services.models import ModelRegistry
+
+
+def test_concurrent_get_loads_once():
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(threading.current_thread().name)
+        time.sleep(0.05)  # 다른 스레드가 로드 중에 get을 호출하도록
+        return object()
+
+    registry.register("nli", loader)
+    assert registry.peek("nli") is None
+    barrier = threading.Barrier(2)
+    models = []
+
+    def get():
+        barrier.wait()
+        models.append(registry.get("nli"))
+
+    threads = [threading.Thread(target=get) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert models[0] is models[1] is registry.peek("nli")
+    stats = registry.stats()["nli"]
+    assert stats["loaded"] is True
+    assert stats["load_seconds"] >= 0.05
+    assert isinstance(stats["rss_delta_mb"], float)
+
+
+def test_failed_load_is_retried():
+    registry = ModelRegistry()
+    attempts = []
+
+    def loader():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("download failed")
+        return "model"
+
+    registry.register("embedding", loader)
+    with pytest.raises(RuntimeError):
+        registry.get("embedding")
+    assert registry.peek("embedding") is None
+    assert registry.stats() == {"embedding": {"loaded": False}}
+
+    assert registry.get("embedding") == "model"
+    assert registry.get("embedding") == "model"
+    assert len(attempts) == 2
+    assert registry.stats()["embedding"]["loaded"] is True
@@ -0,0 +1,87 @@
+import threading
+
+from services.prefetch import Prefetcher
+
+
+class _Run:
+    """release가 설정될 때까지 단계마다 proceed()를 확인하는 작업"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.done = []
+
+    def __call__(self, item, proceed):
+        self.started.set()
+        self.release.wait(5)
+        if not proceed():
+            return False
+        self.done.append(item["claim"])
+        return True
+
+
+def _items(*claims):
+    return [(claim, {"claim": claim}) for claim in claims]
+
+
+def test_budget_per_video_and_duplicates():
+    run = _Run()
+    run.release.set()
+    prefetcher = Prefetcher(run, budget=2)
+    assert prefetcher.submit("v", _items("a", "b", "c")) == 2
+    assert prefetcher.submit("v", _items("a")) == 0
+    assert prefetcher.submit(None, _items("d")) == 0
+    prefetcher.executor.shutdown(wait=True)
+    assert sorted(run.done) == ["a", "b"]
+    assert prefetcher.queue_depth() == 0
+
+
+def test_claim_cancels_queued_and_waits_for_running():
+    run = _Run()
+    prefetcher = Prefetcher(run, max_workers=1, wait_timeout=5)
+    prefetcher.submit("v", _items("a", "b"))
+    assert run.started.wait(5)
+
+    # b는 대기 중이라 취소되고 바로 분석, a는 실행 중이라 끝날 때까지 기다림
+    prefetcher.claim("v", ["b"])
+    assert "b" not in prefetcher.videos["v"].tasks
+    threading.Timer(0.05, run.release.set).start()
+    prefetcher.claim("v", ["a"])
+    assert run.done == ["a"]
+    prefetcher.executor.shutdown(wait=True)
+    assert prefetcher.queue_depth() == 0
+
+
+def test_cancel_stops_running_task_at_next_step():
+    run = _Run()
+    prefetcher = Prefetcher(run, max_workers=1)
+    prefetcher.submit("v", _items("a", "b"))
+    assert run.started.wait(5)
+    assert prefetcher.cancel("v") == 2
+    run.release.set()
+    prefetcher.executor.shutdown(wait=True)
+    assert run.done == []
+    assert prefetcher.queue_depth() == 0
+
+
+def test_running_task_yields_to_foreground_requests():
+    run = _Run()
+    run.release.set()
+    prefetcher = Prefetcher(run, max_workers=1, yield_timeout=5)
+    with prefetcher.foreground():
+        prefetcher.submit("v", _items("a"))
+        # 분석 요청이 끝날 때까지 시작하지 않음
+        assert not run.started.wait(0.1)
+    assert run.started.wait(1)
+    prefetcher.executor.shutdown(wait=True)
+    assert run.done == ["a"]
+
+
+def test_oldest_videos_are_dropped():
+    run = _Run()
+    run.release.set()
+    prefetcher = Prefetcher(run, max_videos=1)
+    prefetcher.submit("v1", _items("a"))
+    prefetcher.submit("v2", _items("b"))
+    assert list(prefetcher.videos) == ["v2"]
+    assert not Prefetcher(run, enabled=False).submit("v", _items("a"))
@@ -0,0 +1,42 @@
+from services.search_cache import SearchCache
+
+URL = "https://news.example/search"
+LISTINGS = [("제목", "https://a.example/1"), ("제목2", "https://a.example/2")]
+
+
+def test_listings_round_trip_per_url_and_pages(tmp_path):
+    cache = SearchCache(str(tmp_path / "s.sqlite3"))
+    assert cache.get_listings(URL, "백종원", 1) is None
+    cache.put_listings(URL, "백종원", 1, LISTINGS)
+
+    other = SearchCache(str(tmp_path / "s.sqlite3"))  # 다른 워커
+    assert other.get_listings(URL, "백종원", 1) == LISTINGS
+    assert other.get_listings(URL, "백종원", 2) is None
+    assert other.get_listings("http://127.0.0.1/search", "백종원", 1) is None
+
+
+def test_empty_queries_expire(tmp_path):
+    cache = SearchCache(str(tmp_path / "s.sqlite3"), empty_ttl=600)
+    assert not cache.is_empty(URL, "없는 검색어")
+    cache.put_empty(URL, "없는 검색어")
+    assert cache.is_empty(URL, "없는 검색어")
+
+    expired = SearchCache(str(tmp_path / "s.sqlite3"), empty_ttl=1e-9)
+    assert not expired.is_empty(URL, "없는 검색어")
+
+
+def test_disabled_kinds(tmp_path):
+    cache = SearchCache(str(tmp_path / "s.sqlite3"), listing_ttl=0, empty_ttl=0)
+    cache.put_listings(URL, "q", 1, LISTINGS)
+    cache.put_empty(URL, "q")
+    assert cache.get_listings(URL, "q", 1) is None
+    assert not cache.is_empty(URL, "q")
+
+
+def test_old_items_are_trimmed(tmp_path):
+    cache = SearchCache(str(tmp_path / "s.sqlite3"), max_empty_items=10)
+    for i in range(100):
+        cache.put_empty(URL, f"q{i}")
+    (count,) = cache._connect().execute("SELECT COUNT(*) FROM empty_queries").fetchone()
+    assert count == 10
+    assert cache.is_empty(URL, "q99")
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from services.search_planner import SearchPlanner  # noqa: E402
+
+
+class _Collect:
+    """부분집합별 (지연, 결과)를 정해 둔 검색, 취소되면 바로 끝남"""
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.started = []
+        self.cancelled = []
+        self.lock = threading.Lock()
+
+    def __call__(self, subset, cancel=None):
+        key = tuple(subset)
+        with self.lock:
+            self.started.append(key)
+        delay, articles = self.plan[key]
+        if cancel.wait(delay):
+            with self.lock:
+                self.cancelled.append(key)
+            return []
+        return articles
+
+
+SUBSETS = [["a", "b", "c"], ["a", "b"], ["a"]]
+
+
+def test_first_non_empty_subset_in_priority_order():
+    collect = _Collect(
+        {("a", "b", "c"): (0.05, []), ("a", "b"): (0.1, ["ab"]), ("a",): (0, ["a"])}
+    )
+    planner = SearchPlanner(collect, width=3, hedge_delay=0)
+    # ("a",)가 먼저 끝나도 앞선 부분집합의 결과를 기다려 순차 재시도와 같은 결과
+    assert planner.search(SUBSETS) == (["a", "b"], ["ab"])
+
+
+def test_remaining_searches_are_cancelled():
+    collect = _Collect(
+        {("a", "b", "c"): (0, ["abc"]), ("a", "b"): (5, ["ab"]), ("a",): (5, ["a"])}
+    )
+    planner = SearchPlanner(collect, width=3, hedge_delay=0)
+    started = time.monotonic()
+    assert planner.search(SUBSETS) == (["a", "b", "c"], ["abc"])
+    assert time.monotonic() - started < 2
+    planner.executor.shutdown(wait=True)
+    assert set(collect.cancelled) == set(collect.started) - {("a", "b", "c")}
+
+
+def test_hedge_delay_limits_extra_searches():
+    collect = _Collect(
+        {("a", "b", "c"): (0.01, ["abc"]), ("a", "b"): (0, []), ("a",): (0, [])}
+    )
+    planner = SearchPlanner(collect, width=3, hedge_delay=5)
+    assert planner.search(SUBSETS) == (["a", "b", "c"], ["abc"])
+    assert collect.started == [("a", "b", "c")]
+
+
+def test_all_empty_or_failed():
+    def collect(subset, cancel=None):
+        if len(subset) == 2:
+            raise RuntimeError("blocked")
+        return []
+
+    assert SearchPlanner(collect, hedge_delay=0).search(SUBSETS) == (None, [])
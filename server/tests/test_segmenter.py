@@ -0,0 +1,47 @@
+from services.segmenter import split_sentences
+
+
+def _sentences(text, **kwargs):
+    return [sentence for sentence, _, _ in split_sentences(text, **kwargs)]
+
+
+def test_offsets_point_into_original_text():
+    text = "  백종원 대표가 오늘 기자회견을 열었다.  그는 의혹을 모두 부인했다!\n\n더본코리아 주가는 7.5% 올랐다.  "
+    result = split_sentences(text, min_length=5)
+    assert [s for s, _, _ in result] == [
+        "백종원 대표가 오늘 기자회견을 열었다.",
+        "그는 의혹을 모두 부인했다!",
+        "더본코리아 주가는 7.5% 올랐다.",
+    ]
+    for sentence, start, end in result:
+        assert text[start:end] == sentence
+
+
+def test_numbers_and_abbreviations_do_not_split():
+    text = "U.S. 정부는 3.1절 행사에 참석했다. Dr. Kim 교수도 자리했다."
+    assert _sentences(text, min_length=5) == [
+        "U.S. 정부는 3.1절 행사에 참석했다.",
+        "Dr. Kim 교수도 자리했다.",
+    ]
+
+
+def test_quote_followed_by_particle_is_one_sentence():
+    text = '그는 "사실이 아니다." 라고 말했다. 회사도 같은 입장을 밝혔다.'
+    assert _sentences(text, min_length=5) == [
+        '그는 "사실이 아니다." 라고 말했다.',
+        "회사도 같은 입장을 밝혔다.",
+    ]
+
+
+def test_short_fragments_are_merged():
+    text = "네. 그렇습니다. 회사는 공식 입장을 곧 발표할 예정이다. 끝."
+    assert _sentences(text, min_length=10) == [
+        "네. 그렇습니다. 회사는 공식 입장을 곧 발표할 예정이다. 끝."
+    ]
+
+
+def test_short_paragraph_is_dropped_and_whole_text_fallback():
+    text = "홍길동 기자\n회사는 공식 입장을 곧 발표할 예정이다."
+    assert _sentences(text, min_length=10) == ["회사는 공식 입장을 곧 발표할 예정이다."]
+    assert split_sentences(" 짧은 글 ", min_length=10) == [("짧은 글", 1, 5)]
+    assert split_sentences("   ") == []
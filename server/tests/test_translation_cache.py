@@ -0,0 +1,80 @@
+import threading
+import time
+
+from services.translation_cache import TranslationCache
+
+
+def _upper(calls):
+    def translate(texts):
+        calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+    return translate
+
+
+def test_only_missing_texts_are_translated(tmp_path):
+    cache = TranslationCache(str(tmp_path / "t.sqlite3"))
+    calls = []
+    assert cache.translate(["a", "b", "a"], "en", "text", _upper(calls)) == [
+        "A",
+        "B",
+        "A",
+    ]
+    assert cache.translate(["b", "c"], "en", "text", _upper(calls)) == ["B", "C"]
+    assert calls == [["a", "b"], ["c"]]
+    # 대상 언어 / 형식이 다르면 다른 키
+    cache.translate(["a"], "ja", "text", _upper(calls))
+    assert calls[-1] == ["a"]
+
+
+def test_translations_persist_across_instances(tmp_path):
+    path = str(tmp_path / "t.sqlite3")
+    TranslationCache(path).translate(["안녕"], "en", "text", lambda t: ["hello"])
+    calls = []
+    reopened = TranslationCache(path)
+    assert reopened.translate(["안녕"], "en", "text", _upper(calls)) == ["hello"]
+    assert calls == []
+    assert reopened.stats()["hits"] == 1
+
+
+def test_failed_translation_is_not_cached():
+    cache = TranslationCache(None)
+
+    def broken(texts):
+        raise RuntimeError("quota")
+
+    assert cache.translate(["a"], "en", "text", broken) == [None]
+    assert cache.translate(["a"], "en", "text", lambda t: ["A"]) == ["A"]
+    assert cache.inflight == {}
+
+
+def test_concurrent_requests_are_coalesced():
+    cache = TranslationCache(None)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow(texts):
+        calls.append(list(texts))
+        started.set()
+        release.wait(5)
+        return [text.upper() for text in texts]
+
+    results = []
+    first = threading.Thread(
+        target=lambda: results.append(cache.translate(["a"], "en", "text", slow))
+    )
+    first.start()
+    assert started.wait(5)
+    second = threading.Thread(
+        target=lambda: results.append(cache.translate(["a", "b"], "en", "text", slow))
+    )
+    second.start()
+    while cache.stats()["coalesced"] == 0:
+        time.sleep(0.001)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert sorted(results) == [["A"], ["A", "B"]]
+    assert calls == [["a"], ["b"]]
+    assert cache.stats()["coalesced"] == 1
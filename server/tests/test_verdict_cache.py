@@ -0,0 +1,54 @@
+import time
+
+from services.verdict_cache import VerdictCache, normalize_claim
+
+VERDICT = {"fact_result": 0.8, "related_articles": [{"title": "t"}]}
+EMPTY = {"fact_result": -1, "related_articles": []}
+
+
+def test_normalize_claim_strips_josa_and_punctuation():
+    assert normalize_claim("백종원은 구속되었다!") == normalize_claim(
+        "백종원 구속되었다"
+    )
+    # 조사를 떼면 한 글자만 남는 단어는 그대로
+    assert normalize_claim("국가") == "국가"
+
+
+def test_key_ignores_keyword_order():
+    assert VerdictCache.key("주장", ["a", "b"]) == VerdictCache.key("주장.", ["b", "a"])
+    assert VerdictCache.key("주장", ["a"]) != VerdictCache.key("주장", ["b"])
+
+
+def test_shared_database_round_trip(tmp_path):
+    path = str(tmp_path / "verdicts.sqlite3")
+    VerdictCache(path).put("백종원은 구속되었다", ["백종원"], VERDICT)
+
+    other = VerdictCache(path)  # 다른 워커
+    assert other.get("백종원 구속되었다.", ["백종원"]) == VERDICT
+    assert other.contains("백종원 구속되었다", ["백종원"])
+    assert other.get("백종원 구속되었다", ["백종원"], bypass=True) is None
+    assert other.stats()["hits"] == 1
+
+
+def test_empty_verdicts_use_short_ttl(tmp_path):
+    cache = VerdictCache(str(tmp_path / "v.sqlite3"), empty_ttl=0)
+    cache.put("근거 없음", ["x"], EMPTY)
+    assert cache.get("근거 없음", ["x"]) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = VerdictCache(str(tmp_path / "v.sqlite3"), ttl=0.01)
+    cache.put("주장", ["k"], VERDICT)
+    cache.memory.clear()
+    time.sleep(0.02)
+    assert cache.get("주장", ["k"]) is None
+
+
+def test_memory_only_lru():
+    cache = VerdictCache(None, max_memory_items=1)
+    cache.put("a", [], VERDICT)
+    cache.put("b", [], VERDICT)
+    assert cache.get("a", []) is None
+    assert cache.get("b", []) == VERDICT
+    assert cache.hit_rate() == 0.5
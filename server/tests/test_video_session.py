@@ -0,0 +1,158 @@
+import json
+
+import numpy as np
+
+from services.video_session import VideoSessionStore, comment_hash, video_key
+
+
+def _items(*claims):
+    return [{"claim": claim, "keyword": [claim]} for claim in claims]
+
+
+def _vectors(*directions, dim=4):
+    vectors = np.zeros((len(directions), dim), dtype=np.float32)
+    for row, axis in zip(vectors, directions):
+        row[axis] = 1.0
+    return vectors
+
+
+def test_group_claims_duplicate_in_middle_of_batch():
+    store = VideoSessionStore()
+    session = store.get("id:v", create=True)
+    items = _items("A", "A2", "B", "A3")
+
+    representatives = store.group_claims(session, items, _vectors(0, 0, 1, 0), 0.9)
+
+    assert [r["claim"] for r in representatives] == ["A", "A", "B", "A"]
+    assert [r["claim"] for r in session.representatives] == ["A", "B"]
+    assert session.representative_embeddings.shape == (2, 4)
+    assert store.dedup_stats(session) == {
+        "claims": 4,
+        "runs_saved": 2,
+        "matched": 0,
+        "representatives": 2,
+    }
+
+
+def test_group_claims_against_existing_representatives():
+    store = VideoSessionStore()
+    session = store.get("id:v", create=True)
+    store.group_claims(session, _items("A", "B"), _vectors(0, 1), 0.9)
+
+    # C(새 주장)가 기존 대표와 섞여 있어도 새 대표 번호는 세션 목록 순서
+    items = _items("B2", "C", "A2", "C2", "D")
+    representatives = store.group_claims(session, items, _vectors(1, 2, 0, 2, 3), 0.9)
+
+    assert [r["claim"] for r in representatives] == ["B", "C", "A", "C", "D"]
+    assert [r["claim"] for r in session.representatives] == ["A", "B", "C", "D"]
+    assert len(session.representative_embeddings) == 4
+    stats = store.dedup_stats(session)
+    # 이전 요청의 대표에 묶인 B2, A2는 생략된 분석이 아니라 matched
+    assert stats["runs_saved"] == 1
+    assert stats["matched"] == 2
+
+
+def test_group_claims_without_session():
+    store = VideoSessionStore()
+    representatives = store.group_claims(
+        None, _items("A", "B", "A2"), _vectors(0, 1, 0), 0.9
+    )
+    assert [r["claim"] for r in representatives] == ["A", "B", "A"]
+
+
+def test_representatives_are_counted_and_capped():
+    store = VideoSessionStore(max_representatives=2)
+    session = store.get("id:v", create=True)
+    store.group_claims(session, _items("A", "B"), _vectors(0, 1), 0.9)
+    assert (
+        store.nbytes
+        == session.nbytes
+        == 2 * 16
+        + sum(
+            len(json.dumps(item, ensure_ascii=False).encode())
+            for item in _items("A", "B")
+        )
+    )
+
+    # 새 대표가 들어오면 가장 오래된 A부터 버림
+    representatives = store.group_claims(
+        session, _items("C", "B2"), _vectors(2, 1), 0.9
+    )
+    assert [r["claim"] for r in representatives] == ["C", "B"]
+    assert [r["claim"] for r in session.representatives] == ["B", "C"]
+    assert session.representative_embeddings.shape == (2, 4)
+    assert (
+        store.nbytes
+        == session.nbytes
+        == 2 * 16
+        + sum(
+            len(json.dumps(item, ensure_ascii=False).encode())
+            for item in _items("B", "C")
+        )
+    )
+
+    # 버려진 A는 더 이상 묶이지 않고 새 대표가 됨
+    representatives = store.group_claims(
+        session, _items("A2", "C2"), _vectors(0, 2), 0.9
+    )
+    assert [r["claim"] for r in representatives] == ["A2", "C"]
+    assert [r["claim"] for r in session.representatives] == ["C", "A2"]
+    np.testing.assert_array_equal(session.representative_embeddings, _vectors(2, 0))
+
+
+def test_video_key():
+    assert video_key("abc") == "id:abc"
+    assert video_key(None, {"title": "t"}) == video_key("", {"title": "t"})
+    assert video_key(None, {"title": "t"}).startswith("ctx:")
+    assert video_key(None, {}) is None
+
+
+def test_comment_hash_ignores_whitespace():
+    assert comment_hash("백종원  구속\n") == comment_hash("백종원 구속")
+
+
+def test_claims_and_summary_reuse():
+    store = VideoSessionStore()
+    session = store.get("id:v", create=True)
+    store.put_claims(session, {"h1": [{"claim": "x"}], "h2": []})
+    assert store.claims(session, ["h1", "h2", "h3"]) == {
+        "h1": [{"claim": "x"}],
+        "h2": [],
+    }
+    store.set_summary(session, "요약")
+    assert store.summary(session) == "요약"
+    assert store.get("id:v") is session
+
+
+def test_set_summary_frees_old_embedding_bytes():
+    store = VideoSessionStore()
+    session = store.get("id:v", create=True)
+    store.set_summary(session, "요약")
+    before = store.nbytes
+    store.set_summary_embedding(session, "요약", np.zeros(8, dtype=np.float32))
+    assert store.nbytes == before + 32
+    store.set_summary(session, "새 요약")
+    assert store.summary_embedding(session, "새 요약") is None
+    assert store.nbytes == session.nbytes == len("새 요약".encode())
+
+
+def test_evicts_other_sessions_before_current_articles():
+    store = VideoSessionStore(max_bytes=2000)
+    old = store.get("id:old", create=True)
+    store.put_articles(old, ["k"], ["k"], [["t", "l", ["s" * 900], None]])
+    current = store.get("id:new", create=True)
+    store.put_articles(current, ["k"], ["k"], [["t", "l", ["s" * 900], None]])
+    store.put_articles(current, ["k2"], ["k2"], [["t", "l", ["s" * 900], None]])
+
+    assert store.get("id:old") is None
+    assert store.articles(current, ["k2"]) is not None
+    assert store.nbytes <= store.max_bytes
+    assert store.nbytes == current.nbytes
+
+
+def test_expired_sessions_are_dropped():
+    store = VideoSessionStore(ttl=60)
+    session = store.get("id:v", create=True)
+    session.touched_at -= 120
+    assert store.get("id:v") is None
+    assert store.stats()["sessions"] == 0
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from services import inference
+
+
+@pytest.fixture
+def warm_up_state(monkeypatch):
+    started = []
+    monkeypatch.setattr(inference, "_warm_up_pid", None)
+    monkeypatch.setattr(inference, "models_ready", inference.threading.Event())
+    monkeypatch.setattr(inference, "_warm_up_error", None)
+    monkeypatch.setattr(
+        inference.registry, "warm_up_async", lambda fn: started.append(fn)
+    )
+    return started
+
+
+def test_start_warm_up_once_per_process(warm_up_state, monkeypatch):
+    monkeypatch.setattr(inference, "MODEL_WARMUP", True)
+    inference.start_warm_up()
+    inference.start_warm_up()
+    assert warm_up_state == [inference.warm_up]
+    assert not inference.models_ready.is_set()
+
+    # fork된 워커에서는 다시 시작
+    monkeypatch.setattr(inference, "_warm_up_pid", os.getpid() + 1)
+    inference.start_warm_up()
+    assert len(warm_up_state) == 2
+
+
+def test_without_warm_up_ready_immediately(warm_up_state, monkeypatch):
+    monkeypatch.setattr(inference, "MODEL_WARMUP", False)
+    inference.start_warm_up()
+    assert inference.models_ready.is_set()
+    assert warm_up_state == []
+
+
+def test_ready_starts_warm_up_on_first_request(warm_up_state, monkeypatch):
+    pytest.importorskip("google.generativeai")
+    import app as app_module
+
+    # wsgi:app만 import하는 WSGI 서버: post_fork / __main__ 없이 첫 요청이 워밍업 시작
+    monkeypatch.setattr(inference, "MODEL_WARMUP", False)
+    monkeypatch.setattr(app_module, "models_ready", inference.models_ready)
+    client = app_module.app.test_client()
+    assert client.get("/ready").status_code == 200
+
+
+class _BrokenEncoder:
+    def encode(self, sentences):
+        raise RuntimeError("model file missing")
+
+
+def test_failed_warm_up_is_recorded(warm_up_state, monkeypatch):
+    monkeypatch.setitem(inference.registry.models, "embedding", _BrokenEncoder())
+    inference.warm_up()
+    assert not inference.models_ready.is_set()
+    assert inference.warm_up_error() == "RuntimeError: model file missing"
+
+
+def test_ready_reports_warm_up_error(warm_up_state, monkeypatch):
+    pytest.importorskip("google.generativeai")
+    import app as app_module
+
+    monkeypatch.setattr(app_module, "models_ready", inference.models_ready)
+    monkeypatch.setattr(inference, "_warm_up_pid", os.getpid())
+    monkeypatch.setitem(inference.registry.models, "embedding", _BrokenEncoder())
+    inference.warm_up()
+    response = app_module.app.test_client().get("/ready")
+    assert response.status_code == 503
+    assert response.get_json() == {
+        "ready": False,
+        "error": "RuntimeError: model file missing",
+    }
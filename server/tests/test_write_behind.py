@@ -0,0 +1,76 @@
+import os
+import threading
+
+from services.write_behind import WriteBehindWriter
+
+
+def test_writes_in_order_and_flushes():
+    written = []
+    writer = WriteBehindWriter("t", lambda key, value: written.append((key, value)))
+    for i in range(5):
+        assert writer.submit(i, str(i))
+    assert writer.flush(5)
+    assert written == [(i, str(i)) for i in range(5)]
+    writer.close()
+
+
+def test_pending_writes_are_coalesced_and_bounded():
+    release = threading.Event()
+    written = []
+
+    def write(key, value):
+        release.wait(5)
+        written.append((key, value))
+        return True
+
+    writer = WriteBehindWriter("t", write, max_pending=2)
+    writer.submit("busy", 0)  # 쓰기 스레드가 붙잡고 있는 작업
+    while not writer.busy:
+        release.wait(0.001)
+    assert writer.submit("a", 1)
+    assert writer.submit("b", 1)
+    assert writer.submit("a", 2)  # 대기 중인 key는 최신 값으로
+    assert not writer.submit("c", 1)  # 가득 차면 새 key는 버림
+    release.set()
+    assert writer.flush(5)
+    assert written == [("busy", 0), ("a", 2), ("b", 1)]
+    writer.close()
+
+
+def test_failed_write_does_not_stop_the_writer():
+    written = []
+
+    def write(key, value):
+        if key == "bad":
+            raise OSError("disk full")
+        written.append(key)
+
+    writer = WriteBehindWriter("t", write)
+    writer.submit("bad", None)
+    writer.submit("good", None)
+    assert writer.flush(5)
+    assert written == ["good"]
+    writer.close()
+
+
+def test_close_drains_pending_writes():
+    written = []
+    writer = WriteBehindWriter("t", lambda key, value: written.append(key))
+    for i in range(100):
+        writer.submit(i, None)
+    writer.close()
+    assert written == list(range(100))
+    assert not writer.thread.is_alive()
+    assert writer.pid is None
+
+
+def test_forked_process_starts_its_own_thread():
+    writer = WriteBehindWriter("t", lambda key, value: True)
+    writer.submit("a", None)
+    writer.flush(5)
+    parent_thread = writer.thread
+    writer.pid = os.getpid() + 1  # fork 직후 상태
+    writer.submit("b", None)
+    assert writer.thread is not parent_thread
+    assert writer.flush(5)
+    writer.close()
@@ -1,24 +1,240 @@
 import os
+import glob
+import gzip
 import json
+import queue
+import shutil
+import atexit
+import threading
+import time
 from datetime import datetime
 from typing import List, Dict, Tuple, Any
 from services.data_models import Claim, CoreSentence
+from tools.metrics import log, metrics
+
+log_records_dropped = metrics.counter(
+    "log_records_dropped_total", "Log records dropped because the queue was full"
+)
 
 
 class NewsLogger:
-    def __init__(self, log_dir: str = "logs"):
+    """
+    JSONL 로그 기록기
+
+    - 호출한 스레드는 레코드를 큐에 넣기만 하고, 백그라운드 스레드가 모아서 기록
+    - 큐가 가득 차면 요청을 막지 않고 레코드를 버림 (log_records_dropped_total)
+    - 파일이 max_bytes를 넘거나 rotate_interval초가 지나면 교체, 교체된 파일은 gzip 압축
+    - 로그 종류별로 교체된 파일은 backup_count개까지만 유지
+    - per_process이면 프로세스마다 {종류}.{pid}.jsonl에 기록하고 자기 파일만 교체
+      (여러 워커가 같은 파일을 동시에 교체/압축하지 않도록), 종료된 프로세스의 파일은
+      다음에 시작한 프로세스가 교체
+    - 종료 시(atexit) 남은 레코드를 모두 기록 (쓰기 스레드가 멈춰 있으면 호출한 스레드에서 직접 기록)
+    """
+
+    def __init__(
+        self,
+        log_dir: str = "logs",
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        max_bytes: int = 50 * 1024 * 1024,
+        rotate_interval: float = 24 * 3600,
+        backup_count: int = 7,
+        compress: bool = True,
+        per_process: bool = False,
+    ):
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.log_dir = os.path.join(base_dir, log_dir)
-        os.makedirs(log_dir, exist_ok=True)
+        os.makedirs(self.log_dir, exist_ok=True)
 
         self.crawl_log_path = os.path.join(self.log_dir, "news_crawled.jsonl")
         self.translation_log_path = os.path.join(self.log_dir, "news_translated.jsonl")
         self.comment_log_path = os.path.join(self.log_dir, "comment_analysis.jsonl")
 
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.per_process = per_process
+
+        self.lock = threading.Lock()
+        self.write_lock = (
+            threading.Lock()
+        )  # 쓰기 스레드와 close()의 직접 기록이 섞이지 않도록
+        self.stopping = None  # close()가 설정, 큐가 비면 쓰기 스레드 종료
+        self.queue = None
+        self.thread = None
+        self.pid = None
+        self.opened_at = {}  # filepath -> 현재 파일 사용 시작 시각
+        atexit.register(self.close)
+
     def _append_jsonl(self, filepath: str, data: Dict):
         data["timestamp"] = datetime.now().isoformat()
-        with open(filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(data, ensure_ascii=False, indent=4) + "\n")
+        try:
+            self._writer_queue().put_nowait((self._process_path(filepath), data))
+        except queue.Full:
+            log_records_dropped.inc()
+
+    def _writer_queue(self):
+        # fork된 워커에는 부모의 쓰기 스레드가 없으므로 프로세스마다 새로 시작
+        if self.pid != os.getpid():
+            with self.lock:
+                if self.pid != os.getpid():
+                    self.queue = queue.Queue(self.max_queue)
+                    self.stopping = threading.Event()
+                    self.thread = threading.Thread(
+                        target=self._run,
+                        args=(self.queue, self.stopping),
+                        name="news-logger",
+                    )
+                    self.thread.daemon = True
+                    self.thread.start()
+                    self.pid = os.getpid()
+        return self.queue
+
+    def _process_path(self, filepath):
+        if not self.per_process:
+            return filepath
+        return f"{filepath[: -len('.jsonl')]}.{os.getpid()}.jsonl"
+
+    def _rotate_orphans(self):
+        # 종료된 프로세스가 남긴 {종류}.{pid}.jsonl을 교체 파일로 넘김
+        for filepath in (
+            self.crawl_log_path,
+            self.translation_log_path,
+            self.comment_log_path,
+        ):
+            stem = filepath[: -len(".jsonl")]
+            for path in glob.glob(f"{glob.escape(stem)}.*.jsonl"):
+                pid = path[len(stem) + 1 : -len(".jsonl")]
+                if not pid.isdigit() or int(pid) == os.getpid():
+                    continue
+                try:
+                    os.kill(int(pid), 0)
+                    continue
+                except ProcessLookupError:
+                    pass
+                except PermissionError:
+                    continue
+                try:
+                    self._rotate(path, stem)
+                except OSError as e:
+                    log("log_utils.py", f"로그 교체 실패 {path}: {e}")
+
+    def _run(self, records, stopping):
+        if self.per_process:
+            self._rotate_orphans()
+        while True:
+            try:
+                batch = [records.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                if stopping.is_set():
+                    return
+                continue
+            # 첫 레코드 이후 flush_interval 동안 batch_size개까지 모아서 한 번에 기록
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(records.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None  # close()가 넣은 종료 표시
+            try:
+                self._write_batch([item for item in batch if item is not None])
+            except Exception as e:
+                # 기록에 실패해도 스레드는 계속 (멈추면 큐가 차서 이후 레코드를 모두 버림)
+                log("log_utils.py", f"로그 기록 실패: {e}")
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        lines = {}
+        for filepath, data in batch:
+            lines.setdefault(filepath, []).append(
+                json.dumps(data, ensure_ascii=False, default=str) + "\n"
+            )
+        with self.write_lock:
+            for filepath, file_lines in lines.items():
+                try:
+                    self._rotate_if_needed(filepath)
+                    with open(filepath, "a", encoding="utf-8") as f:
+                        f.writelines(file_lines)
+                except OSError as e:
+                    log("log_utils.py", f"로그 기록 실패 {filepath}: {e}")
+
+    def _rotate_if_needed(self, filepath):
+        try:
+            size = os.path.getsize(filepath)
+        except FileNotFoundError:
+            self.opened_at[filepath] = time.time()
+            return
+        # 시간 기준은 이 프로세스가 파일을 처음 쓴 시점부터
+        opened_at = self.opened_at.setdefault(filepath, time.time())
+        if size < self.max_bytes and time.time() - opened_at < self.rotate_interval:
+            return
+
+        self.opened_at[filepath] = time.time()
+        stem = filepath[: -len(".jsonl")]
+        if self.per_process:
+            stem = stem.rsplit(".", 1)[0]  # {종류}.{pid} → {종류}
+        self._rotate(filepath, stem)
+
+    def _rotate(self, filepath, stem):
+        # 교체 파일명: {종류}.{시각}[.{pid}].jsonl.gz (이름순 = 시각순)
+        suffix = filepath[len(stem) :]
+        rotated = f"{stem}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{suffix}"
+        try:
+            os.replace(filepath, rotated)
+        except FileNotFoundError:
+            # 다른 프로세스가 먼저 교체함
+            return
+        if self.compress:
+            with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+
+        # 오래된 교체 파일 삭제 (파일명의 시각 순)
+        backups = sorted(glob.glob(f"{glob.escape(stem)}.*-*.jsonl*"))
+        for old in backups[: max(0, len(backups) - self.backup_count)]:
+            try:
+                os.remove(old)
+            except FileNotFoundError:
+                pass  # 다른 프로세스가 먼저 삭제함
+
+    def close(self, timeout: float = 10.0):
+        """
+        남은 레코드를 모두 기록하고 쓰기 스레드를 종료합니다.
+        쓰기 스레드를 최대 timeout초 기다린 뒤, 큐에 남은 레코드는 호출한 스레드에서 직접 기록합니다.
+        """
+        if self.pid != os.getpid() or self.thread is None:
+            return
+        self.stopping.set()
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass  # 큐가 비면 stopping을 보고 종료
+        self.thread.join(timeout)
+
+        remaining = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                remaining.append(item)
+        if remaining:
+            try:
+                self._write_batch(remaining)
+            except Exception as e:
+                log("log_utils.py", f"로그 기록 실패: {e}")
+        self.pid = None
 
     def log_crawled_news(self, title: str, url: str, body: str):
         """1. 크롤링한 뉴스 기사 로깅"""
@@ -53,4 +269,13 @@ class NewsLogger:
         self._append_jsonl(self.comment_log_path, log_data)
 
 
-logger = NewsLogger()
+logger = NewsLogger(
+    max_queue=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+    batch_size=int(os.getenv("LOG_BATCH_SIZE", "256")),
+    flush_interval=float(os.getenv("LOG_FLUSH_INTERVAL", "1.0")),
+    max_bytes=int(os.getenv("LOG_MAX_BYTES", str(50 * 1024 * 1024))),
+    rotate_interval=float(os.getenv("LOG_ROTATE_INTERVAL", str(24 * 3600))),
+    backup_count=int(os.getenv("LOG_BACKUP_COUNT", "7")),
+    compress=os.getenv("LOG_COMPRESS", "1") == "1",
+    per_process=os.getenv("LOG_PER_PROCESS", "0") == "1",
+)
@@ -0,0 +1,267 @@
+import os
+import sys
+import json
+import time
+import uuid
+import threading
+import contextvars
+from contextlib import contextmanager
+
+# 초 단위 지연시간 히스토그램 기본 구간
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+_request_spans = contextvars.ContextVar("request_spans", default=None)
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name: str, help: str, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.values = {}  # 라벨 값 tuple -> 값
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple, extra: dict | None = None) -> str:
+        pairs = list(zip(self.labelnames, key)) + list((extra or {}).items())
+        if not pairs:
+            return ""
+        escaped = (
+            (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for k, v in pairs
+        )
+        return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self.lock:
+            items = sorted(self.values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{self._labels(key)} {value}")
+        return lines
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames=()):
+        super().__init__(name, help, labelnames)
+        self.function = None
+
+    def set(self, value: float, **labels):
+        with self.lock:
+            self.values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function):
+        # 수집 시점에 function()을 호출해 값을 읽음 (라벨 없는 게이지)
+        self.function = function
+
+    def render(self) -> list[str]:
+        if self.function is not None:
+            self.set(self.function())
+        return super().render()
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self.lock:
+            # [구간별 누적 개수, 합계, 전체 개수]
+            state = self.values.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self.lock:
+            items = sorted(
+                (key, list(counts), total, count)
+                for key, (counts, total, count) in self.values.items()
+            )
+        for key, counts, total, count in items:
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(
+                    f"{self.name}_bucket{self._labels(key, {'le': bound})} {bucket_count}"
+                )
+            lines.append(
+                f"{self.name}_bucket{self._labels(key, {'le': '+Inf'})} {count}"
+            )
+            lines.append(f"{self.name}_sum{self._labels(key)} {total}")
+            lines.append(f"{self.name}_count{self._labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 지표 저장소, render()는 Prometheus 텍스트 형식
+    (gunicorn 워커마다 따로 집계됨)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+
+    def _register(self, cls, name, *args, **kwargs):
+        # 같은 이름으로 다시 등록하면 기존 지표를 반환
+        with self.lock:
+            if name not in self.metrics:
+                self.metrics[name] = cls(name, *args, **kwargs)
+            return self.metrics[name]
+
+    def counter(self, name: str, help: str, labelnames=()) -> Counter:
+        return self._register(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames=()) -> Gauge:
+        return self._register(Gauge, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram, name, help, labelnames, buckets)
+
+    def render(self) -> str:
+        with self.lock:
+            metrics = list(self.metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+metrics = MetricsRegistry()
+
+stage_seconds = metrics.histogram(
+    "factcheck_stage_seconds", "Duration of pipeline stages", ["stage"]
+)
+external_api_errors = metrics.counter(
+    "external_api_errors_total", "Failed calls to external APIs", ["api"]
+)
+
+
+class Span:
+    __slots__ = ("name", "attrs", "start", "duration")
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+        self.start = time.time()
+        self.duration = 0.0
+
+
+class Tracer:
+    """
+    span(name) 구간의 소요 시간을 factcheck_stage_seconds 히스토그램에 기록하고
+    path가 있으면 span을 JSONL로 내보냅니다. (TRACE_FILE 환경변수)
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        span = Span(name, attrs)
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - start
+            stage_seconds.observe(span.duration, stage=name)
+            spans = _request_spans.get()
+            if spans is not None:
+                spans.append(span)
+            if self.path:
+                self._export(span)
+
+    def _export(self, span: Span):
+        record = {
+            "request_id": _request_id.get(),
+            "name": span.name,
+            "start": span.start,
+            "duration_ms": round(span.duration * 1000, 3),
+            "thread": threading.current_thread().name,
+            **({"attrs": span.attrs} if span.attrs else {}),
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self.lock:
+            if self.file is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self.file = open(self.path, "a", encoding="utf-8", buffering=1)
+            self.file.write(line)
+
+
+tracer = Tracer(os.getenv("TRACE_FILE"))
+span = tracer.span
+
+
+def start_request(request_id: str | None = None) -> str:
+    """
+    현재 컨텍스트(요청)에 request id와 span 목록을 설정합니다.
+    """
+    request_id = request_id or uuid.uuid4().hex[:12]
+    _request_id.set(request_id)
+    _request_spans.set([])
+    return request_id
+
+
+def end_request():
+    _request_id.set(None)
+    _request_spans.set(None)
+
+
+def current_request_id() -> str | None:
+    return _request_id.get()
+
+
+def request_spans() -> list[Span]:
+    return list(_request_spans.get() or [])
+
+
+def log(source: str, *args):
+    """
+    print를 대신하는 로그 함수, 요청 안에서 호출되면 request id를 붙입니다.
+
+        [collector.py][a1b2c3d4e5f6]: ...
+    """
+    request_id = _request_id.get()
+    prefix = f"[{source}][{request_id}]:" if request_id else f"[{source}]:"
+    # 여러 스레드의 로그가 섞이지 않도록 한 줄을 한 번에 기록
+    sys.stdout.write(" ".join([prefix, *map(str, args)]) + "\n")
+    sys.stdout.flush()
@@ -0,0 +1 @@
+from app import app  # noqa: F401  (모델 워밍업은 post_fork 또는 첫 요청에서 시작)